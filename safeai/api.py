@@ -72,6 +72,7 @@ class SafeAI:
         approval_manager: ApprovalManager | None = None,
         plugin_manager: PluginManager | None = None,
         memory_auto_purge_expired: bool = True,
+        output_skip_scan_when_allowed: bool = False,
     ) -> None:
         """Initialize the SafeAI runtime orchestrator.
 
@@ -92,6 +93,8 @@ class SafeAI:
             plugin_manager: Optional plugin manager for third-party extensions.
             memory_auto_purge_expired: If True, automatically purge expired memory
                 entries on every read/write operation.
+            output_skip_scan_when_allowed: If True, ``guard_output`` skips the detector
+                scan for agents the output policy allows regardless of data tags.
         """
         self.policy_engine = policy_engine
         self.classifier = classifier
@@ -112,7 +115,12 @@ class SafeAI:
             policy_engine=policy_engine,
             audit_logger=audit_logger,
         )
-        self._output = OutputGuard(classifier=classifier, policy_engine=policy_engine, audit_logger=audit_logger)
+        self._output = OutputGuard(
+            classifier=classifier,
+            policy_engine=policy_engine,
+            audit_logger=audit_logger,
+            skip_scan_when_allowed=output_skip_scan_when_allowed,
+        )
         self._action = ActionInterceptor(
             policy_engine=policy_engine,
             audit_logger=audit_logger,
@@ -218,7 +226,7 @@ class SafeAI:
             })
 
         policy_engine = PolicyEngine(normalize_rules(rules))
-        classifier = Classifier(patterns=list(all_detectors()))
+        classifier = Classifier.default()
         _audit_path = audit_path or str(Path(tempfile.gettempdir()) / "safeai-audit.jsonl")
         audit = AuditLogger(_audit_path)
         return cls(
@@ -267,7 +275,11 @@ class SafeAI:
             else PluginManager()
         )
         classifier = Classifier(patterns=[*all_detectors(), *plugin_manager.detector_patterns()])
-        audit = AuditLogger(_resolve_optional_path(config_path, cfg.audit.file_path))
+        audit = AuditLogger(
+            _resolve_optional_path(config_path, cfg.audit.file_path),
+            background_writes=cfg.audit.background_writes,
+            query_cache_mb=cfg.audit.query_cache_mb,
+        )
         capabilities = CapabilityTokenManager()
         approvals = ApprovalManager(
             file_path=_resolve_optional_path(config_path, cfg.approvals.file_path),
@@ -285,6 +297,7 @@ class SafeAI:
             approval_manager=approvals,
             plugin_manager=plugin_manager,
             memory_auto_purge_expired=cfg.memory_runtime.auto_purge_expired,
+            output_skip_scan_when_allowed=cfg.output_runtime.skip_scan_when_allowed,
         )
 
         # Auto-register secret backends from config
@@ -1413,7 +1426,7 @@ class SafeAI:
                 send_to_agent(result["filtered_message"])
         """
         body = str(message)
-        detected_tags = {item.tag for item in self.classifier.classify_text(body)}
+        detected_tags = self.classifier.classify_tags(body)
         explicit_tags = {str(tag).strip().lower() for tag in (data_tags or []) if str(tag).strip()}
         tags = sorted(explicit_tags.union(detected_tags))
         decision = self.policy_engine.evaluate(
@@ -0,0 +1,36 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2026 SafeAI Contributors
+"""Shared click context object for commands that build a SafeAI instance."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from safeai.api import SafeAI
+
+
+class SafeAICache:
+    """Reuse SafeAI instances per config file until the file changes on disk.
+
+    Attach it with ``ctx.ensure_object(SafeAICache)``; callers that drive the
+    CLI in-process can pass a long-lived instance as ``obj`` to share it.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[int, SafeAI]] = {}
+
+    def get(self, config_path: str, loader: Callable[[str], SafeAI]) -> SafeAI:
+        real_path = os.path.realpath(os.path.expanduser(config_path))
+        try:
+            mtime_ns = os.stat(real_path).st_mtime_ns
+        except OSError:
+            # Let the loader surface its own missing-config error.
+            return loader(config_path)
+        cached = self._entries.get(real_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        sdk = loader(config_path)
+        self._entries[real_path] = (mtime_ns, sdk)
+        return sdk
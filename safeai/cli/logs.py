@@ -4,13 +4,20 @@
 
 from __future__ import annotations
 
+import functools
 import json
+from collections.abc import Iterable
 from pathlib import Path
 
 import click
 
 from safeai.core.audit import AuditLogger
 
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=True)
+_PRETTY_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=True, sort_keys=True)
+_METADATA_ENCODER = json.JSONEncoder(ensure_ascii=True, sort_keys=True)
+_WRITE_BATCH_CHARS = 1 << 20
+
 
 @click.command(name="logs")
 @click.option("--file", "log_file", default="logs/audit.log", show_default=True, help="Audit log file path.")
@@ -66,7 +73,7 @@ def logs_command(
 ) -> None:
     """Query recent audit log events with optional filters."""
     path = Path(log_file).expanduser().resolve()
-    logger = AuditLogger(str(path))
+    logger = _logger_for(str(path))
     target_event_id = detail_event_id or event_id
     try:
         events = logger.query(
@@ -103,11 +110,8 @@ def logs_command(
         return
 
     if json_output:
-        for item in events:
-            if pretty_json:
-                click.echo(json.dumps(item, indent=2, ensure_ascii=True, sort_keys=True))
-            else:
-                click.echo(json.dumps(item, separators=(",", ":"), ensure_ascii=True))
+        encoder = _PRETTY_ENCODER if pretty_json else _COMPACT_ENCODER
+        _echo_batched(encoder.encode(item) for item in events)
         return
 
     for event in events:
@@ -135,12 +139,35 @@ def logs_command(
         )
 
 
+@functools.lru_cache(maxsize=4)
+def _logger_for(path: str) -> AuditLogger:
+    """Return a reusable AuditLogger for an already-resolved log path.
+
+    Keyed by path alone: the logger keeps no file contents between queries (each
+    query re-reads the log), so a changed mtime never leaves it serving stale events.
+    """
+    return AuditLogger(path)
+
+
+def _echo_batched(lines: Iterable[str]) -> None:
+    """Echo *lines* newline-separated, flushing roughly once per MiB of text."""
+    batch: list[str] = []
+    size = 0
+    for line in lines:
+        batch.append(line)
+        size += len(line) + 1
+        if size >= _WRITE_BATCH_CHARS:
+            click.echo("\n".join(batch))
+            batch.clear()
+            size = 0
+    if batch:
+        click.echo("\n".join(batch))
+
+
 def _render_detail(event: dict[str, object], *, json_output: bool, pretty_json: bool) -> None:
     if json_output:
-        if pretty_json:
-            click.echo(json.dumps(event, indent=2, ensure_ascii=True, sort_keys=True))
-        else:
-            click.echo(json.dumps(event, separators=(",", ":"), ensure_ascii=True))
+        encoder = _PRETTY_ENCODER if pretty_json else _COMPACT_ENCODER
+        click.echo(encoder.encode(event))
         return
 
     metadata = event.get("metadata") or {}
@@ -161,4 +188,4 @@ def _render_detail(event: dict[str, object], *, json_output: bool, pretty_json:
     click.echo(f"tags: {','.join(tags) or '-'}")
     click.echo(f"reason: {event.get('reason', '-')}")
     click.echo(f"context_hash: {event.get('context_hash', '-')}")
-    click.echo(f"metadata: {json.dumps(metadata, sort_keys=True, ensure_ascii=True)}")
+    click.echo(f"metadata: {_METADATA_ENCODER.encode(metadata)}")
@@ -6,6 +6,8 @@ from __future__ import annotations
 
 import asyncio
 import sys
+from collections.abc import Coroutine
+from typing import Any
 
 import click
 
@@ -25,6 +27,19 @@ def mcp_command(config: str) -> None:
         sys.exit(1)
 
     try:
-        asyncio.run(run_stdio_server(config))
+        _run(run_stdio_server(config))
     except KeyboardInterrupt:
         pass
+
+
+def _run(coro: Coroutine[Any, Any, None]) -> None:
+    """Run *coro* on uvloop when available, falling back to asyncio."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            uvloop.run(coro)
+            return
+    asyncio.run(coro)
@@ -4,9 +4,13 @@
 
 from __future__ import annotations
 
+import heapq
+from array import array
+
 import click
 
 from safeai.api import SafeAI
+from safeai.cli.context import SafeAICache
 
 
 @click.group(name="observe")
@@ -17,44 +21,59 @@ def observe_group() -> None:
 @observe_group.command(name="agents")
 @click.option("--config", "config_path", default="safeai.yaml", show_default=True, help="Config path.")
 @click.option("--last", default="24h", show_default=True, help="Time window (e.g. 1h, 24h, 7d).")
-def observe_agents_command(config_path: str, last: str) -> None:
+@click.option(
+    "--top", default=50, type=click.IntRange(min=0), show_default=True, help="Max agents to show (0 for all)."
+)
+@click.pass_context
+def observe_agents_command(ctx: click.Context, config_path: str, last: str, top: int) -> None:
     """List agents with event counts."""
-    sdk = SafeAI.from_config(config_path)
+    sdk = ctx.ensure_object(SafeAICache).get(config_path, SafeAI.from_config)
     events = sdk.query_audit(last=last, limit=50000, newest_first=True)
-    agents: dict[str, dict[str, int | str | None]] = {}
+    index_of: dict[str, int] = {}
+    agent_ids: list[str] = []
+    counts = array("q")
+    last_seen: list[object] = []
     for event in events:
         agent_id = str(event.get("agent_id", "unknown"))
-        if agent_id not in agents:
-            agents[agent_id] = {"event_count": 0, "last_seen": None}
-        agents[agent_id]["event_count"] = int(agents[agent_id]["event_count"] or 0) + 1
-        if agents[agent_id]["last_seen"] is None:
-            agents[agent_id]["last_seen"] = event.get("timestamp")
-    if not agents:
+        idx = index_of.get(agent_id)
+        if idx is None:
+            idx = index_of[agent_id] = len(agent_ids)
+            agent_ids.append(agent_id)
+            counts.append(0)
+            last_seen.append(None)
+        counts[idx] += 1
+        if last_seen[idx] is None:
+            last_seen[idx] = event.get("timestamp")
+    if not agent_ids:
         click.echo(f"No agent activity found in last {last}.")
         return
-    click.echo(f"{'agent_id':<30} {'events':>8}  last_seen")
-    click.echo("-" * 80)
-    for agent_id, info in sorted(agents.items(), key=lambda x: int(x[1].get("event_count", 0) or 0), reverse=True):
-        click.echo(f"{agent_id:<30} {info['event_count']:>8}  {info.get('last_seen', '-')}")
+    if top > 0:
+        ranked = heapq.nlargest(top, range(len(agent_ids)), key=counts.__getitem__)
+    else:
+        ranked = sorted(range(len(agent_ids)), key=counts.__getitem__, reverse=True)
+    lines = [f"{'agent_id':<30} {'events':>8}  last_seen", "-" * 80]
+    lines.extend(f"{agent_ids[idx]:<30} {counts[idx]:>8}  {last_seen[idx]}" for idx in ranked)
+    click.echo("\n".join(lines))
 
 
 @observe_group.command(name="sessions")
 @click.option("--config", "config_path", default="safeai.yaml", show_default=True, help="Config path.")
 @click.option("--session", "session_id", required=True, help="Session ID to trace.")
 @click.option("--limit", default=100, show_default=True, help="Max events to show.")
-def observe_sessions_command(config_path: str, session_id: str, limit: int) -> None:
+@click.pass_context
+def observe_sessions_command(ctx: click.Context, config_path: str, session_id: str, limit: int) -> None:
     """Show event trace for a session."""
-    sdk = SafeAI.from_config(config_path)
+    sdk = ctx.ensure_object(SafeAICache).get(config_path, SafeAI.from_config)
     events = sdk.query_audit(session_id=session_id, limit=limit, newest_first=False)
     if not events:
         click.echo(f"No events found for session '{session_id}'.")
         return
-    click.echo(f"Session: {session_id} ({len(events)} events)")
-    click.echo("-" * 80)
+    lines = [f"Session: {session_id} ({len(events)} events)", "-" * 80]
     for event in events:
         ts = event.get("timestamp", "-")
         boundary = event.get("boundary", "-")
         action = event.get("action", "-")
         agent = event.get("agent_id", "-")
         reason = event.get("reason", "-")
-        click.echo(f"  {ts}  {boundary:<10} {action:<8} agent={agent}  {reason}")
+        lines.append(f"  {ts}  {boundary:<10} {action:<8} agent={agent}  {reason}")
+    click.echo("\n".join(lines))
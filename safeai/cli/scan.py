@@ -7,6 +7,7 @@ from __future__ import annotations
 import click
 
 from safeai.api import SafeAI
+from safeai.cli.context import SafeAICache
 
 
 @click.command(name="scan")
@@ -18,9 +19,10 @@ from safeai.api import SafeAI
     default="input",
     show_default=True,
 )
-def scan_command(config_path: str, input_text: str, boundary: str) -> None:
+@click.pass_context
+def scan_command(ctx: click.Context, config_path: str, input_text: str, boundary: str) -> None:
     """Scan sample text through input or output boundary policy."""
-    safeai = SafeAI.from_config(config_path)
+    safeai = ctx.ensure_object(SafeAICache).get(config_path, SafeAI.from_config)
 
     if boundary == "input":
         scan_result = safeai.scan_input(input_text)
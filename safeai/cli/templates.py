@@ -10,6 +10,12 @@ import click
 import yaml  # type: ignore[import-untyped]
 
 from safeai.api import SafeAI
+from safeai.cli.context import SafeAICache
+
+try:
+    from yaml import CSafeDumper as _YamlDumper  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - libyaml is optional.
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[import-untyped,assignment]
 
 
 @click.group(name="templates")
@@ -19,10 +25,11 @@ def templates_group() -> None:
 
 @templates_group.command(name="list")
 @click.option("--config", "config_path", default="safeai.yaml", show_default=True, help="Config path.")
-def templates_list_command(config_path: str) -> None:
+@click.pass_context
+def templates_list_command(ctx: click.Context, config_path: str) -> None:
     """List available policy templates."""
     try:
-        sdk = SafeAI.from_config(config_path)
+        sdk = ctx.ensure_object(SafeAICache).get(config_path, SafeAI.from_config)
     except Exception as exc:  # pragma: no cover - surfaced via click CLI.
         raise click.ClickException(str(exc)) from exc
     rows = sdk.list_policy_templates()
@@ -41,10 +48,11 @@ def templates_list_command(config_path: str) -> None:
 @click.option("--config", "config_path", default="safeai.yaml", show_default=True, help="Config path.")
 @click.option("--name", "template_name", required=True, help="Template name.")
 @click.option("--format", "output_format", type=click.Choice(["yaml", "json"]), default="yaml", show_default=True)
-def templates_show_command(config_path: str, template_name: str, output_format: str) -> None:
+@click.pass_context
+def templates_show_command(ctx: click.Context, config_path: str, template_name: str, output_format: str) -> None:
     """Render one policy template."""
     try:
-        sdk = SafeAI.from_config(config_path)
+        sdk = ctx.ensure_object(SafeAICache).get(config_path, SafeAI.from_config)
     except Exception as exc:  # pragma: no cover - surfaced via click CLI.
         raise click.ClickException(str(exc)) from exc
     try:
@@ -54,7 +62,7 @@ def templates_show_command(config_path: str, template_name: str, output_format:
     if output_format == "json":
         click.echo(json.dumps(payload, indent=2, sort_keys=False, ensure_ascii=True))
         return
-    click.echo(yaml.safe_dump(payload, sort_keys=False))
+    click.echo(yaml.dump(payload, Dumper=_YamlDumper, sort_keys=False))
 
 
 @templates_group.command(name="search")
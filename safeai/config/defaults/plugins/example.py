@@ -7,8 +7,12 @@ This file is copied by `safeai init` to `plugins/example.py`.
 
 from __future__ import annotations
 
+import re
+
 from safeai.middleware.base import BaseMiddleware
 
+_TICKET_RE = re.compile(r"\bTKT-[0-9]{4,10}\b", re.IGNORECASE)
+
 
 class ExamplePluginAdapter(BaseMiddleware):
     """Minimal plugin adapter scaffold."""
@@ -17,10 +21,13 @@ class ExamplePluginAdapter(BaseMiddleware):
         return {"name": "ExamplePluginAdapter"}
 
 
-def safeai_detectors() -> list[tuple[str, str, str]]:
-    """Return additional (name, tag, regex) detector tuples."""
+def safeai_detectors() -> list[tuple[str, str, re.Pattern[str]]]:
+    """Return additional (name, tag, regex) detector tuples.
+
+    The regex may be a string or a pattern compiled once at import time.
+    """
     return [
-        ("ticket_id", "internal.ticket", r"\bTKT-[0-9]{4,10}\b"),
+        ("ticket_id", "internal.ticket", _TICKET_RE),
     ]
 
 
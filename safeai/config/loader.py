@@ -4,17 +4,58 @@
 
 from __future__ import annotations
 
+import fnmatch
+import hashlib
 import json
+import os
+import re
+import stat
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from functools import lru_cache
-from glob import glob
+from importlib import resources
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable, Iterator, Protocol
 
 import yaml  # type: ignore[import-untyped]
 from jsonschema import Draft202012Validator
 
 from safeai.config.models import SafeAIConfig
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - libyaml is optional.
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[import-untyped,assignment]
+
+try:
+    from orjson import loads as _json_loads  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - orjson is optional.
+    _json_loads = json.loads
+
+
+_MAGIC = re.compile(r"[*?[]")
+_MAX_LOAD_WORKERS = 8
+_SCHEMA_SUFFIX = ".schema.json"
+_PROJECT_SCHEMA_DIR = Path(__file__).resolve().parents[2] / "schemas"
+_PACKAGE_SCHEMA_DIR = Path(__file__).resolve().parents[1] / "schemas"
+
+# (error count, first (location, message) in location/message order)
+SchemaErrors = tuple[int, tuple[str, str] | None]
+
+
+class SchemaValidator(Protocol):
+    def iter_errors(self, instance: Any) -> Iterable[Any]: ...
+
+
+_VALIDATION_CACHE_SIZE = 512
+_VALIDATION_CACHE: dict[tuple[str, str, bytes], SchemaErrors] = {}
+_RESOLVE_CACHE_SIZE = 64
+_RACY_MTIME_NS = 2_000_000_000
+_RESOLVE_CACHE: dict[tuple[Path, tuple[str, ...]], tuple[dict[str, int], tuple[Path, ...]]] = {}
+_CONFIG_DATA_CACHE: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 
 class PolicySchemaValidationError(ValueError):
     """Raised when a policy file does not match the SafeAI policy schema."""
@@ -32,9 +73,21 @@ class IdentitySchemaValidationError(ValueError):
     """Raised when an agent identity file does not match SafeAI schema rules."""
 
 
+class _InterningLoader(_YamlLoader):
+    """Safe loader that interns mapping keys.
+
+    Keys such as ``name``/``priority``/``action`` repeat in every rule, so
+    interning them shares one string object across all loaded documents.
+    """
+
+    def construct_mapping(self, node: yaml.MappingNode, deep: bool = False) -> dict[Any, Any]:
+        mapping = super().construct_mapping(node, deep=deep)
+        return {sys.intern(key) if type(key) is str else key: value for key, value in mapping.items()}
+
+
 def load_yaml_file(path: Path) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as fh:
-        loaded = yaml.safe_load(fh) or {}
+    with path.open("rb") as fh:
+        loaded = yaml.load(fh, Loader=_InterningLoader) or {}
     if not isinstance(loaded, dict):
         actual_type = type(loaded).__name__
         raise ValueError(
@@ -46,30 +99,257 @@ def load_yaml_file(path: Path) -> dict[str, Any]:
     return loaded
 
 
+def load_yaml_header(path: Path, keys: Iterable[str]) -> dict[str, Any]:
+    """Read top-level scalar values for *keys*, stopping once all of them are seen.
+
+    Uses the YAML event stream so large files are not parsed past the header.
+    Keys that are missing or hold collections are left out of the result.
+    """
+    wanted = set(keys)
+    found: dict[str, Any] = {}
+    if not wanted:
+        return found
+    depth = 0
+    node_index = 0
+    current_key: str | None = None
+    with path.open("rb") as fh:
+        for event in yaml.parse(fh, Loader=_YamlLoader):
+            if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                if depth == 0 and not isinstance(event, yaml.MappingStartEvent):
+                    break
+                if depth == 1:
+                    if node_index % 2 == 0:
+                        current_key = None
+                    node_index += 1
+                depth += 1
+            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                depth -= 1
+                if depth == 0:
+                    break
+            elif depth == 1 and isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent)):
+                is_key = node_index % 2 == 0
+                node_index += 1
+                if not isinstance(event, yaml.ScalarEvent):
+                    current_key = None
+                elif is_key:
+                    current_key = event.value
+                elif current_key in wanted:
+                    found[current_key] = _scalar_value(event)
+                    if len(found) == len(wanted):
+                        break
+    return found
+
+
+def _scalar_value(event: yaml.ScalarEvent) -> Any:
+    if event.style or not event.implicit[0]:
+        return event.value
+    return yaml.load(event.value, Loader=_YamlLoader)
+
+
 def load_config(path: str | Path) -> SafeAIConfig:
+    """Load and validate a SafeAI config file.
+
+    Parsing YAML dominates the cost, so the parsed mapping is reused until the
+    file's mtime or size changes. Validation still runs on every call and
+    always returns a fresh model.
+    """
     path_obj = Path(path).expanduser().resolve()
-    data = load_yaml_file(path_obj)
+    try:
+        info = path_obj.stat()
+    except OSError:
+        return SafeAIConfig.model_validate(load_yaml_file(path_obj))
+    stamp = (info.st_mtime_ns, info.st_size)
+    cached = _CONFIG_DATA_CACHE.get(path_obj)
+    if cached is not None and cached[0] == stamp:
+        data = cached[1]
+    else:
+        data = load_yaml_file(path_obj)
+        _CONFIG_DATA_CACHE[path_obj] = (stamp, data)
     return SafeAIConfig.model_validate(data)
 
 
 def resolve_files(config_path: str | Path, patterns: list[str]) -> list[Path]:
+    """Resolve *patterns* relative to the config file's directory.
+
+    Results are memoized per (base, patterns) and reused while the mtime of
+    every directory consulted during the walk is unchanged.
+    """
+    if not patterns:
+        return []
     base = Path(config_path).expanduser().resolve().parent
+    key = (base, tuple(patterns))
+    cached = _RESOLVE_CACHE.get(key)
+    if cached is not None and all(_mtime_ns(path) == stamp for path, stamp in cached[0].items()):
+        return list(cached[1])
+
+    started_ns = time.time_ns()
+    walker = _DirectoryWalker()
+    files = _resolve_patterns(base, key[1], walker)
+    _RESOLVE_CACHE.pop(key, None)
+    # A directory touched within the racy window could change again without its mtime moving.
+    if all(stamp < started_ns - _RACY_MTIME_NS for stamp in walker.stamps.values()):
+        if len(_RESOLVE_CACHE) >= _RESOLVE_CACHE_SIZE:
+            _RESOLVE_CACHE.pop(next(iter(_RESOLVE_CACHE)), None)
+        _RESOLVE_CACHE[key] = (walker.stamps, tuple(files))
+    return files
+
+
+def _resolve_patterns(base: Path, patterns: tuple[str, ...], walker: _DirectoryWalker) -> list[Path]:
     files: list[Path] = []
     seen: set[Path] = set()
-
     for pattern in patterns:
         raw = Path(pattern).expanduser()
         full_pattern = str(raw if raw.is_absolute() else base / pattern)
-        for match in sorted(glob(full_pattern, recursive=True)):
-            file_path = Path(match).resolve()
-            if not file_path.is_file() or file_path in seen:
+        for match in sorted(_glob(full_pattern, walker)):
+            file_path = _resolve_match(match, walker)
+            if file_path is None or file_path in seen:
                 continue
             seen.add(file_path)
             files.append(file_path)
-
     return files
 
 
+def _mtime_ns(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+class _DirectoryWalker:
+    """Per-call ``scandir`` cache that records the mtime of every directory it consults.
+
+    Mtimes are taken before a directory is read, so a change racing the walk
+    still invalidates the cached result on the next call.
+    """
+
+    def __init__(self) -> None:
+        self.stamps: dict[str, int] = {}
+        self._listings: dict[str, list[tuple[str, bool]]] = {}
+        self._real_dirs: dict[str, str] = {}
+
+    def stamp(self, directory: str) -> None:
+        if directory not in self.stamps:
+            self.stamps[directory] = _mtime_ns(directory)
+
+    def listing(self, directory: str) -> list[tuple[str, bool]]:
+        cached = self._listings.get(directory)
+        if cached is None:
+            self.stamp(directory)
+            cached = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        cached.append((entry.name, is_dir))
+            except OSError:
+                pass
+            self._listings[directory] = cached
+        return cached
+
+    def lexists(self, path: str) -> bool:
+        self.stamp(os.path.dirname(path))
+        return os.path.lexists(path)
+
+    def isdir(self, path: str) -> bool:
+        self.stamp(os.path.dirname(path))
+        return os.path.isdir(path)
+
+    def realpath(self, directory: str) -> str:
+        real_dir = self._real_dirs.get(directory)
+        if real_dir is None:
+            real_dir = self._real_dirs[directory] = os.path.realpath(directory)
+        return real_dir
+
+
+def _resolve_match(match: str, walker: _DirectoryWalker) -> Path | None:
+    """Return the resolved path of *match* if it is a regular file.
+
+    Equivalent to ``Path(match).resolve()`` plus ``is_file()``, but costs one
+    ``lstat`` per file: parent directories are resolved once and shared, and
+    only symlinked files fall back to a full ``resolve()``.
+    """
+    try:
+        mode = os.lstat(match).st_mode
+    except OSError:
+        return None
+    if stat.S_ISLNK(mode):
+        file_path = Path(match).resolve()
+        walker.stamp(str(file_path.parent))
+        return file_path if file_path.is_file() else None
+    if not stat.S_ISREG(mode):
+        return None
+    directory, name = os.path.split(match)
+    return Path(walker.realpath(directory), name)
+
+
+def _glob(pattern: str, walker: _DirectoryWalker) -> list[str]:
+    """Recursive ``glob`` equivalent that shares directory listings across patterns.
+
+    Mirrors ``glob.glob(pattern, recursive=True)``: ``**`` spans zero or more
+    directories and wildcards skip dot-files unless the segment starts with a dot.
+    """
+    if not _MAGIC.search(pattern):
+        return [pattern] if walker.lexists(pattern) else []
+    parts = pattern.replace("/", os.sep).split(os.sep)
+    first_magic = next(idx for idx, part in enumerate(parts) if _MAGIC.search(part))
+    root = os.sep.join(parts[:first_magic]) or os.sep
+    segments: list[str] = []
+    for part in parts[first_magic:]:
+        if part and not (part == "**" and segments and segments[-1] == "**"):
+            segments.append(part)
+    return list(_walk_segments(root, tuple(segments), 0, walker))
+
+
+def _walk_segments(
+    directory: str,
+    segments: tuple[str, ...],
+    index: int,
+    walker: _DirectoryWalker,
+) -> Iterator[str]:
+    if index == len(segments):
+        yield directory
+        return
+    segment = segments[index]
+    last = index == len(segments) - 1
+    if segment == "**":
+        yield from _walk_segments(directory, segments, index + 1, walker)
+        for name, is_dir in walker.listing(directory):
+            if name.startswith("."):
+                continue
+            if is_dir:
+                yield from _walk_segments(os.path.join(directory, name), segments, index, walker)
+            elif last:
+                yield os.path.join(directory, name)
+        return
+    if not _MAGIC.search(segment):
+        candidate = os.path.join(directory, segment)
+        if last:
+            if walker.lexists(candidate):
+                yield candidate
+        elif walker.isdir(candidate):
+            yield from _walk_segments(candidate, segments, index + 1, walker)
+        return
+    matcher = _segment_matcher(segment)
+    include_hidden = segment.startswith(".")
+    for name, is_dir in walker.listing(directory):
+        if (name.startswith(".") and not include_hidden) or not matcher(name):
+            continue
+        if last:
+            yield os.path.join(directory, name)
+        elif is_dir:
+            yield from _walk_segments(os.path.join(directory, name), segments, index + 1, walker)
+
+
+@lru_cache(maxsize=256)
+def _segment_matcher(segment: str) -> Callable[[str], re.Match[str] | None]:
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    return re.compile(fnmatch.translate(segment), flags).match
+
+
 def resolve_policy_files(config_path: str | Path, patterns: list[str]) -> list[Path]:
     return resolve_files(config_path, patterns)
 
@@ -92,8 +372,7 @@ def load_policy_documents(
     *,
     version: str = "v1alpha1",
 ) -> list[dict[str, Any]]:
-    _, docs = load_policy_bundle(config_path, patterns, version=version)
-    return docs
+    return _load_bundle("policy", config_path, patterns, version=version)[1]
 
 
 def load_memory_documents(
@@ -102,8 +381,7 @@ def load_memory_documents(
     *,
     version: str = "v1alpha1",
 ) -> list[dict[str, Any]]:
-    _, docs = load_memory_bundle(config_path, patterns, version=version)
-    return docs
+    return _load_bundle("memory", config_path, patterns, version=version)[1]
 
 
 def load_contract_documents(
@@ -112,8 +390,7 @@ def load_contract_documents(
     *,
     version: str = "v1alpha1",
 ) -> list[dict[str, Any]]:
-    _, docs = load_contract_bundle(config_path, patterns, version=version)
-    return docs
+    return _load_bundle("contract", config_path, patterns, version=version)[1]
 
 
 def load_identity_documents(
@@ -122,8 +399,7 @@ def load_identity_documents(
     *,
     version: str = "v1alpha1",
 ) -> list[dict[str, Any]]:
-    _, docs = load_identity_bundle(config_path, patterns, version=version)
-    return docs
+    return _load_bundle("identity", config_path, patterns, version=version)[1]
 
 
 def load_policy_bundle(
@@ -132,15 +408,7 @@ def load_policy_bundle(
     *,
     version: str = "v1alpha1",
 ) -> tuple[list[Path], list[dict[str, Any]]]:
-    files = resolve_policy_files(config_path, patterns)
-    docs: list[dict[str, Any]] = []
-
-    for file_path in files:
-        loaded = load_yaml_file(file_path)
-        validate_policy_document(loaded, file_path, version=version)
-        docs.extend(_extract_policy_documents(loaded))
-
-    return files, docs
+    return _load_bundle("policy", config_path, patterns, version=version)
 
 
 def load_memory_bundle(
@@ -149,15 +417,7 @@ def load_memory_bundle(
     *,
     version: str = "v1alpha1",
 ) -> tuple[list[Path], list[dict[str, Any]]]:
-    files = resolve_memory_schema_files(config_path, patterns)
-    docs: list[dict[str, Any]] = []
-
-    for file_path in files:
-        loaded = load_yaml_file(file_path)
-        validate_memory_document(loaded, file_path, version=version)
-        docs.extend(_extract_memory_documents(loaded))
-
-    return files, docs
+    return _load_bundle("memory", config_path, patterns, version=version)
 
 
 def load_contract_bundle(
@@ -166,15 +426,7 @@ def load_contract_bundle(
     *,
     version: str = "v1alpha1",
 ) -> tuple[list[Path], list[dict[str, Any]]]:
-    files = resolve_contract_files(config_path, patterns)
-    docs: list[dict[str, Any]] = []
-
-    for file_path in files:
-        loaded = load_yaml_file(file_path)
-        validate_contract_document(loaded, file_path, version=version)
-        docs.extend(_extract_contract_documents(loaded))
-
-    return files, docs
+    return _load_bundle("contract", config_path, patterns, version=version)
 
 
 def load_identity_bundle(
@@ -183,80 +435,140 @@ def load_identity_bundle(
     *,
     version: str = "v1alpha1",
 ) -> tuple[list[Path], list[dict[str, Any]]]:
-    files = resolve_identity_files(config_path, patterns)
-    docs: list[dict[str, Any]] = []
-
-    for file_path in files:
-        loaded = load_yaml_file(file_path)
-        validate_identity_document(loaded, file_path, version=version)
-        docs.extend(_extract_identity_documents(loaded))
-
-    return files, docs
+    return _load_bundle("identity", config_path, patterns, version=version)
 
 
 def validate_policy_document(document: dict[str, Any], source: Path, *, version: str = "v1alpha1") -> None:
-    validator = _schema_validator("policy", version)
-    _raise_on_schema_errors(
-        validator=validator,
-        document=document,
-        source=source,
-        error_type=PolicySchemaValidationError,
-        label="Policy schema validation",
-    )
+    _validate_document(_DOCUMENT_KINDS["policy"], document, source, version=version)
 
 
 def validate_memory_document(document: dict[str, Any], source: Path, *, version: str = "v1alpha1") -> None:
-    validator = _schema_validator("memory", version)
-    _raise_on_schema_errors(
-        validator=validator,
-        document=document,
-        source=source,
-        error_type=MemorySchemaValidationError,
-        label="Memory schema validation",
-    )
+    _validate_document(_DOCUMENT_KINDS["memory"], document, source, version=version)
 
 
 def validate_contract_document(document: dict[str, Any], source: Path, *, version: str = "v1alpha1") -> None:
-    validator = _schema_validator("tool-contract", version)
-    _raise_on_schema_errors(
-        validator=validator,
-        document=document,
-        source=source,
-        error_type=ContractSchemaValidationError,
-        label="Tool contract schema validation",
-    )
+    _validate_document(_DOCUMENT_KINDS["contract"], document, source, version=version)
 
 
 def validate_identity_document(document: dict[str, Any], source: Path, *, version: str = "v1alpha1") -> None:
-    validator = _schema_validator("agent-identity", version)
+    _validate_document(_DOCUMENT_KINDS["identity"], document, source, version=version)
+
+
+def _load_bundle(
+    kind: str,
+    config_path: str | Path,
+    patterns: list[str],
+    *,
+    version: str,
+) -> tuple[list[Path], list[dict[str, Any]]]:
+    if not patterns:
+        return [], []
+    spec = _DOCUMENT_KINDS[kind]
+    files = resolve_files(config_path, patterns)
+    docs: list[dict[str, Any]] = []
+
+    for file_path, loaded in zip(files, _load_yaml_files(files), strict=True):
+        _validate_document(spec, loaded, file_path, version=version)
+        docs.extend(spec.extract(loaded))
+
+    return files, docs
+
+
+def _load_yaml_files(files: list[Path]) -> Iterator[dict[str, Any]]:
+    """Yield parsed YAML for *files* in order, reading multiple files concurrently.
+
+    Errors surface in file order, exactly as a sequential loop would raise them.
+    """
+    if len(files) < 2:
+        yield from (load_yaml_file(file_path) for file_path in files)
+        return
+    with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(files))) as executor:
+        yield from executor.map(load_yaml_file, files)
+
+
+def _validate_document(spec: _DocumentKind, document: dict[str, Any], source: Path, *, version: str) -> None:
     _raise_on_schema_errors(
-        validator=validator,
+        schema_name=spec.schema_name,
+        version=version,
         document=document,
         source=source,
-        error_type=IdentitySchemaValidationError,
-        label="Agent identity schema validation",
+        error_type=spec.error_type,
+        label=spec.label,
     )
 
 
 def _raise_on_schema_errors(
     *,
-    validator: Draft202012Validator,
+    schema_name: str,
+    version: str,
     document: dict[str, Any],
     source: Path,
     error_type: type[ValueError],
     label: str,
 ) -> None:
-    errors = sorted(
-        validator.iter_errors(document),
-        key=lambda err: (_format_json_path(err.absolute_path), err.message),
-    )
-    if not errors:
+    count, first = _schema_errors(schema_name, version, document)
+    if first is None:
         return
 
-    first = errors[0]
-    location = _format_json_path(first.absolute_path)
-    extra = f" ({len(errors) - 1} additional error(s))" if len(errors) > 1 else ""
-    raise error_type(f"{label} failed for {source}: {location}: {first.message}{extra}")
+    location, message = first
+    extra = f" ({count - 1} additional error(s))" if count > 1 else ""
+    raise error_type(f"{label} failed for {source}: {location}: {message}{extra}")
+
+
+def _schema_errors(schema_name: str, version: str, document: dict[str, Any]) -> SchemaErrors:
+    """Return the error count and first error, memoized by a digest of canonical JSON.
+
+    Documents that are not plain JSON (e.g. YAML dates, or non-string keys, which
+    JSON would turn into strings) are validated without caching.
+    """
+    try:
+        if _has_non_str_keys(document):
+            raise TypeError("non-string mapping key")
+        canonical = json.dumps(document, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return _collect_schema_errors(_schema_validator(schema_name, version), document)
+
+    digest = hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+    key = (schema_name, version, digest)
+    cached = _VALIDATION_CACHE.get(key)
+    if cached is not None:
+        return cached
+    errors = _collect_schema_errors(_schema_validator(schema_name, version), document)
+    if len(_VALIDATION_CACHE) >= _VALIDATION_CACHE_SIZE:
+        _VALIDATION_CACHE.pop(next(iter(_VALIDATION_CACHE)), None)
+    _VALIDATION_CACHE[key] = errors
+    return errors
+
+
+def _has_non_str_keys(value: Any) -> bool:
+    pending = [value]
+    while pending:
+        item = pending.pop()
+        if isinstance(item, dict):
+            if any(type(key) is not str for key in item):
+                return True
+            pending.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            pending.extend(item)
+    return False
+
+
+def _collect_schema_errors(validator: SchemaValidator, document: dict[str, Any]) -> SchemaErrors:
+    # Only the first error is reported, so track the minimum in one pass instead of sorting.
+    count = 0
+    first: tuple[str, str] | None = None
+    for err in validator.iter_errors(document):
+        count += 1
+        item = (_format_json_path(_error_path(err)), err.message)
+        if first is None or item < first:
+            first = item
+    return count, first
+
+
+def _error_path(error: Any) -> Iterable[Any]:
+    # jsonschema exposes ``absolute_path``; jsonschema-rs exposes ``instance_path``.
+    path = getattr(error, "absolute_path", None)
+    return path if path is not None else getattr(error, "instance_path", ())
 
 
 def _extract_policy_documents(document: dict[str, Any]) -> list[dict[str, Any]]:
@@ -273,74 +585,126 @@ def _extract_policy_documents(document: dict[str, Any]) -> list[dict[str, Any]]:
 
 
 def _extract_memory_documents(document: dict[str, Any]) -> list[dict[str, Any]]:
-    docs: list[dict[str, Any]] = []
-    memory = document.get("memory")
-    if isinstance(memory, dict):
-        docs.append({"version": document.get("version", "v1alpha1"), "memory": memory})
-
-    memories = document.get("memories", [])
-    if isinstance(memories, list) and memories:
-        docs.append({"version": document.get("version", "v1alpha1"), "memories": memories})
-
-    return docs
+    return _extract_versioned_documents(document, "memory", "memories")
 
 
 def _extract_contract_documents(document: dict[str, Any]) -> list[dict[str, Any]]:
-    docs: list[dict[str, Any]] = []
-    contract = document.get("contract")
-    if isinstance(contract, dict):
-        docs.append({"version": document.get("version", "v1alpha1"), "contract": contract})
-
-    contracts = document.get("contracts", [])
-    if isinstance(contracts, list) and contracts:
-        docs.append({"version": document.get("version", "v1alpha1"), "contracts": contracts})
-
-    return docs
+    return _extract_versioned_documents(document, "contract", "contracts")
 
 
 def _extract_identity_documents(document: dict[str, Any]) -> list[dict[str, Any]]:
+    return _extract_versioned_documents(document, "agent", "agents")
+
+
+def _extract_versioned_documents(document: dict[str, Any], single_key: str, list_key: str) -> list[dict[str, Any]]:
+    # Downstream models validate the {"version": ..., key: ...} wrapper, so keep that shape
+    # but only look up the version (and build a wrapper) when there is a payload to carry.
+    single = document.get(single_key)
+    items = document.get(list_key)
+    has_single = isinstance(single, dict)
+    has_items = isinstance(items, list) and bool(items)
+    if not (has_single or has_items):
+        return []
+    version = document.get("version", "v1alpha1")
     docs: list[dict[str, Any]] = []
-    agent = document.get("agent")
-    if isinstance(agent, dict):
-        docs.append({"version": document.get("version", "v1alpha1"), "agent": agent})
+    if has_single:
+        docs.append({"version": version, single_key: single})
+    if has_items:
+        docs.append({"version": version, list_key: items})
+    return docs
 
-    agents = document.get("agents", [])
-    if isinstance(agents, list) and agents:
-        docs.append({"version": document.get("version", "v1alpha1"), "agents": agents})
 
-    return docs
+@dataclass(frozen=True)
+class _DocumentKind:
+    schema_name: str
+    label: str
+    error_type: type[ValueError]
+    extract: Callable[[dict[str, Any]], list[dict[str, Any]]]
+
+
+_DOCUMENT_KINDS: dict[str, _DocumentKind] = {
+    "policy": _DocumentKind(
+        "policy", "Policy schema validation", PolicySchemaValidationError, _extract_policy_documents
+    ),
+    "memory": _DocumentKind(
+        "memory", "Memory schema validation", MemorySchemaValidationError, _extract_memory_documents
+    ),
+    "contract": _DocumentKind(
+        "tool-contract",
+        "Tool contract schema validation",
+        ContractSchemaValidationError,
+        _extract_contract_documents,
+    ),
+    "identity": _DocumentKind(
+        "agent-identity",
+        "Agent identity schema validation",
+        IdentitySchemaValidationError,
+        _extract_identity_documents,
+    ),
+}
 
 
 def _format_json_path(path_parts: Iterable[Any]) -> str:
-    location = "$"
-    for part in path_parts:
-        if isinstance(part, int):
-            location += f"[{part}]"
-        else:
-            location += f".{part}"
-    return location
+    parts = ["$"]
+    parts.extend(f"[{part}]" if isinstance(part, int) else f".{part}" for part in path_parts)
+    return "".join(parts)
 
 
 @lru_cache(maxsize=16)
-def _schema_validator(schema_name: str, version: str) -> Draft202012Validator:
+def _schema_validator(schema_name: str, version: str) -> SchemaValidator:
+    filename = f"{schema_name}{_SCHEMA_SUFFIX}"
+    if not (_PROJECT_SCHEMA_DIR / version / filename).exists():
+        bundled = _bundled_schemas().get((schema_name, version))
+        if bundled is not None:
+            return _build_validator(bundled)
+
     schema_path = _schema_path(schema_name, version)
     if not schema_path.exists():
         raise FileNotFoundError(
-            f"Schema file '{schema_name}.schema.json' (v{version}) not found at: {schema_path}\n"
+            f"Schema file '{filename}' (v{version}) not found at: {schema_path}\n"
             f"Fix: Ensure SafeAI is properly installed. Try: pip install -U safeai-sdk"
         )
 
-    with schema_path.open("r", encoding="utf-8") as fh:
-        schema = json.load(fh)
+    return _build_validator(_json_loads(schema_path.read_bytes()))
+
 
+def _build_validator(schema: dict[str, Any]) -> SchemaValidator:
+    """Compile *schema*, using jsonschema-rs when ``SAFEAI_SCHEMA_VALIDATOR=rs`` and installed."""
+    if os.environ.get("SAFEAI_SCHEMA_VALIDATOR", "").strip().lower() == "rs":
+        try:
+            import jsonschema_rs  # type: ignore[import-not-found]
+        except ImportError:
+            pass
+        else:
+            return jsonschema_rs.Draft202012Validator(schema)
     return Draft202012Validator(schema)
 
 
+@lru_cache(maxsize=1)
+def _bundled_schemas() -> dict[tuple[str, str], dict[str, Any]]:
+    """Read every schema shipped inside the package once, keyed by (name, version).
+
+    A checkout-level ``schemas/`` directory still takes precedence (see ``_schema_path``).
+    """
+    schemas: dict[tuple[str, str], dict[str, Any]] = {}
+    root = resources.files("safeai").joinpath("schemas")
+    if not root.is_dir():
+        return schemas
+    for version_dir in root.iterdir():
+        if not version_dir.is_dir():
+            continue
+        for entry in version_dir.iterdir():
+            if entry.name.endswith(_SCHEMA_SUFFIX):
+                name = entry.name[: -len(_SCHEMA_SUFFIX)]
+                schemas[(name, version_dir.name)] = _json_loads(entry.read_bytes())
+    return schemas
+
+
+@lru_cache(maxsize=32)
 def _schema_path(schema_name: str, version: str) -> Path:
-    module_path = Path(__file__).resolve()
-    filename = f"{schema_name}.schema.json"
-    project_schema = module_path.parents[2] / "schemas" / version / filename
-    package_schema = module_path.parents[1] / "schemas" / version / filename
+    filename = f"{schema_name}{_SCHEMA_SUFFIX}"
+    project_schema = _PROJECT_SCHEMA_DIR / version / filename
+    package_schema = _PACKAGE_SCHEMA_DIR / version / filename
 
     if project_schema.exists():
         return project_schema
@@ -4,7 +4,7 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class DashboardUserConfig(BaseModel):
@@ -13,6 +13,22 @@ class DashboardUserConfig(BaseModel):
     tenants: list[str] = Field(default_factory=lambda: ["default"])
 
 
+_DEFAULT_DASHBOARD_USERS = (
+    {"user_id": "security-admin", "role": "admin", "tenants": ("*",)},
+    {"user_id": "security-approver", "role": "approver", "tenants": ("default",)},
+    {"user_id": "security-auditor", "role": "auditor", "tenants": ("default",)},
+    {"user_id": "security-viewer", "role": "viewer", "tenants": ("default",)},
+)
+_DASHBOARD_USERS_ADAPTER: TypeAdapter[list[DashboardUserConfig]] = TypeAdapter(
+    list[DashboardUserConfig]
+)
+
+
+def _default_dashboard_users() -> list[DashboardUserConfig]:
+    # One pydantic-core call builds fresh user models (and tenant lists) per config.
+    return _DASHBOARD_USERS_ADAPTER.validate_python(_DEFAULT_DASHBOARD_USERS)
+
+
 class PluginConfig(BaseModel):
     enabled: bool = True
     plugin_files: list[str] = Field(default_factory=lambda: ["plugins/*.py"])
@@ -26,14 +42,7 @@ class DashboardConfig(BaseModel):
     tenant_policy_file: str | None = "tenants/policy-sets.yaml"
     alert_rules_file: str | None = "alerts/default.yaml"
     alert_log_file: str | None = "logs/alerts.log"
-    users: list[DashboardUserConfig] = Field(
-        default_factory=lambda: [
-            DashboardUserConfig(user_id="security-admin", role="admin", tenants=["*"]),
-            DashboardUserConfig(user_id="security-approver", role="approver", tenants=["default"]),
-            DashboardUserConfig(user_id="security-auditor", role="auditor", tenants=["default"]),
-            DashboardUserConfig(user_id="security-viewer", role="viewer", tenants=["default"]),
-        ]
-    )
+    users: list[DashboardUserConfig] = Field(default_factory=_default_dashboard_users)
 
 
 class PathsConfig(BaseModel):
@@ -49,6 +58,8 @@ class AuditConfig(BaseModel):
     max_age_days: int = 90
     compress_rotated: bool = True
     max_rotated_files: int = 10
+    background_writes: bool = False
+    query_cache_mb: int = 0
 
 
 class ApprovalConfig(BaseModel):
@@ -60,6 +71,10 @@ class MemoryRuntimeConfig(BaseModel):
     auto_purge_expired: bool = True
 
 
+class OutputRuntimeConfig(BaseModel):
+    skip_scan_when_allowed: bool = False
+
+
 class IntelligenceBackendConfig(BaseModel):
     provider: str = "ollama"
     model: str = "llama3.2"
@@ -135,6 +150,7 @@ class SafeAIConfig(BaseModel):
     audit: AuditConfig = Field(default_factory=AuditConfig)
     approvals: ApprovalConfig = Field(default_factory=ApprovalConfig)
     memory_runtime: MemoryRuntimeConfig = Field(default_factory=MemoryRuntimeConfig)
+    output_runtime: OutputRuntimeConfig = Field(default_factory=OutputRuntimeConfig)
     plugins: PluginConfig = Field(default_factory=PluginConfig)
     dashboard: DashboardConfig = Field(default_factory=DashboardConfig)
     intelligence: IntelligenceConfig = Field(default_factory=IntelligenceConfig)
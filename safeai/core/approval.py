@@ -5,18 +5,56 @@
 from __future__ import annotations
 
 import json
+import os
 import re
-from dataclasses import dataclass
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Literal, cast
+from typing import Any, Callable, Literal
 from uuid import uuid4
 
+_json_loads: Callable[[bytes], Any]
+try:
+    from msgspec import DecodeError as _MsgspecDecodeError  # type: ignore[import-not-found]
+    from msgspec.json import decode as _msgspec_decode  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - msgspec is optional.
+    _json_loads = json.loads
+else:
+
+    def _msgspec_json_loads(data: bytes) -> Any:
+        try:
+            return _msgspec_decode(data)
+        except _MsgspecDecodeError:
+            # msgspec rejects the NaN and Infinity tokens the stdlib encoder writes by default.
+            return json.loads(data)
+
+    _json_loads = _msgspec_json_loads
+
 ApprovalStatus = Literal["pending", "approved", "denied", "expired"]
 Clock = Callable[[], datetime]
 
-
-@dataclass(frozen=True)
+_DURATION_RE = re.compile(r"^\s*(\d+)\s*([smhdw])\s*$")
+_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+# Compact once the append-only log holds this many lines per live request (and at least the minimum).
+_COMPACT_RATIO = 2
+_COMPACT_MIN_LINES = 64
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=True)
+# Canonical status objects, so every stored row shares one string per status.
+_STATUSES: dict[str, ApprovalStatus] = {
+    "pending": "pending",
+    "approved": "approved",
+    "denied": "denied",
+    "expired": "expired",
+}
+# Low-cardinality identifiers shorter than this are interned; long values are left alone.
+_INTERN_MAX_LENGTH = 64
+
+
+@dataclass(frozen=True, slots=True)
 class ApprovalRequest:
     request_id: str
     status: ApprovalStatus
@@ -59,8 +97,17 @@ class ApprovalManager:
         self._clock = clock or (lambda: datetime.now(timezone.utc))
         self._default_ttl = default_ttl
         self._requests: dict[str, ApprovalRequest] = {}
+        # Secondary indices over ``_requests`` (request ids), kept in step by _store/_discard.
+        self._by_status: defaultdict[str, set[str]] = defaultdict(set)
+        self._by_agent: defaultdict[str, set[str]] = defaultdict(set)
+        self._pending_by_dedupe: defaultdict[str, set[str]] = defaultdict(set)
         self._file_path = Path(file_path).expanduser().resolve() if file_path else None
-        self._last_mtime_ns: int | None = None
+        # Plain-string path for os.stat on the hot reload check; the directory is made once here.
+        self._file_path_str = str(self._file_path) if self._file_path else None
+        if self._file_path is not None:
+            self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file_key: tuple[int, int] | None = None
+        self._line_count = 0
         self._load()
 
     def create_request(
@@ -90,19 +137,19 @@ class ApprovalManager:
             request_id=f"apr_{uuid4().hex[:12]}",
             status="pending",
             reason=str(reason).strip(),
-            policy_name=_normalize_optional_token(policy_name),
-            agent_id=_normalize_required_token(agent_id, field_name="agent_id"),
-            tool_name=_normalize_required_token(tool_name, field_name="tool_name"),
+            policy_name=_normalize_interned_token(policy_name),
+            agent_id=_intern_token(_normalize_required_token(agent_id, field_name="agent_id")),
+            tool_name=_intern_token(_normalize_required_token(tool_name, field_name="tool_name")),
             session_id=_normalize_optional_token(session_id),
-            action_type=_normalize_optional_token(action_type) or "tool_call",
-            data_tags=sorted({str(tag).strip().lower() for tag in (data_tags or []) if str(tag).strip()}),
+            action_type=_normalize_interned_token(action_type) or "tool_call",
+            data_tags=_normalize_tags(data_tags),
             requested_at=now,
             expires_at=now + duration,
             metadata=dict(metadata or {}),
             dedupe_key=normalized_dedupe,
         )
-        self._requests[request.request_id] = request
-        self._persist()
+        self._store(request)
+        self._persist([request])
         return request
 
     def get(self, request_id: str) -> ApprovalRequest | None:
@@ -113,11 +160,7 @@ class ApprovalManager:
         row = self._requests.get(token)
         if row is None:
             return None
-        if row.status == "pending" and row.is_expired(now=self._clock()):
-            row = row.__class__(**{**row.__dict__, "status": "expired"})
-            self._requests[row.request_id] = row
-            self._persist()
-        return row
+        return _project_expiry(row, now=self._clock())
 
     def list_requests(
         self,
@@ -130,21 +173,18 @@ class ApprovalManager:
     ) -> list[ApprovalRequest]:
         self._reload_if_changed()
         now = self._clock()
+        wanted_agent = _normalize_required_token(agent_id, field_name="agent_id") if agent_id else None
+        wanted_tool = _normalize_required_token(tool_name, field_name="tool_name") if tool_name else None
         rows: list[ApprovalRequest] = []
-        for item in self._requests.values():
-            row = item
-            if row.status == "pending" and row.is_expired(now=now):
-                row = row.__class__(**{**row.__dict__, "status": "expired"})
-                self._requests[row.request_id] = row
+        for item in self._candidates(status=status, agent_id=wanted_agent):
+            row = _project_expiry(item, now=now)
             if status and row.status != status:
                 continue
-            if agent_id and row.agent_id != _normalize_required_token(agent_id, field_name="agent_id"):
+            if wanted_agent and row.agent_id != wanted_agent:
                 continue
-            if tool_name and row.tool_name != _normalize_required_token(tool_name, field_name="tool_name"):
+            if wanted_tool and row.tool_name != wanted_tool:
                 continue
             rows.append(row)
-        if rows:
-            self._persist()
         rows.sort(key=lambda item: item.requested_at, reverse=newest_first)
         if limit <= 0:
             return rows
@@ -231,15 +271,24 @@ class ApprovalManager:
         self._reload_if_changed()
         now = self._clock()
         purged = 0
-        for request_id in list(self._requests.keys()):
-            row = self._requests[request_id]
-            if row.status == "pending" and row.is_expired(now=now):
-                self._requests.pop(request_id, None)
+        for request_id in list(self._by_status.get("pending", ())):
+            if self._requests[request_id].is_expired(now=now):
+                self._discard(request_id)
                 purged += 1
         if purged:
-            self._persist()
+            self.compact()
         return purged
 
+    def compact(self) -> None:
+        """Rewrite the append-only store with one line per live request."""
+        if self._file_path is None:
+            return
+        rows = sorted(self._requests.values(), key=lambda item: item.requested_at)
+        encoded = "\n".join(_COMPACT_ENCODER.encode(_request_to_payload(row)) for row in rows)
+        self._file_path.write_text(encoded + ("\n" if encoded else ""), encoding="utf-8")
+        self._line_count = len(rows)
+        self._record_file_key()
+
     def _decide(
         self,
         *,
@@ -255,81 +304,150 @@ class ApprovalManager:
             return False
         if row.status != "pending" or row.is_expired(now=self._clock()):
             return False
-        updated = row.__class__(
-            **{
-                **row.__dict__,
-                "status": status,
-                "approver_id": _normalize_required_token(approver_id, field_name="approver_id"),
-                "decision_note": _normalize_optional_token(note),
-                "decided_at": self._clock(),
-            }
+        updated = replace(
+            row,
+            status=status,
+            approver_id=_normalize_required_token(approver_id, field_name="approver_id"),
+            decision_note=_normalize_optional_token(note),
+            decided_at=self._clock(),
         )
-        self._requests[token] = updated
-        self._persist()
+        self._store(updated)
+        self._persist([updated])
         return True
 
     def _find_pending_by_dedupe(self, dedupe_key: str, *, now: datetime) -> ApprovalRequest | None:
+        live = [
+            row
+            for row in (self._requests[request_id] for request_id in self._pending_by_dedupe.get(dedupe_key, ()))
+            if not row.is_expired(now=now)
+        ]
+        return min(live, key=lambda row: row.requested_at) if live else None
+
+    def _candidates(self, *, status: ApprovalStatus | None, agent_id: str | None) -> list[ApprovalRequest]:
+        """Rows that can match *status* and *agent_id*, narrowed through the indices."""
+        if not status and not agent_id:
+            return list(self._requests.values())
+        selected: set[str] | None = None
+        if status:
+            selected = set(self._by_status.get(status, ()))
+            if status == "expired":
+                # Lapsed pending rows are reported as expired.
+                selected.update(self._by_status.get("pending", ()))
+        if agent_id:
+            agent_ids = self._by_agent.get(agent_id, set())
+            selected = agent_ids.copy() if selected is None else selected & agent_ids
+        return [self._requests[request_id] for request_id in selected or ()]
+
+    def _store(self, row: ApprovalRequest) -> None:
+        previous = self._requests.get(row.request_id)
+        if previous is not None:
+            self._unindex(previous)
+        self._requests[row.request_id] = row
+        self._index(row)
+
+    def _discard(self, request_id: str) -> None:
+        row = self._requests.pop(request_id, None)
+        if row is not None:
+            self._unindex(row)
+
+    def _index(self, row: ApprovalRequest) -> None:
+        self._by_status[row.status].add(row.request_id)
+        self._by_agent[row.agent_id].add(row.request_id)
+        if row.dedupe_key and row.status == "pending":
+            self._pending_by_dedupe[row.dedupe_key].add(row.request_id)
+
+    def _unindex(self, row: ApprovalRequest) -> None:
+        _discard_member(self._by_status, row.status, row.request_id)
+        _discard_member(self._by_agent, row.agent_id, row.request_id)
+        if row.dedupe_key:
+            _discard_member(self._pending_by_dedupe, row.dedupe_key, row.request_id)
+
+    def _rebuild_indices(self) -> None:
+        self._by_status.clear()
+        self._by_agent.clear()
+        self._pending_by_dedupe.clear()
         for row in self._requests.values():
-            if row.dedupe_key != dedupe_key:
-                continue
-            if row.status != "pending":
-                continue
-            if row.is_expired(now=now):
-                continue
-            return row
-        return None
+            self._index(row)
 
     def _reload_if_changed(self) -> None:
-        if self._file_path is None or not self._file_path.exists():
-            return
-        try:
-            mtime_ns = self._file_path.stat().st_mtime_ns
-        except OSError:
-            return
-        if self._last_mtime_ns is not None and mtime_ns == self._last_mtime_ns:
+        key = self._stat_key()
+        if key is None or key == self._file_key:
             return
         self._load()
 
     def _load(self) -> None:
         if self._file_path is None:
             return
-        self._file_path.parent.mkdir(parents=True, exist_ok=True)
         if not self._file_path.exists():
             self._file_path.write_text("", encoding="utf-8")
-            try:
-                self._last_mtime_ns = self._file_path.stat().st_mtime_ns
-            except OSError:
-                self._last_mtime_ns = None
+            self._line_count = 0
+            self._record_file_key()
             return
 
+        # The store is append-only: later lines for a request supersede earlier ones.
         rows: dict[str, ApprovalRequest] = {}
-        for line in self._file_path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                payload = json.loads(line)
-                row = _request_from_payload(payload)
-            except Exception:
-                continue
-            rows[row.request_id] = row
+        line_count = 0
+        with self._file_path.open("rb") as fh:
+            for raw_line in fh:
+                line = raw_line.strip()
+                if not line:
+                    continue
+                line_count += 1
+                try:
+                    payload = _json_loads(line)
+                    row = _request_from_payload(payload)
+                except Exception:
+                    continue
+                rows[row.request_id] = row
         self._requests = rows
-        try:
-            self._last_mtime_ns = self._file_path.stat().st_mtime_ns
-        except OSError:
-            self._last_mtime_ns = None
+        self._rebuild_indices()
+        self._line_count = line_count
+        self._record_file_key()
 
-    def _persist(self) -> None:
+    def _persist(self, rows: list[ApprovalRequest]) -> None:
+        """Append the changed *rows*, compacting once superseded lines pile up."""
         if self._file_path is None:
             return
-        self._file_path.parent.mkdir(parents=True, exist_ok=True)
-        rows = sorted(self._requests.values(), key=lambda item: item.requested_at)
-        encoded = "\n".join(json.dumps(_request_to_payload(row), separators=(",", ":"), ensure_ascii=True) for row in rows)
-        self._file_path.write_text(encoded + ("\n" if encoded else ""), encoding="utf-8")
+        encoded = "".join(_COMPACT_ENCODER.encode(_request_to_payload(row)) + "\n" for row in rows)
+        with self._file_path.open("a", encoding="utf-8") as fh:
+            fh.write(encoded)
+        self._line_count += len(rows)
+        if self._line_count > max(_COMPACT_MIN_LINES, _COMPACT_RATIO * len(self._requests)):
+            self.compact()
+            return
+        self._record_file_key()
+
+    def _stat_key(self) -> tuple[int, int] | None:
+        """``(mtime_ns, size)`` of the store; size catches appends within one mtime tick."""
+        if self._file_path_str is None:
+            return None
         try:
-            self._last_mtime_ns = self._file_path.stat().st_mtime_ns
+            info = os.stat(self._file_path_str)
         except OSError:
-            self._last_mtime_ns = None
+            return None
+        return info.st_mtime_ns, info.st_size
+
+    def _record_file_key(self) -> None:
+        self._file_key = self._stat_key()
+
+
+def _discard_member(index: defaultdict[str, set[str]], key: str, request_id: str) -> None:
+    members = index.get(key)
+    if members is None:
+        return
+    members.discard(request_id)
+    if not members:
+        del index[key]
+
+
+def _project_expiry(row: ApprovalRequest, *, now: datetime) -> ApprovalRequest:
+    """Report a lapsed pending request as expired without touching stored state.
+
+    Reads stay side-effect free; ``purge_expired`` is the only path that drops them.
+    """
+    if row.status == "pending" and row.is_expired(now=now):
+        return replace(row, status="expired")
+    return row
 
 
 def _request_to_payload(request: ApprovalRequest) -> dict[str, Any]:
@@ -342,13 +460,13 @@ def _request_to_payload(request: ApprovalRequest) -> dict[str, Any]:
         "tool_name": request.tool_name,
         "session_id": request.session_id,
         "action_type": request.action_type,
-        "data_tags": list(request.data_tags),
+        "data_tags": request.data_tags,
         "requested_at": request.requested_at.isoformat(),
         "expires_at": request.expires_at.isoformat(),
         "decided_at": request.decided_at.isoformat() if request.decided_at else None,
         "approver_id": request.approver_id,
         "decision_note": request.decision_note,
-        "metadata": dict(request.metadata or {}),
+        "metadata": request.metadata or {},
         "dedupe_key": request.dedupe_key,
     }
 
@@ -358,18 +476,12 @@ def _request_from_payload(payload: dict[str, Any]) -> ApprovalRequest:
         request_id=_normalize_required_token(payload.get("request_id"), field_name="request_id"),
         status=_normalize_status(payload.get("status")),
         reason=_normalize_required_token(payload.get("reason"), field_name="reason"),
-        policy_name=_normalize_optional_token(payload.get("policy_name")),
-        agent_id=_normalize_required_token(payload.get("agent_id"), field_name="agent_id"),
-        tool_name=_normalize_required_token(payload.get("tool_name"), field_name="tool_name"),
+        policy_name=_normalize_interned_token(payload.get("policy_name")),
+        agent_id=_intern_token(_normalize_required_token(payload.get("agent_id"), field_name="agent_id")),
+        tool_name=_intern_token(_normalize_required_token(payload.get("tool_name"), field_name="tool_name")),
         session_id=_normalize_optional_token(payload.get("session_id")),
-        action_type=_normalize_optional_token(payload.get("action_type")) or "tool_call",
-        data_tags=sorted(
-            {
-                str(tag).strip().lower()
-                for tag in (payload.get("data_tags") or [])
-                if str(tag).strip()
-            }
-        ),
+        action_type=_normalize_interned_token(payload.get("action_type")) or "tool_call",
+        data_tags=_normalize_tags(payload.get("data_tags")),
         requested_at=_parse_when(payload.get("requested_at")),
         expires_at=_parse_when(payload.get("expires_at")),
         decided_at=_parse_optional_when(payload.get("decided_at")),
@@ -405,25 +517,33 @@ def _normalize_required_token(value: Any, *, field_name: str) -> str:
     return token
 
 
+def _intern_token(token: str) -> str:
+    """Share one string object per short identifier (agents, tools, tags) across rows."""
+    return sys.intern(token) if len(token) < _INTERN_MAX_LENGTH else token
+
+
+def _normalize_interned_token(value: Any) -> str | None:
+    token = _normalize_optional_token(value)
+    return _intern_token(token) if token else None
+
+
+def _normalize_tags(tags: Any) -> list[str]:
+    normalized = {str(tag).strip().lower() for tag in (tags or [])}
+    normalized.discard("")
+    return [_intern_token(tag) for tag in sorted(normalized)]
+
+
+@lru_cache(maxsize=64)
 def _parse_duration(value: str) -> timedelta:
-    match = re.match(r"^\s*(\d+)\s*([smhdw])\s*$", str(value).lower())
+    match = _DURATION_RE.match(str(value).lower())
     if not match:
         raise ValueError(f"Invalid duration '{value}'. Use forms like 30s, 15m, 2h, 7d.")
-    amount = int(match.group(1))
-    unit = match.group(2)
-    if unit == "s":
-        return timedelta(seconds=amount)
-    if unit == "m":
-        return timedelta(minutes=amount)
-    if unit == "h":
-        return timedelta(hours=amount)
-    if unit == "d":
-        return timedelta(days=amount)
-    return timedelta(weeks=amount)
+    return timedelta(seconds=int(match.group(1)) * _UNIT_SECONDS[match.group(2)])
 
 
 def _normalize_status(value: Any) -> ApprovalStatus:
-    token = str(value or "pending").strip().lower()
-    if token not in {"pending", "approved", "denied", "expired"}:
-        token = "pending"
-    return cast(ApprovalStatus, token)
+    status = _STATUSES.get(value) if type(value) is str else None
+    if status is not None:
+        # Already canonical: the common case for rows this manager wrote.
+        return status
+    return _STATUSES.get(str(value or "pending").strip().lower(), "pending")
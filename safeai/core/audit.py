@@ -4,28 +4,72 @@
 
 from __future__ import annotations
 
+import atexit
 import gzip
 import hashlib
 import json
+import math
+import os
+import queue
+import re
 import shutil
-from dataclasses import asdict, dataclass, field
+import threading
+import weakref
+from bisect import bisect_left
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-from uuid import uuid4
+from typing import IO, Any, BinaryIO, Callable, Iterable, Iterator, Sequence
 
 from safeai.core.models import AuditEventModel
-from safeai.core.policy import expand_tag_hierarchy
 
+_json_loads: Callable[[bytes], Any]
+try:
+    from msgspec import DecodeError as _MsgspecDecodeError  # type: ignore[import-not-found]
+    from msgspec.json import decode as _msgspec_decode  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - msgspec is optional.
+    _json_loads = json.loads
+else:
 
-@dataclass
+    def _msgspec_json_loads(data: bytes) -> Any:
+        try:
+            return _msgspec_decode(data)
+        except _MsgspecDecodeError:
+            # msgspec rejects the NaN and Infinity tokens the stdlib encoder writes by default.
+            return json.loads(data)
+
+    _json_loads = _msgspec_json_loads
+
+_READ_CHUNK_BYTES = 1 << 20
+_INDEX_STRIDE_BYTES = 1 << 16
+_TIMESTAMP_KEY = b'"timestamp":"'
+_WRITE_BATCH_EVENTS = 128
+# Queued events a background writer may fall behind by before emit() blocks.
+_MAX_QUEUED_EVENTS = 4096
+_CANONICAL_UTC_LENGTHS = frozenset({25, 32})
+# Fields AuditEventModel fills with a non-None default when a record omits them.
+_DEFAULTED_FIELDS = frozenset({"agent_id", "data_tags", "metadata", "timestamp"})
+_DURATION_RE = re.compile(r"^\s*(\d+)\s*([smhdw])\s*$")
+_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+# Reused encoders: json.dumps() builds a new JSONEncoder on every call with non-default options.
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=True)
+_HASH_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _new_event_id() -> str:
+    # The 48 random bits uuid4().hex[:12] used to give, without building a UUID.
+    return f"evt_{os.urandom(6).hex()}"
+
+
+@dataclass(slots=True)
 class AuditEvent:
     boundary: str
     action: str
     policy_name: str | None
     reason: str
     data_tags: list[str]
-    event_id: str = field(default_factory=lambda: f"evt_{uuid4().hex[:12]}")
+    event_id: str = field(default_factory=_new_event_id)
     agent_id: str = "unknown"
     tool_name: str | None = None
     session_id: str | None = None
@@ -52,6 +96,8 @@ class AuditLogger:
         max_age_days: int = 90,
         compress_rotated: bool = True,
         max_rotated_files: int = 10,
+        background_writes: bool = False,
+        query_cache_mb: int = 0,
     ) -> None:
         self.file_path = Path(file_path).expanduser() if file_path else None
         if self.file_path:
@@ -61,9 +107,36 @@ class AuditLogger:
         self._max_age_days = max_age_days
         self._compress_rotated = compress_rotated
         self._max_rotated_files = max_rotated_files
+        self._offset_index = _OffsetIndex()
+        self._index_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._fh: BinaryIO | None = None
+        self._fh_inode: int | None = None
+        self._queue: queue.Queue[tuple[AuditEvent, bool] | None] | None = None
+        self._writer: threading.Thread | None = None
+        # Decoded records kept between queries for logs up to ``query_cache_mb``; 0 disables.
+        self._record_cache = _RecordCache(query_cache_mb * 1024 * 1024) if query_cache_mb > 0 else None
+        self._cache_lock = threading.Lock()
+        if background_writes and self.file_path:
+            self._queue = queue.Queue(maxsize=_MAX_QUEUED_EVENTS)
+            self._writer = threading.Thread(
+                target=_drain_audit_queue,
+                args=(self._queue, weakref.ref(self)),
+                name="safeai-audit-writer",
+                daemon=True,
+            )
+            self._writer.start()
+            # Stop the writer once this logger is garbage collected.
+            weakref.finalize(self, _stop_writer, self._queue)
+            _OPEN_LOGGERS.add(self)
 
     def register_on_emit(self, callback: Any) -> None:
-        """Register a callback invoked after every emit(). Callbacks receive the event dict."""
+        """Register a callback invoked after every emit(). Callbacks receive the event dict.
+
+        With ``background_writes`` callbacks run on the writer thread, not the
+        caller's. A slow callback (e.g. a webhook) delays later writes, and once
+        the queue is full it delays ``emit()`` too, so hand slow work elsewhere.
+        """
         self._on_emit_callbacks.append(callback)
 
     def _rotated_files(self) -> list[Path]:
@@ -144,34 +217,50 @@ class AuditLogger:
             if mtime < cutoff_ts:
                 rotated.unlink(missing_ok=True)
 
-    def emit(self, event: AuditEvent) -> None:
-        self._maybe_rotate()
-        event_payload = asdict(event)
-        if not event_payload.get("context_hash"):
-            event_payload["context_hash"] = context_hash(
-                {
-                    "event_id": event_payload.get("event_id"),
-                    "boundary": event_payload.get("boundary"),
-                    "action": event_payload.get("action"),
-                    "policy_name": event_payload.get("policy_name"),
-                    "reason": event_payload.get("reason"),
-                    "data_tags": event_payload.get("data_tags", []),
-                    "agent_id": event_payload.get("agent_id"),
-                    "tool_name": event_payload.get("tool_name"),
-                    "session_id": event_payload.get("session_id"),
-                    "source_agent_id": event_payload.get("source_agent_id"),
-                    "destination_agent_id": event_payload.get("destination_agent_id"),
-                    "metadata": event_payload.get("metadata", {}),
-                }
-            )
-        validated = AuditEventModel.model_validate(event_payload)
-        encoded = json.dumps(validated.model_dump(mode="json"), separators=(",", ":"), ensure_ascii=True)
+    def emit(self, event: AuditEvent, *, validate: bool = False) -> None:
+        """Append *event* to the log and notify emit callbacks.
+
+        Events are built internally, so the pydantic round-trip only runs with
+        ``validate=True`` or when metadata holds values plain JSON cannot encode.
+        With ``background_writes`` the event itself is queued: the writer thread
+        encodes it, appends it and runs the callbacks, so the event must not be
+        changed after this call. Once the writer is ``_MAX_QUEUED_EVENTS``
+        behind, this blocks until it catches up rather than buffering without
+        bound.
+        """
+        if self._queue is not None and threading.current_thread() is not self._writer:
+            self._queue.put((event, validate))
+            return
+        # Without a writer, or from a callback on the writer itself, which must not wait on its own queue.
+        encoded, event_dict = _encode_event(event, validate=validate)
         if self.file_path:
-            with self.file_path.open("a", encoding="utf-8") as fh:
-                fh.write(encoded + "\n")
+            self._write_lines([(encoded + "\n").encode("utf-8")])
         else:
             print(encoded)
-        event_dict = validated.model_dump(mode="json")
+        self._notify(event_dict)
+
+    def _emit_queued(self, items: list[tuple[AuditEvent, bool]]) -> None:
+        """Writer thread: encode a batch of queued events, append them in one write, then notify."""
+        lines: list[bytes] = []
+        event_dicts: list[dict[str, Any]] = []
+        for event, validate in items:
+            try:
+                encoded, event_dict = _encode_event(event, validate=validate)
+            except ValueError as exc:
+                import logging as _logging
+
+                _logging.getLogger(__name__).warning(
+                    "Dropped audit event %s: %s. Fix: emit JSON-serializable metadata.", event.event_id, exc
+                )
+                continue
+            lines.append((encoded + "\n").encode("utf-8"))
+            event_dicts.append(event_dict)
+        if lines:
+            self._write_lines(lines)
+        for event_dict in event_dicts:
+            self._notify(event_dict)
+
+    def _notify(self, event_dict: dict[str, Any]) -> None:
         for callback in self._on_emit_callbacks:
             try:
                 callback(event_dict)
@@ -184,6 +273,59 @@ class AuditLogger:
                     exc,
                 )
 
+    def flush(self) -> None:
+        """Block until every queued event has been written.
+
+        Returns at once on the writer thread (from an emit callback), whose own
+        batch would otherwise never finish.
+        """
+        if self._queue is not None and threading.current_thread() is not self._writer:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Flush pending events, stop the writer thread, and close the log file."""
+        self.flush()
+        if self._queue is not None:
+            self._queue.put(None)
+            self._queue = None
+        with self._write_lock:
+            self._close_file()
+
+    def _write_lines(self, lines: list[bytes]) -> None:
+        """Append *lines* with one ``write`` on a handle kept open between events."""
+        if not self.file_path:
+            return
+        with self._write_lock:
+            data = memoryview(b"".join(lines))
+            fh = self._writable_file(self.file_path)
+            while data:
+                written = fh.write(data)
+                data = data[written:]
+
+    def _writable_file(self, path: Path) -> BinaryIO:
+        try:
+            info: os.stat_result | None = os.stat(path)
+        except FileNotFoundError:
+            info = None
+        if info is not None and info.st_size >= self._max_size_bytes:
+            self._close_file()
+            self._maybe_rotate()
+            info = None
+        if self._fh is not None and (info is None or info.st_ino != self._fh_inode):
+            # Rotated or replaced underneath us; follow the path, not the old inode.
+            self._close_file()
+        if self._fh is None:
+            self._fh = open(path, "ab", buffering=0)
+            self._fh_inode = os.fstat(self._fh.fileno()).st_ino
+            _OPEN_LOGGERS.add(self)
+        return self._fh
+
+    def _close_file(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+            self._fh_inode = None
+
     def query(
         self,
         *,
@@ -192,7 +334,7 @@ class AuditLogger:
         policy_name: str | None = None,
         agent_id: str | None = None,
         tool_name: str | None = None,
-        data_tag: str | None = None,
+        data_tag: str | Sequence[str] | None = None,
         phase: str | None = None,
         session_id: str | None = None,
         event_id: str | None = None,
@@ -213,54 +355,70 @@ class AuditLogger:
 
         ``last`` accepts compact durations like ``15m``, ``2h``, and ``7d``.
         ``since`` and ``until`` accept ISO-8601 text or ``datetime``.
+        ``data_tag`` accepts one tag or a sequence of tags; parent tags match children.
         """
+        self.flush()
         if not self.file_path or not self.file_path.exists():
             return []
 
         effective_since, effective_until = _normalize_range(since=since, until=until, last=last)
+        data_tag_pattern = _compile_tag_filter(data_tag)
+        # Exact-match filters are resolved once per query, most selective first.
+        equals = tuple(
+            (field_name, value)
+            for field_name, value in (
+                ("event_id", event_id),
+                ("session_id", session_id),
+                ("agent_id", agent_id),
+                ("tool_name", tool_name),
+                ("policy_name", policy_name),
+                ("source_agent_id", source_agent_id),
+                ("destination_agent_id", destination_agent_id),
+                ("action", action),
+                ("boundary", boundary),
+            )
+            if value
+        )
+        # A record without agent_id validates as "unknown", so that value has no literal to look for.
+        needles = _literal_needles(
+            *(value for name, value in equals if not (name == "agent_id" and value == "unknown"))
+        )
+        matches = _event_matcher(
+            equals=equals,
+            data_tag_pattern=data_tag_pattern,
+            phase=phase,
+            metadata_key=metadata_key,
+            metadata_value=metadata_value,
+            since=effective_since,
+            until=effective_until,
+            min_cost=min_cost,
+            max_cost=max_cost,
+            tenant_id=tenant_id,
+        )
         parsed: list[dict[str, Any]] = []
-
-        for line in self.file_path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line:
-                continue
+        events: Iterable[dict[str, Any]] | None = None
+        if self._record_cache is not None:
+            with self._cache_lock:
+                events = self._record_cache.records_for(self.file_path)
+        if events is None:
+            events = _decode_records(self._iter_log_lines(self.file_path, effective_since), needles)
+
+        for event in events:
             try:
-                event = json.loads(line)
+                # Records this logger wrote carry every defaulted field, and the model keeps
+                # present values verbatim, so filtering the raw record is final and only
+                # matches pay for validation. Other records are validated before matching.
+                complete = _DEFAULTED_FIELDS <= event.keys()
+                if complete:
+                    if not matches(event):
+                        continue
+                elif any(event.get(name, value) != value for name, value in equals):
+                    continue
                 validated = AuditEventModel.model_validate(event).model_dump(mode="json")
+                if not complete and not matches(validated):
+                    continue
             except Exception:
                 continue
-            if not _matches_event(
-                event=validated,
-                boundary=boundary,
-                action=action,
-                policy_name=policy_name,
-                agent_id=agent_id,
-                tool_name=tool_name,
-                data_tag=data_tag,
-                phase=phase,
-                session_id=session_id,
-                event_id=event_id,
-                source_agent_id=source_agent_id,
-                destination_agent_id=destination_agent_id,
-                metadata_key=metadata_key,
-                metadata_value=metadata_value,
-                since=effective_since,
-                until=effective_until,
-            ):
-                continue
-            if min_cost is not None or max_cost is not None:
-                ec = validated.get("estimated_cost")
-                if ec is None:
-                    continue
-                if min_cost is not None and ec < min_cost:
-                    continue
-                if max_cost is not None and ec > max_cost:
-                    continue
-            if tenant_id is not None:
-                event_meta = validated.get("metadata") or {}
-                event_tenant = event_meta.get("tenant_id") if isinstance(event_meta, dict) else None
-                if event_tenant != tenant_id:
-                    continue
             parsed.append(validated)
 
         parsed.sort(key=lambda item: item.get("timestamp", ""), reverse=newest_first)
@@ -268,11 +426,281 @@ class AuditLogger:
             return parsed
         return parsed[:limit]
 
+    def _iter_log_lines(self, path: Path, since: datetime | None) -> Iterator[bytes]:
+        """Yield raw records, skipping the file prefix that holds only events before *since*."""
+        with path.open("rb") as fh:
+            if since is not None:
+                # One second of slack absorbs float rounding of the comparison.
+                with self._index_lock:
+                    fh.seek(self._offset_index.offset_for(fh, since.timestamp() - 1.0))
+            yield from _iter_lines(fh)
+
+
+def _encode_event(event: AuditEvent, *, validate: bool) -> tuple[str, dict[str, Any]]:
+    """Return the compact JSON line for *event* and the record dict passed to emit callbacks."""
+    event_payload = _event_to_dict(event)
+    if not event_payload["context_hash"]:
+        event_payload["context_hash"] = context_hash(
+            {
+                "event_id": event.event_id,
+                "boundary": event.boundary,
+                "action": event.action,
+                "policy_name": event.policy_name,
+                "reason": event.reason,
+                "data_tags": event.data_tags,
+                "agent_id": event.agent_id,
+                "tool_name": event.tool_name,
+                "session_id": event.session_id,
+                "source_agent_id": event.source_agent_id,
+                "destination_agent_id": event.destination_agent_id,
+                "metadata": event.metadata,
+            }
+        )
+    if not validate:
+        try:
+            return _COMPACT_ENCODER.encode(event_payload), event_payload
+        except (TypeError, ValueError):
+            pass
+    event_dict = AuditEventModel.model_validate(event_payload).model_dump(mode="json")
+    return _COMPACT_ENCODER.encode(event_dict), event_dict
+
+
+_OPEN_LOGGERS: weakref.WeakSet[AuditLogger] = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_loggers() -> None:
+    """Flush queued events and release every audit log handle at interpreter exit."""
+    for audit_logger in list(_OPEN_LOGGERS):
+        audit_logger.close()
+
+
+def _stop_writer(pending: queue.Queue[tuple[AuditEvent, bool] | None]) -> None:
+    # The finalizer may run on the writer thread itself, so never block on a
+    # full queue; a busy writer notices its owner is gone after the batch.
+    try:
+        pending.put_nowait(None)
+    except queue.Full:
+        pass
+
+
+def _drain_audit_queue(
+    pending: queue.Queue[tuple[AuditEvent, bool] | None], owner: weakref.ref[AuditLogger]
+) -> None:
+    """Writer thread: coalesce up to ``_WRITE_BATCH_EVENTS`` queued events per write."""
+    while True:
+        item = pending.get()
+        if item is None:
+            pending.task_done()
+            return
+        batch = [item]
+        stop = False
+        while len(batch) < _WRITE_BATCH_EVENTS:
+            try:
+                item = pending.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                stop = True
+                break
+            batch.append(item)
+        audit_logger = owner()
+        try:
+            if audit_logger is not None:
+                audit_logger._emit_queued(batch)
+        except OSError as exc:
+            import logging as _logging
+
+            _logging.getLogger(__name__).warning(
+                "Dropped %d audit event(s): %s. Fix: check the audit log path and permissions.",
+                len(batch),
+                exc,
+            )
+        except Exception as exc:
+            # Anything else would kill the writer, leaving flush(), close() and a full emit() hung.
+            import logging as _logging
+
+            _logging.getLogger(__name__).warning(
+                "Dropped %d audit event(s) after an unexpected writer error: %s. "
+                "Fix: report this traceback.",
+                len(batch),
+                exc,
+                exc_info=True,
+            )
+        finally:
+            del audit_logger
+            for _ in range(len(batch) + stop):
+                pending.task_done()
+        if stop or owner() is None:
+            return
+
+
+class _OffsetIndex:
+    """Sparse ``(running max timestamp, byte offset)`` index over an append-only log.
+
+    Each entry records the latest timestamp of every line *before* its offset,
+    so seeking there never skips a matching event even if lines are out of
+    order. New lines are indexed incrementally; rotation or truncation resets it.
+    """
+
+    def __init__(self) -> None:
+        self._reset(None)
+
+    def _reset(self, file_id: tuple[int, int] | None) -> None:
+        self._file_id = file_id
+        self._end = 0
+        self._max_ts = -math.inf
+        self._entries: list[tuple[float, int]] = [(-math.inf, 0)]
+
+    def offset_for(self, fh: IO[bytes], since_ts: float) -> int:
+        self._refresh(fh)
+        position = bisect_left(self._entries, (since_ts, -1)) - 1
+        return self._entries[max(position, 0)][1]
+
+    def _refresh(self, fh: IO[bytes]) -> None:
+        info = os.fstat(fh.fileno())
+        file_id = (info.st_dev, info.st_ino)
+        if file_id != self._file_id or info.st_size < self._end:
+            self._reset(file_id)
+        if info.st_size == self._end:
+            return
+        fh.seek(self._end)
+        offset = self._end
+        last_entry = self._entries[-1][1]
+        for line in fh:
+            if not line.endswith(b"\n"):
+                break  # Partially written record; index it once complete.
+            if offset - last_entry >= _INDEX_STRIDE_BYTES:
+                self._entries.append((self._max_ts, offset))
+                last_entry = offset
+            when = _line_timestamp(line)
+            if when is None:
+                if line.strip():
+                    # Not in the compact form (e.g. default json.dumps separators, or no timestamp,
+                    # which the model stamps as now): never seek past it.
+                    self._max_ts = math.inf
+            elif when > self._max_ts:
+                self._max_ts = when
+            offset += len(line)
+        self._end = offset
+
+
+def _line_timestamp(line: bytes) -> float | None:
+    # The top-level timestamp follows metadata in the record, so search from the end.
+    start = line.rfind(_TIMESTAMP_KEY)
+    if start < 0:
+        return None
+    start += len(_TIMESTAMP_KEY)
+    end = line.find(b'"', start)
+    try:
+        when = datetime.fromisoformat(line[start:end].decode("ascii").replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return (when if when.tzinfo else when.replace(tzinfo=timezone.utc)).timestamp()
+
+
+def _event_to_dict(event: AuditEvent) -> dict[str, Any]:
+    """Build the serialized record in ``AuditEventModel`` field order.
+
+    Unlike ``dataclasses.asdict`` this does not deep-copy ``data_tags`` or ``metadata``.
+    """
+    return {
+        "event_id": event.event_id,
+        "boundary": event.boundary,
+        "action": event.action,
+        "policy_name": event.policy_name,
+        "reason": event.reason,
+        "data_tags": event.data_tags,
+        "agent_id": event.agent_id,
+        "tool_name": event.tool_name,
+        "session_id": event.session_id,
+        "source_agent_id": event.source_agent_id,
+        "destination_agent_id": event.destination_agent_id,
+        "context_hash": event.context_hash,
+        "metadata": event.metadata,
+        "timestamp": event.timestamp,
+        "tokens_in": event.tokens_in,
+        "tokens_out": event.tokens_out,
+        "estimated_cost": event.estimated_cost,
+        "cost_model": event.cost_model,
+        "cost_provider": event.cost_provider,
+    }
+
+
+class _RecordCache:
+    """Decoded records of an append-only log, extended incrementally as it grows.
+
+    Only complete lines are consumed, so a record still being appended is read
+    on a later call. Rotation, truncation, an in-place rewrite (same size, new
+    mtime) or growth past ``max_bytes`` drops the cache.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._reset(None)
+
+    def _reset(self, file_id: tuple[int, int] | None) -> None:
+        self._file_id = file_id
+        self._offset = 0
+        self._mtime_ns: int | None = None
+        self._records: list[dict[str, Any]] = []
+
+    def records_for(self, path: Path) -> list[dict[str, Any]] | None:
+        """Return a snapshot of every record in *path*, or ``None`` if it is too large to cache."""
+        with path.open("rb") as fh:
+            info = os.fstat(fh.fileno())
+            if info.st_size > self._max_bytes:
+                self._reset(None)
+                return None
+            file_id = (info.st_dev, info.st_ino)
+            if (
+                file_id != self._file_id
+                or info.st_size < self._offset
+                or (info.st_size == self._offset and info.st_mtime_ns != self._mtime_ns)
+            ):
+                self._reset(file_id)
+            if info.st_size > self._offset:
+                fh.seek(self._offset)
+                data = fh.read(info.st_size - self._offset)
+                end = data.rfind(b"\n") + 1
+                self._records.extend(_decode_records(data[:end].split(b"\n"), ()))
+                self._offset += end
+            self._mtime_ns = info.st_mtime_ns
+        return self._records.copy()
+
+
+def _decode_records(lines: Iterable[bytes], needles: tuple[bytes, ...]) -> Iterator[dict[str, Any]]:
+    """Decode JSON object records, skipping blank, undecodable and needle-rejected lines."""
+    for raw_line in lines:
+        line = raw_line.strip()
+        if not line:
+            continue
+        if needles and not all(needle in line for needle in needles):
+            continue
+        try:
+            event = _json_loads(line)
+        except Exception:
+            continue
+        if type(event) is dict:
+            yield event
+
+
+def _iter_lines(fh: IO[bytes]) -> Iterator[bytes]:
+    """Yield raw newline-delimited records from the current position in 1 MiB chunks."""
+    pending = b""
+    while chunk := fh.read(_READ_CHUNK_BYTES):
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        yield from lines
+    if pending:
+        yield pending
+
 
 def context_hash(value: Any) -> str:
     """Build a deterministic hash over structured context."""
-    normalized = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
-    return "sha256:" + hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    # The encoder escapes non-ASCII, so the canonical text is already its own byte form.
+    normalized = _HASH_ENCODER.encode(value).encode("ascii")
+    return "sha256:" + hashlib.sha256(normalized).hexdigest()
 
 
 def _normalize_range(
@@ -296,94 +724,142 @@ def _normalize_when(value: str | datetime | None) -> datetime | None:
     return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
 
 
-def _matches_event(
+def _event_matcher(
     *,
-    event: dict[str, Any],
-    boundary: str | None,
-    action: str | None,
-    policy_name: str | None,
-    agent_id: str | None,
-    tool_name: str | None,
-    data_tag: str | None,
+    equals: tuple[tuple[str, str], ...],
+    data_tag_pattern: re.Pattern[str] | None,
     phase: str | None,
-    session_id: str | None,
-    event_id: str | None,
-    source_agent_id: str | None,
-    destination_agent_id: str | None,
     metadata_key: str | None,
     metadata_value: str | None,
     since: datetime | None,
     until: datetime | None,
-) -> bool:
-    metadata = event.get("metadata", {})
-    if not isinstance(metadata, dict):
-        metadata = {}
-
-    if boundary and event.get("boundary") != boundary:
-        return False
-    if action and event.get("action") != action:
-        return False
-    if policy_name and event.get("policy_name") != policy_name:
-        return False
-    if agent_id and event.get("agent_id") != agent_id:
-        return False
-    if tool_name and event.get("tool_name") != tool_name:
-        return False
-    if event_id and event.get("event_id") != event_id:
-        return False
-    if session_id and event.get("session_id") != session_id:
-        return False
-    if source_agent_id and event.get("source_agent_id") != source_agent_id:
-        return False
-    if destination_agent_id and event.get("destination_agent_id") != destination_agent_id:
-        return False
-    if phase and str(metadata.get("phase")) != phase:
-        return False
-    if metadata_key:
-        if metadata_key not in metadata:
-            return False
-        if metadata_value is not None and str(metadata.get(metadata_key)) != metadata_value:
-            return False
-    if data_tag:
-        event_tags = [str(tag) for tag in event.get("data_tags", [])]
-        expanded = expand_tag_hierarchy(event_tags)
-        token = str(data_tag).strip().lower()
-        if token:
-            if token not in expanded:
+    min_cost: float | None = None,
+    max_cost: float | None = None,
+    tenant_id: str | None = None,
+) -> Callable[[dict[str, Any]], bool]:
+    """Bind query filters once and return a per-record predicate.
+
+    Checks run cheapest and most selective first: exact field matches, then
+    metadata, then the time window (parsed only when bounded), then tags, then cost.
+    """
+    check_metadata = bool(phase or metadata_key or tenant_id is not None)
+    check_cost = min_cost is not None or max_cost is not None
+    check_window = bool(since or until)
+    since_key = since.astimezone(timezone.utc).isoformat() if since else None
+    until_key = until.astimezone(timezone.utc).isoformat() if until else None
+
+    def matches(event: dict[str, Any]) -> bool:
+        for field_name, value in equals:
+            if event.get(field_name) != value:
+                return False
+        if check_metadata:
+            metadata = event.get("metadata", {})
+            if not isinstance(metadata, dict):
+                metadata = {}
+            if phase and str(metadata.get("phase")) != phase:
+                return False
+            if tenant_id is not None and metadata.get("tenant_id") != tenant_id:
+                return False
+            if metadata_key:
+                if metadata_key not in metadata:
+                    return False
+                if metadata_value is not None and str(metadata.get(metadata_key)) != metadata_value:
+                    return False
+        if check_window:
+            timestamp = event.get("timestamp")
+            if not timestamp:
+                return False
+            if _is_canonical_utc(timestamp):
+                # Emitted timestamps sort lexicographically in time order; skip parsing them.
+                if since_key and timestamp < since_key:
+                    return False
+                if until_key and timestamp > until_key:
+                    return False
+            else:
+                try:
+                    when = datetime.fromisoformat(str(timestamp).replace("Z", "+00:00"))
+                except ValueError:
+                    return False
+                if not when.tzinfo:
+                    when = when.replace(tzinfo=timezone.utc)
+                if since and when < since:
+                    return False
+                if until and when > until:
+                    return False
+        if data_tag_pattern is not None:
+            if not any(
+                data_tag_pattern.match(_normalize_event_tag(tag)) for tag in event.get("data_tags", [])
+            ):
+                return False
+        if check_cost:
+            cost = event.get("estimated_cost")
+            if cost is None:
+                return False
+            if type(cost) is str:
+                # Numeric text validates as a float, so compare it as one on raw records.
+                try:
+                    cost = float(cost)
+                except ValueError:
+                    return False
+            if min_cost is not None and cost < min_cost:
                 return False
+            if max_cost is not None and cost > max_cost:
+                return False
+        return True
 
-    if since or until:
-        timestamp = event.get("timestamp")
-        if not timestamp:
-            return False
-        try:
-            when = datetime.fromisoformat(str(timestamp).replace("Z", "+00:00"))
-        except ValueError:
-            return False
-        if not when.tzinfo:
-            when = when.replace(tzinfo=timezone.utc)
-        if since and when < since:
-            return False
-        if until and when > until:
-            return False
-    return True
+    return matches
 
 
-def _parse_duration(value: str) -> timedelta:
-    import re
+def _is_canonical_utc(timestamp: Any) -> bool:
+    """Whether *timestamp* has the ``datetime.isoformat()`` shape of a UTC instant.
+
+    ``YYYY-MM-DDTHH:MM:SS[.ffffff]+00:00`` strings compare correctly as text:
+    with equal seconds, ``+`` sorts before ``.`` just as ``:SS`` precedes ``:SS.ffffff``.
+    """
+    return (
+        type(timestamp) is str
+        and len(timestamp) in _CANONICAL_UTC_LENGTHS
+        and timestamp[10] == "T"
+        and timestamp.endswith("+00:00")
+    )
+
 
-    match = re.match(r"^\s*(\d+)\s*([smhdw])\s*$", str(value).lower())
+def _literal_needles(*values: str | None) -> tuple[bytes, ...]:
+    """Build byte needles a raw record must contain to match string-equality filters.
+
+    Only values whose JSON encoding is unambiguous (printable ASCII without
+    escapable characters) are used, so a needle can never reject a match;
+    candidates are still fully checked by the ``_event_matcher`` predicate after decoding.
+    """
+    needles: list[bytes] = []
+    for value in values:
+        if not value or not all(" " <= char <= "~" and char not in '"\\/' for char in value):
+            continue
+        needles.append(b'"' + value.encode("ascii") + b'"')
+    return tuple(needles)
+
+
+def _compile_tag_filter(data_tag: str | Sequence[str] | None) -> re.Pattern[str] | None:
+    """Compile tag filters into one pattern matching each tag or any of its children."""
+    if not data_tag:
+        return None
+    raw = [data_tag] if isinstance(data_tag, str) else list(data_tag)
+    tokens = sorted({str(item).strip().lower() for item in raw} - {""})
+    if not tokens:
+        return None
+    return re.compile("(?:" + "|".join(re.escape(token) for token in tokens) + r")(?:\.|$)")
+
+
+def _normalize_event_tag(tag: Any) -> str:
+    token = str(tag).strip().lower()
+    if ".." in token or token.startswith(".") or token.endswith("."):
+        token = ".".join(part for part in token.split(".") if part)
+    return token
+
+
+@lru_cache(maxsize=64)
+def _parse_duration(value: str) -> timedelta:
+    match = _DURATION_RE.match(str(value).lower())
     if not match:
         raise ValueError(f"Invalid duration '{value}'. Use forms like 30s, 15m, 2h, 7d, 2w.")
-
-    amount = int(match.group(1))
-    unit = match.group(2)
-    if unit == "s":
-        return timedelta(seconds=amount)
-    if unit == "m":
-        return timedelta(minutes=amount)
-    if unit == "h":
-        return timedelta(hours=amount)
-    if unit == "d":
-        return timedelta(days=amount)
-    return timedelta(weeks=amount)
+    return timedelta(seconds=int(match.group(1)) * _UNIT_SECONDS[match.group(2)])
@@ -4,14 +4,68 @@
 
 from __future__ import annotations
 
+import logging
 import re
+import string
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Iterable, Iterator
 
 from safeai.core.models import DetectionModel
 from safeai.detectors import all_detectors
 
+try:
+    from re import _parser as _sre_parse  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover - Python 3.10 only ships sre_parse.
+    import sre_parse as _sre_parse  # type: ignore[no-redef]
 
-@dataclass(frozen=True)
+try:
+    import re2  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - google-re2 is optional.
+    re2 = None
+
+logger = logging.getLogger(__name__)
+
+# RE2 and ``re`` agree on ASCII text except for these characters (``\s`` also covers \v and \x1c-\x1f in ``re``).
+_RE2_DIVERGENT_TEXT = re.compile(r"[^\t\n\f\r\x20-\x7e]")
+# Syntax RE2 accepts but reads differently: ``$`` before a final newline, POSIX classes, ``{,n}``.
+_RE2_DIVERGENT_SYNTAX = ("$", "[:", "{,")
+# Syntax RE2 rejects (``\u``/``\U`` escapes, backreferences, lookarounds); skipped before Add so RE2 logs nothing.
+_RE2_UNSUPPORTED_SYNTAX = re.compile(r"\\[uU1-9]|\(\?<?[=!]")
+_RE2_SAFE_FLAGS = re.IGNORECASE | re.UNICODE
+_SPAN_KEY = attrgetter("start", "end")
+# Texts batched by classify_texts are scanned as one buffer joined by this separator.
+_BATCH_SEPARATOR = "\n"
+# Anchors and lookarounds read text beyond a document's edge, so such patterns scan per text.
+_BOUNDARY_SENSITIVE_SYNTAX = re.compile(r"(?<!\[)\^|\$|\\[AZ]|\(\?<?[=!]")
+_JOINABLE_FLAGS = re.IGNORECASE | re.UNICODE | re.DOTALL
+# Flags that change which characters a first-character class accepts.
+_TRIGGER_FLAGS = re.IGNORECASE | re.ASCII | re.UNICODE
+_CATEGORY_SOURCES = {
+    "CATEGORY_DIGIT": r"\d",
+    "CATEGORY_NOT_DIGIT": r"\D",
+    "CATEGORY_SPACE": r"\s",
+    "CATEGORY_NOT_SPACE": r"\S",
+    "CATEGORY_WORD": r"\w",
+    "CATEGORY_NOT_WORD": r"\W",
+}
+_ZERO_WIDTH_OPS = frozenset({"AT", "ASSERT", "ASSERT_NOT"})
+_REPEAT_OPS = frozenset({"MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT"})
+# Backreferences, conditionals and global inline flags change meaning inside an alternation.
+_UNMERGEABLE_SYNTAX = re.compile(r"\\[1-9]|\(\?P=|\(\?\(|\(\?[aiLmsux]+\)")
+
+
+def _compile(pattern: str | re.Pattern[str]) -> re.Pattern[str]:
+    # Pre-compiled patterns (e.g. from plugins) keep their own flags and are shared as-is.
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    return re.compile(pattern, flags=re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
 class Detection:
     detector: str
     tag: str
@@ -20,25 +74,351 @@ class Detection:
     value: str
 
 
+# A frozen dataclass __init__ routes each field through object.__setattr__; detections
+# are built once per match, so _detection fills the slots directly instead.
+_new_object = object.__new__
+_set_detector, _set_tag, _set_start, _set_end, _set_value = (
+    getattr(Detection, name).__set__ for name in ("detector", "tag", "start", "end", "value")
+)
+
+
+def _detection(detector: str, tag: str, start: int, end: int, value: str) -> Detection:
+    """Build the same ``Detection`` as the constructor, about three times faster."""
+    detection = _new_object(Detection)
+    _set_detector(detection, detector)
+    _set_tag(detection, tag)
+    _set_start(detection, start)
+    _set_end(detection, end)
+    _set_value(detection, value)
+    return detection
+
+
 class Classifier:
     """Runs built-in and custom regex detectors against text."""
 
-    def __init__(self, patterns: list[tuple[str, str, str]] | None = None) -> None:
+    def __init__(self, patterns: list[tuple[str, str, str | re.Pattern[str]]] | None = None) -> None:
         pattern_defs = patterns or all_detectors()
+        for name, tag, _ in pattern_defs:
+            # Spans come from re matches and are always valid, so the detector name and tag
+            # are the only inputs DetectionModel can reject; check them once, up front.
+            DetectionModel(detector=name, tag=tag, start=0, end=0, value="")
         self._compiled: list[tuple[str, str, re.Pattern[str]]] = [
-            (name, tag, re.compile(pattern, flags=re.IGNORECASE)) for name, tag, pattern in pattern_defs
+            # Interned so tag sets built from detections compare against policy and contract tags by identity.
+            (sys.intern(name), sys.intern(tag), _compile(pattern))
+            for name, tag, pattern in pattern_defs
+        ]
+        self._triggers, self._any_trigger = _build_triggers(self._compiled)
+        self._prefilter, self._prefilter_ids = _build_prefilter(self._compiled)
+        self._tag_searches = _build_tag_searches(self._compiled, self._triggers)
+        self._prefiltered = frozenset(self._prefilter_ids)
+        self._joinable = [
+            not (pattern.flags & ~_JOINABLE_FLAGS or _BOUNDARY_SENSITIVE_SYNTAX.search(pattern.pattern))
+            for _, _, pattern in self._compiled
         ]
 
+    @classmethod
+    def default(cls) -> Classifier:
+        """Return the shared classifier over the built-in detectors, compiled on first use.
+
+        A classifier never changes after construction, so one instance is safe to
+        share across requests and threads.
+        """
+        return _default_classifier()
+
     def classify_text(self, text: str) -> list[Detection]:
         detections: list[Detection] = []
-        for name, tag, pattern in self._compiled:
-            for match in pattern.finditer(text):
-                validated = DetectionModel(
-                    detector=name,
-                    tag=tag,
-                    start=match.start(),
-                    end=match.end(),
-                    value=match.group(0),
-                )
-                detections.append(Detection(**validated.model_dump()))
-        return sorted(detections, key=lambda item: (item.start, item.end))
+        runs = 0
+        for name, tag, pattern in self._candidates(text):
+            count = len(detections)
+            detections.extend([_detection(name, tag, *match.span(), match.group()) for match in pattern.finditer(text)])
+            runs += len(detections) > count
+        # finditer yields each pattern's matches in span order, so the list is a
+        # concatenation of sorted runs: Timsort merges them, and a single run needs nothing.
+        if runs > 1:
+            detections.sort(key=_SPAN_KEY)
+        return detections
+
+    def classify_tags(self, text: str) -> set[str]:
+        """Return the tags ``classify_text`` would report, without building detections.
+
+        Each detector stops at its first match, and detectors whose tag was
+        already found do not run. Without the RE2 prefilter, detectors sharing
+        a tag run as one alternation, so the regex engine tries them all in a
+        single scan instead of one Python call each.
+        """
+        tags: set[str] = set()
+        if self._prefilter is not None:
+            for _, tag, pattern in self._candidates(text):
+                if tag not in tags and pattern.search(text) is not None:
+                    tags.add(tag)
+            return tags
+        if self._any_trigger is not None and not self._any_trigger.search(text):
+            return tags
+        present: dict[re.Pattern[str], bool] = {}
+        for tag, pattern, trigger in self._tag_searches:
+            if tag in tags:
+                continue
+            if trigger is not None:
+                found = present.get(trigger)
+                if found is None:
+                    found = present[trigger] = trigger.search(text) is not None
+                if not found:
+                    continue
+            if pattern.search(text) is not None:
+                tags.add(tag)
+        return tags
+
+    def _candidates(self, text: str) -> Iterator[tuple[str, str, re.Pattern[str]]]:
+        """Yield the detectors that can match *text*, in registration order."""
+        if self._any_trigger is not None and not self._any_trigger.search(text):
+            # No character in the text can start a match of any detector.
+            return
+        entries: Iterable[tuple[tuple[str, str, re.Pattern[str]], re.Pattern[str] | None]]
+        entries = zip(self._compiled, self._triggers, strict=True)
+        if self._prefilter is not None and not _RE2_DIVERGENT_TEXT.search(text):
+            # One linear RE2 pass finds which patterns can match; only those run.
+            hits = {self._prefilter_ids[set_id] for set_id in self._prefilter.Match(text) or ()}
+            entries = (
+                entry
+                for index, entry in enumerate(entries)
+                if index in hits or index not in self._prefiltered
+            )
+        # Detectors share a few first-character classes; each is searched at most once per text.
+        present: dict[re.Pattern[str], bool] = {}
+        for entry, trigger in entries:
+            if trigger is not None:
+                found = present.get(trigger)
+                if found is None:
+                    found = present[trigger] = trigger.search(text) is not None
+                if not found:
+                    continue
+            yield entry
+
+    def classify_texts(self, texts: list[str]) -> list[list[Detection]]:
+        """Classify many short texts, returning the same detections as ``classify_text`` per text.
+
+        Boundary-insensitive patterns run once over the texts joined by a newline.
+        A match that crosses a separator is dropped, and the pattern is rerun on each
+        text it touched, so consumed text never hides a match from the next search.
+        """
+        if len(texts) < 2:
+            return [self.classify_text(text) for text in texts]
+        starts: list[int] = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + len(_BATCH_SEPARATOR)
+        joined = _BATCH_SEPARATOR.join(texts)
+        results: list[list[Detection]] = [[] for _ in texts]
+        runs = [0] * len(texts)
+        for (name, tag, pattern), joinable in zip(self._compiled, self._joinable, strict=True):
+            per_text: dict[int, list[Detection]] = {}
+            rescan: set[int] = set()
+            if joinable:
+                for match in pattern.finditer(joined):
+                    start, end = match.span()
+                    index = bisect_right(starts, start) - 1
+                    base = starts[index]
+                    if end > base + len(texts[index]):
+                        rescan.update(range(index, bisect_right(starts, end - 1)))
+                        continue
+                    per_text.setdefault(index, []).append(
+                        _detection(name, tag, start - base, end - base, match.group())
+                    )
+            else:
+                rescan.update(range(len(texts)))
+            for index in rescan:
+                per_text[index] = [
+                    _detection(name, tag, *match.span(), match.group()) for match in pattern.finditer(texts[index])
+                ]
+            for index, found in per_text.items():
+                if found:
+                    results[index].extend(found)
+                    runs[index] += 1
+        for found, count in zip(results, runs, strict=True):
+            if count > 1:
+                found.sort(key=_SPAN_KEY)
+        return results
+
+
+@lru_cache(maxsize=1)
+def _default_classifier() -> Classifier:
+    return Classifier()
+
+
+def _build_triggers(
+    compiled: list[tuple[str, str, re.Pattern[str]]],
+) -> tuple[list[re.Pattern[str] | None], re.Pattern[str] | None]:
+    """Compile, per pattern, a class of the characters any of its matches must start with.
+
+    ``None`` marks patterns that always run: those whose start cannot be described
+    that way, and those whose class accepts letters.
+    The second value is a case-insensitive union of all classes, or ``None`` when
+    any pattern lacks one, so text matching none of them has no detections at all.
+    """
+    triggers: list[re.Pattern[str] | None] = []
+    shared: dict[tuple[str, int], re.Pattern[str]] = {}
+    union: list[str] | None = []
+    for _, _, pattern in compiled:
+        pieces = _first_char_pieces(pattern)
+        if pieces is None:
+            triggers.append(None)
+            union = None
+            continue
+        if union is not None:
+            union.extend(pieces)
+        key = ("[" + "".join(dict.fromkeys(pieces)) + "]", pattern.flags & _TRIGGER_FLAGS)
+        trigger = shared.get(key)
+        if trigger is None:
+            trigger = shared[key] = re.compile(*key)
+        # Nearly all text has letters, so checking a class that accepts one costs more than it saves.
+        triggers.append(None if trigger.search(string.ascii_letters) else trigger)
+    # IGNORECASE only widens a class, so the union over-approximates every trigger.
+    any_trigger = re.compile("[" + "".join(dict.fromkeys(union)) + "]", re.IGNORECASE) if union else None
+    return triggers, any_trigger
+
+
+def _build_tag_searches(
+    compiled: list[tuple[str, str, re.Pattern[str]]],
+    triggers: list[re.Pattern[str] | None],
+) -> list[tuple[str, re.Pattern[str], re.Pattern[str] | None]]:
+    """Merge detectors that share a tag and flags into one alternation per group.
+
+    A text matches the alternation exactly when it matches one of its members.
+    Patterns whose meaning depends on their own group numbering or global flags
+    stay on their own, with their first-character trigger.
+    """
+    members: dict[tuple[str, int], list[tuple[re.Pattern[str], re.Pattern[str] | None]]] = {}
+    for index, ((_, tag, pattern), trigger) in enumerate(zip(compiled, triggers, strict=True)):
+        mergeable = (
+            isinstance(pattern.pattern, str)
+            and not pattern.flags & re.VERBOSE
+            and not _UNMERGEABLE_SYNTAX.search(pattern.pattern)
+        )
+        # Negative keys never collide with flags, so unmergeable patterns form groups of one.
+        members.setdefault((tag, pattern.flags if mergeable else -1 - index), []).append((pattern, trigger))
+    searches: list[tuple[str, re.Pattern[str], re.Pattern[str] | None]] = []
+    for (tag, flags), group in members.items():
+        if len(group) > 1:
+            try:
+                alternation = re.compile("|".join(f"(?:{pattern.pattern})" for pattern, _ in group), flags)
+            except re.error:
+                pass  # e.g. one group name used by two members; search them one by one.
+            else:
+                searches.append((tag, alternation, None))
+                continue
+        searches.extend((tag, pattern, trigger) for pattern, trigger in group)
+    return searches
+
+
+def _first_char_pieces(pattern: re.Pattern[str]) -> list[str] | None:
+    if not isinstance(pattern.pattern, str):
+        return None
+    try:
+        parsed = _sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:  # pragma: no cover - the pattern already compiled.
+        return None
+    pieces: list[str] = []
+    # A pattern that can match the empty string matches every text.
+    if _collect_first_chars(parsed, pieces) is not False:
+        return None
+    return pieces
+
+
+def _collect_first_chars(items: Any, pieces: list[str]) -> bool | None:
+    """Append class sources for the characters that can start a match of *items*.
+
+    Returns ``True`` when *items* can match without consuming a character, ``False``
+    when it cannot, and ``None`` when its first character has no class form.
+    """
+    for op, av in items:
+        kind = op.name
+        if kind in _ZERO_WIDTH_OPS:
+            continue
+        if kind == "LITERAL":
+            pieces.append(re.escape(chr(av)))
+            return False
+        if kind == "IN":
+            source = _class_source(av)
+            if source is None:
+                return None
+            pieces.append(source)
+            return False
+        if kind == "BRANCH":
+            nullable: bool | None = False
+            for branch in av[1]:
+                result = _collect_first_chars(branch, pieces)
+                if result is None:
+                    return None
+                nullable = nullable or result
+        elif kind == "SUBPATTERN":
+            # Scoped flags would need their own class; such groups are rare in detectors.
+            if av[1] or av[2]:
+                return None
+            nullable = _collect_first_chars(av[3], pieces)
+        elif kind == "ATOMIC_GROUP":
+            nullable = _collect_first_chars(av, pieces)
+        elif kind in _REPEAT_OPS:
+            nullable = _collect_first_chars(av[2], pieces)
+            if nullable is False and av[0] == 0:
+                nullable = True
+        else:
+            return None
+        if nullable is None:
+            return None
+        if not nullable:
+            return False
+    return True
+
+
+def _class_source(items: Any) -> str | None:
+    pieces: list[str] = []
+    for op, av in items:
+        kind = op.name
+        if kind == "LITERAL":
+            pieces.append(re.escape(chr(av)))
+        elif kind == "RANGE":
+            pieces.append(f"{re.escape(chr(av[0]))}-{re.escape(chr(av[1]))}")
+        elif kind == "CATEGORY" and av.name in _CATEGORY_SOURCES:
+            pieces.append(_CATEGORY_SOURCES[av.name])
+        else:
+            return None
+    return "".join(pieces)
+
+
+def _build_prefilter(compiled: list[tuple[str, str, re.Pattern[str]]]) -> tuple[Any | None, tuple[int, ...]]:
+    """Compile an RE2 set over the patterns RE2 reads exactly like ``re``.
+
+    Returns the set (``None`` without google-re2) and, per set id, the index of
+    its pattern. Patterns left out always run, so the prefilter only skips work.
+    """
+    if re2 is None:
+        return None, ()
+    options = re2.Options()
+    options.case_sensitive = False
+    prefilter = re2.Set.SearchSet(options)
+    set_ids: list[int] = []
+    for index, (name, _, pattern) in enumerate(compiled):
+        if (
+            pattern.flags & ~_RE2_SAFE_FLAGS
+            or any(token in pattern.pattern for token in _RE2_DIVERGENT_SYNTAX)
+            or _RE2_UNSUPPORTED_SYNTAX.search(pattern.pattern)
+        ):
+            continue
+        try:
+            set_id = prefilter.Add(pattern.pattern)
+        except Exception:
+            logger.debug("Detector %s is not RE2-compatible; it will always run.", name)
+            continue
+        if set_id != len(set_ids):
+            return None, ()
+        set_ids.append(index)
+    if not set_ids:
+        return None, ()
+    try:
+        # Compile() returns None on success and raises on failure.
+        prefilter.Compile()
+    except re2.error:
+        logger.debug("RE2 prefilter failed to compile; all detectors will run.")
+        return None, ()
+    return prefilter, tuple(set_ids)
@@ -4,34 +4,56 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import Any
 
 from safeai.core.models import ToolContractDocumentModel, ToolContractModel
-from safeai.core.policy import expand_tag_hierarchy
+from safeai.core.policy import tag_covered, tag_tokens
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolSideEffects:
     reversible: bool
     requires_approval: bool
     description: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolContract:
     tool_name: str
     description: str | None
-    accepts_tags: set[str]
-    accepts_fields: set[str]
-    emits_tags: set[str]
-    emits_fields: set[str]
-    stores_fields: set[str]
+    accepts_tags: frozenset[str]
+    accepts_fields: frozenset[str]
+    emits_tags: frozenset[str]
+    emits_fields: frozenset[str]
+    stores_fields: frozenset[str]
     stores_retention: str | None
     side_effects: ToolSideEffects
-
-
-@dataclass(frozen=True)
+    _accepted_tags: dict[str, bool] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _emitted_tags: dict[str, bool] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Tag checks compare lowercase tokens against the tag sets as-is.
+        for name in ("accepts_tags", "emits_tags"):
+            tags = getattr(self, name)
+            if type(tags) is not frozenset or any(tag != tag.lower() for tag in tags):
+                object.__setattr__(self, name, frozenset(tag.lower() for tag in tags))
+        for name in ("accepts_fields", "emits_fields", "stores_fields"):
+            fields = getattr(self, name)
+            if type(fields) is not frozenset:
+                object.__setattr__(self, name, frozenset(fields))
+
+    def accepts_tag(self, token: str) -> bool:
+        """Whether normalized tag *token* falls under one of ``accepts_tags``."""
+        return tag_covered(token, self.accepts_tags, self._accepted_tags)
+
+    def emits_tag(self, token: str) -> bool:
+        """Whether normalized tag *token* falls under one of ``emits_tags``."""
+        return tag_covered(token, self.emits_tags, self._emitted_tags)
+
+
+@dataclass(frozen=True, slots=True)
 class ContractValidationResult:
     allowed: bool
     reason: str
@@ -73,22 +95,14 @@ class ToolContractRegistry:
                 contract=contract,
             )
 
-        unauthorized: list[str] = []
-        accepted = {tag.lower() for tag in contract.accepts_tags}
-        for raw_tag in data_tags:
-            token = str(raw_tag).strip().lower()
-            if not token:
-                continue
-            expanded = expand_tag_hierarchy([token])
-            if accepted.intersection(expanded):
-                continue
-            unauthorized.append(token)
+        # Duplicate tags (one per detection) are checked once.
+        unauthorized = sorted(token for token in tag_tokens(data_tags) if not contract.accepts_tag(token))
 
         if unauthorized:
             return ContractValidationResult(
                 allowed=False,
-                reason=f"tool '{tool_name}' does not accept data tags: {','.join(sorted(set(unauthorized)))}",
-                unauthorized_tags=sorted(set(unauthorized)),
+                reason=f"tool '{tool_name}' does not accept data tags: {','.join(unauthorized)}",
+                unauthorized_tags=unauthorized,
                 contract=contract,
             )
 
@@ -125,11 +139,11 @@ def normalize_contracts(raw_items: list[dict[str, Any]]) -> list[ToolContract]:
                 ToolContract(
                     tool_name=name,
                     description=model.description,
-                    accepts_tags={tag.lower() for tag in model.accepts.tags},
-                    accepts_fields=set(model.accepts.fields),
-                    emits_tags={tag.lower() for tag in model.emits.tags},
-                    emits_fields=set(model.emits.fields),
-                    stores_fields=set(model.stores.fields),
+                    accepts_tags=frozenset(sys.intern(tag.lower()) for tag in model.accepts.tags),
+                    accepts_fields=frozenset(model.accepts.fields),
+                    emits_tags=frozenset(sys.intern(tag.lower()) for tag in model.emits.tags),
+                    emits_fields=frozenset(model.emits.fields),
+                    stores_fields=frozenset(model.stores.fields),
                     stores_retention=model.stores.retention,
                     side_effects=ToolSideEffects(
                         reversible=model.side_effects.reversible,
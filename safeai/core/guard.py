@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from string import Formatter
 
 from safeai.core.audit import AuditEvent, AuditLogger
@@ -13,7 +14,7 @@ from safeai.core.policy import PolicyContext, PolicyDecision, PolicyEngine
 from safeai.core.scanner import _apply_text_action
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GuardResult:
     original: str
     safe_output: str
@@ -25,13 +26,37 @@ class GuardResult:
 class OutputGuard:
     """Applies output policy before content leaves the system."""
 
-    def __init__(self, classifier: Classifier, policy_engine: PolicyEngine, audit_logger: AuditLogger) -> None:
+    def __init__(
+        self,
+        classifier: Classifier,
+        policy_engine: PolicyEngine,
+        audit_logger: AuditLogger,
+        *,
+        skip_scan_when_allowed: bool = False,
+    ) -> None:
         self._classifier = classifier
         self._policy_engine = policy_engine
         self._audit = audit_logger
+        # Outputs of agents the policy allows whatever the tags are then go unscanned,
+        # so their results and audit events carry no detections or data tags.
+        self._skip_scan_when_allowed = skip_scan_when_allowed
 
     def guard(self, data: str, agent_id: str = "unknown") -> GuardResult:
-        detections = self._classifier.classify_text(data)
+        if self._scan_is_moot(agent_id):
+            return self._guard_detected(data, [], agent_id)
+        return self._guard_detected(data, self._classifier.classify_text(data), agent_id)
+
+    def guard_many(self, outputs: list[str], agent_id: str = "unknown") -> list[GuardResult]:
+        """Guard several outputs, classifying them in one batched scan."""
+        if self._scan_is_moot(agent_id):
+            return [self._guard_detected(data, [], agent_id) for data in outputs]
+        detections = self._classifier.classify_texts(outputs)
+        return [self._guard_detected(data, found, agent_id) for data, found in zip(outputs, detections, strict=True)]
+
+    def _scan_is_moot(self, agent_id: str) -> bool:
+        return self._skip_scan_when_allowed and self._policy_engine.is_unconditional_allow("output", agent_id)
+
+    def _guard_detected(self, data: str, detections: list[Detection], agent_id: str) -> GuardResult:
         tags = sorted({item.tag for item in detections})
         decision = self._policy_engine.evaluate(
             PolicyContext(boundary="output", data_tags=tags, agent_id=agent_id)
@@ -114,12 +139,41 @@ def _render_fallback_template(
         "data_tags": ",".join(tags),
         "detections": str(len(detections)),
     }
+    compiled = _compile_fallback_template(template)
+    if compiled is not None:
+        segments, tail = compiled
+        return "".join(literal + fields.get(name, "{" + name + "}") for literal, name in segments) + tail
     try:
-        return Formatter().vformat(template, (), _SafeTemplateDict(fields))
+        return template.format_map(_SafeTemplateDict(fields))
     except Exception:
         return template
 
 
+@lru_cache(maxsize=256)
+def _compile_fallback_template(template: str) -> tuple[tuple[tuple[str, str], ...], str] | None:
+    """Split *template* into ``(literal, field)`` pairs and trailing text, once per template.
+
+    Only plain ``{name}`` fields are compiled; conversions, format specs, attribute
+    or index access, and malformed templates return ``None`` and use ``format_map``.
+    """
+    segments: list[tuple[str, str]] = []
+    pending = ""
+    try:
+        parsed = list(Formatter().parse(template))
+    except ValueError:
+        return None
+    for literal, name, spec, conversion in parsed:
+        # Escaped braces arrive as extra literal-only chunks; fold them into the next literal.
+        pending += literal
+        if name is None:
+            continue
+        if not name.isidentifier() or spec or conversion:
+            return None
+        segments.append((pending, name))
+        pending = ""
+    return tuple(segments), pending
+
+
 class _SafeTemplateDict(dict[str, str]):
     def __missing__(self, key: str) -> str:
         return "{" + key + "}"
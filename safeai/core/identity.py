@@ -4,22 +4,36 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+import sys
+from dataclasses import dataclass, field, replace
+from typing import Any, Iterable
 
 from safeai.core.models import AgentIdentityDocumentModel, AgentIdentityModel
-from safeai.core.policy import expand_tag_hierarchy
+from safeai.core.policy import tag_covered, tag_tokens
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentIdentity:
     agent_id: str
     description: str | None
-    tools: set[str]
-    clearance_tags: set[str]
+    tools: frozenset[str]
+    clearance_tags: frozenset[str]
+    _cleared_tags: dict[str, bool] = field(default_factory=dict, init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        if type(self.tools) is not frozenset:
+            object.__setattr__(self, "tools", frozenset(self.tools))
+        # clears_tag compares lowercase tokens against clearance_tags as-is.
+        tags = self.clearance_tags
+        if type(tags) is not frozenset or any(tag != tag.lower() for tag in tags):
+            object.__setattr__(self, "clearance_tags", frozenset(tag.lower() for tag in tags))
 
-@dataclass(frozen=True)
+    def clears_tag(self, token: str) -> bool:
+        """Whether normalized tag *token* falls under one of ``clearance_tags``."""
+        return tag_covered(token, self.clearance_tags, self._cleared_tags)
+
+
+@dataclass(frozen=True, slots=True)
 class AgentIdentityValidationResult:
     allowed: bool
     reason: str
@@ -53,13 +67,35 @@ class AgentIdentityRegistry:
         tool_name: str | None = None,
         data_tags: list[str] | None = None,
     ) -> AgentIdentityValidationResult:
+        return _check_tags(self._check_scope(agent_id, tool_name), tag_tokens(data_tags or ()))
+
+    def validate_many(
+        self,
+        *,
+        agent_id: str,
+        tool_name: str | None = None,
+        tag_sets: Iterable[tuple[str, ...]],
+    ) -> dict[tuple[str, ...], AgentIdentityValidationResult]:
+        """Validate several tag sets for one agent and tool, keyed by tag set.
+
+        The agent and tool binding are resolved once and each distinct tag set is
+        checked once; every result equals what ``validate`` returns for it.
+        """
+        scope = self._check_scope(agent_id, tool_name)
+        results: dict[tuple[str, ...], AgentIdentityValidationResult] = {}
+        for tag_set in tag_sets:
+            if tag_set not in results:
+                results[tag_set] = _check_tags(scope, tag_tokens(tag_set))
+        return results
+
+    def _check_scope(self, agent_id: str, tool_name: str | None) -> AgentIdentity | AgentIdentityValidationResult:
+        """Resolve *agent_id* to an identity bound to *tool_name*, or the result that settles every tag set."""
         token = str(agent_id).strip()
-        tags = list(data_tags or [])
         if not token:
             return AgentIdentityValidationResult(
                 allowed=False,
                 reason="agent identity is required",
-                unauthorized_tags=sorted({str(tag).strip().lower() for tag in tags if str(tag).strip()}),
+                unauthorized_tags=[],
                 identity=None,
             )
 
@@ -76,7 +112,7 @@ class AgentIdentityRegistry:
             return AgentIdentityValidationResult(
                 allowed=False,
                 reason=f"agent '{token}' is not declared",
-                unauthorized_tags=sorted({str(tag).strip().lower() for tag in tags if str(tag).strip()}),
+                unauthorized_tags=[],
                 identity=None,
             )
 
@@ -87,26 +123,34 @@ class AgentIdentityRegistry:
                 unauthorized_tags=[],
                 identity=identity,
             )
+        return identity
 
-        unauthorized = _find_unauthorized_tags(
-            tags=tags,
-            clearance_tags=identity.clearance_tags,
-        )
-        if unauthorized:
-            return AgentIdentityValidationResult(
-                allowed=False,
-                reason=f"agent '{token}' exceeds tag clearance: {','.join(unauthorized)}",
-                unauthorized_tags=unauthorized,
-                identity=identity,
-            )
 
+def _check_tags(
+    scope: AgentIdentity | AgentIdentityValidationResult, tags: set[str]
+) -> AgentIdentityValidationResult:
+    if isinstance(scope, AgentIdentityValidationResult):
+        if not scope.allowed and scope.identity is None:
+            # A missing or undeclared agent is cleared for none of the tags.
+            return replace(scope, unauthorized_tags=sorted(tags))
+        return scope
+
+    unauthorized = _find_unauthorized_tags(tags=tags, identity=scope)
+    if unauthorized:
         return AgentIdentityValidationResult(
-            allowed=True,
-            reason="agent identity allows tool and data scope",
-            unauthorized_tags=[],
-            identity=identity,
+            allowed=False,
+            reason=f"agent '{scope.agent_id}' exceeds tag clearance: {','.join(unauthorized)}",
+            unauthorized_tags=unauthorized,
+            identity=scope,
         )
 
+    return AgentIdentityValidationResult(
+        allowed=True,
+        reason="agent identity allows tool and data scope",
+        unauthorized_tags=[],
+        identity=scope,
+    )
+
 
 def normalize_agent_identities(raw_items: list[dict[str, Any]]) -> list[AgentIdentity]:
     """Normalize YAML/JSON identity documents into runtime objects."""
@@ -130,27 +174,15 @@ def normalize_agent_identities(raw_items: list[dict[str, Any]]) -> list[AgentIde
                 AgentIdentity(
                     agent_id=name,
                     description=model.description,
-                    tools=set(model.tools),
-                    clearance_tags={tag.lower() for tag in model.clearance_tags},
+                    tools=frozenset(model.tools),
+                    clearance_tags=frozenset(sys.intern(tag.lower()) for tag in model.clearance_tags),
                 )
             )
     return identities
 
 
-def _find_unauthorized_tags(*, tags: list[str], clearance_tags: set[str]) -> list[str]:
-    if not tags:
-        return []
-    if not clearance_tags:
+def _find_unauthorized_tags(*, tags: set[str], identity: AgentIdentity) -> list[str]:
+    """Return the normalized *tags* (see ``tag_tokens``) outside the clearance, sorted."""
+    if not tags or not identity.clearance_tags:
         return []
-
-    accepted = {tag.lower() for tag in clearance_tags}
-    unauthorized: set[str] = set()
-    for raw_tag in tags:
-        token = str(raw_tag).strip().lower()
-        if not token:
-            continue
-        expanded = expand_tag_hierarchy([token])
-        if accepted.intersection(expanded):
-            continue
-        unauthorized.add(token)
-    return sorted(unauthorized)
+    return sorted(token for token in tags if not identity.clears_tag(token))
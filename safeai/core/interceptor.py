@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import json
+import math
 from dataclasses import dataclass
 from typing import Any
 
@@ -13,11 +14,17 @@ from safeai.core.audit import AuditEvent, AuditLogger
 from safeai.core.classifier import Classifier
 from safeai.core.contracts import ToolContract, ToolContractRegistry
 from safeai.core.identity import AgentIdentityRegistry
-from safeai.core.policy import PolicyContext, PolicyDecision, PolicyEngine, expand_tag_hierarchy
+from safeai.core.policy import PolicyContext, PolicyDecision, PolicyEngine
 from safeai.secrets.capability import CapabilityTokenManager
 
+# Response values of these types are classified once per distinct value in a response.
+_MEMOIZED_VALUE_TYPES = frozenset({str, int, float, bool})
+# Built once: json.dumps() with keyword options constructs a new encoder per call. Non-ASCII
+# characters stay literal so detectors see the same text in containers as in string fields.
+_VALUE_ENCODER = json.JSONEncoder(sort_keys=True, default=str, ensure_ascii=False)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ToolCall:
     tool_name: str
     agent_id: str
@@ -32,15 +39,16 @@ class ToolCall:
     approval_request_id: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InterceptResult:
     decision: PolicyDecision
+    # The call's own parameters when no field is stripped; treat as read-only.
     filtered_params: dict[str, Any]
     unauthorized_tags: list[str]
     stripped_fields: list[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResponseInterceptResult:
     decision: PolicyDecision
     filtered_response: dict[str, Any]
@@ -67,9 +75,11 @@ class ActionInterceptor:
         self._identities = identity_registry or AgentIdentityRegistry()
         self._capabilities = capability_manager or CapabilityTokenManager()
         self._approvals = approval_manager or ApprovalManager()
-        self._classifier = classifier or Classifier()
+        self._classifier = classifier or Classifier.default()
 
     def intercept_request(self, call: ToolCall) -> InterceptResult:
+        # Sorted once and shared by every metadata dict below; results get their own copy.
+        parameter_keys = sorted(call.parameters)
         if call.capability_token_id:
             capability_validation = self._capabilities.validate(
                 call.capability_token_id,
@@ -79,72 +89,22 @@ class ActionInterceptor:
                 session_id=call.session_id,
             )
             if not capability_validation.allowed:
-                decision = _capability_block_decision(capability_validation.reason)
-                self._audit.emit(
-                    AuditEvent(
-                        boundary="action",
-                        action=decision.action,
-                        policy_name=decision.policy_name,
-                        reason=decision.reason,
-                        data_tags=call.data_tags,
-                        agent_id=call.agent_id,
-                        tool_name=call.tool_name,
-                        session_id=call.session_id,
-                        source_agent_id=call.source_agent_id or call.agent_id,
-                        destination_agent_id=call.destination_agent_id,
-                        metadata={
-                            "phase": "request",
-                            "decision_source": "capability-token",
-                            "action_type": call.action_type or "tool_call",
-                            "capability_token_id": call.capability_token_id,
-                            "capability_action": call.capability_action,
-                            "parameter_keys": sorted(call.parameters.keys()),
-                            "filtered_parameter_keys": [],
-                            "unauthorized_tags": [],
-                            "stripped_fields": sorted(call.parameters.keys()),
-                        },
-                    )
-                )
-                return InterceptResult(
-                    decision=decision,
-                    filtered_params={},
+                return self._block_request(
+                    call,
+                    _capability_block_decision(capability_validation.reason),
+                    decision_source="capability-token",
                     unauthorized_tags=[],
-                    stripped_fields=sorted(call.parameters.keys()),
+                    parameter_keys=parameter_keys,
                 )
 
         contract_validation = self._contracts.validate_request(call.tool_name, call.data_tags)
         if not contract_validation.allowed:
-            decision = _contract_block_decision(contract_validation.reason)
-            self._audit.emit(
-                AuditEvent(
-                    boundary="action",
-                    action=decision.action,
-                    policy_name=decision.policy_name,
-                    reason=decision.reason,
-                    data_tags=call.data_tags,
-                    agent_id=call.agent_id,
-                    tool_name=call.tool_name,
-                    session_id=call.session_id,
-                    source_agent_id=call.source_agent_id or call.agent_id,
-                    destination_agent_id=call.destination_agent_id,
-                    metadata={
-                        "phase": "request",
-                        "decision_source": "tool-contract",
-                    "action_type": call.action_type or "tool_call",
-                    "capability_token_id": call.capability_token_id,
-                    "capability_action": call.capability_action,
-                    "parameter_keys": sorted(call.parameters.keys()),
-                    "filtered_parameter_keys": [],
-                    "unauthorized_tags": contract_validation.unauthorized_tags,
-                        "stripped_fields": sorted(call.parameters.keys()),
-                    },
-                )
-            )
-            return InterceptResult(
-                decision=decision,
-                filtered_params={},
+            return self._block_request(
+                call,
+                _contract_block_decision(contract_validation.reason),
+                decision_source="tool-contract",
                 unauthorized_tags=contract_validation.unauthorized_tags,
-                stripped_fields=sorted(call.parameters.keys()),
+                parameter_keys=parameter_keys,
             )
 
         identity_validation = self._identities.validate(
@@ -153,43 +113,19 @@ class ActionInterceptor:
             data_tags=call.data_tags,
         )
         if not identity_validation.allowed:
-            decision = _identity_block_decision(identity_validation.reason)
-            self._audit.emit(
-                AuditEvent(
-                    boundary="action",
-                    action=decision.action,
-                    policy_name=decision.policy_name,
-                    reason=decision.reason,
-                    data_tags=call.data_tags,
-                    agent_id=call.agent_id,
-                    tool_name=call.tool_name,
-                    session_id=call.session_id,
-                    source_agent_id=call.source_agent_id or call.agent_id,
-                    destination_agent_id=call.destination_agent_id,
-                    metadata={
-                        "phase": "request",
-                        "decision_source": "agent-identity",
-                    "action_type": call.action_type or "tool_call",
-                    "capability_token_id": call.capability_token_id,
-                    "capability_action": call.capability_action,
-                    "parameter_keys": sorted(call.parameters.keys()),
-                    "filtered_parameter_keys": [],
-                    "unauthorized_tags": identity_validation.unauthorized_tags,
-                        "stripped_fields": sorted(call.parameters.keys()),
-                    },
-                )
-            )
-            return InterceptResult(
-                decision=decision,
-                filtered_params={},
+            return self._block_request(
+                call,
+                _identity_block_decision(identity_validation.reason),
+                decision_source="agent-identity",
                 unauthorized_tags=identity_validation.unauthorized_tags,
-                stripped_fields=sorted(call.parameters.keys()),
+                parameter_keys=parameter_keys,
             )
 
         filtered_params, stripped_fields = _filter_allowed_fields(
             call.parameters,
             contract_validation.contract,
             io_direction="accepts",
+            sorted_keys=parameter_keys,
         )
         decision = self._policy_engine.evaluate(
             PolicyContext(
@@ -238,57 +174,20 @@ class ActionInterceptor:
                             reason=validation.reason,
                         )
                     else:
-                        created = self._approvals.create_request(
-                            reason=decision.reason,
-                            policy_name=decision.policy_name or "approval-gate",
-                            agent_id=call.agent_id,
-                            tool_name=call.tool_name,
-                            session_id=call.session_id,
-                            action_type=call.action_type or "tool_call",
-                            data_tags=call.data_tags,
-                            metadata={
-                                "parameter_keys": sorted(call.parameters.keys()),
-                                "source_agent_id": call.source_agent_id or call.agent_id,
-                                "destination_agent_id": call.destination_agent_id,
-                                "approval_source": approval_source,
-                            },
-                            dedupe_key=_approval_dedupe_key(call=call, source=approval_source or "unknown"),
+                        approval_request_id, decision = self._create_approval(
+                            call, decision, source=approval_source, parameter_keys=parameter_keys
                         )
-                        approval_request_id = created.request_id
                         approval_status = "pending"
-                        decision = PolicyDecision(
-                            action="require_approval",
-                            policy_name=created.policy_name or "approval-gate",
-                            reason=f"approval required ({created.request_id})",
-                        )
                 else:
-                    created = self._approvals.create_request(
-                        reason=decision.reason,
-                        policy_name=decision.policy_name or "approval-gate",
-                        agent_id=call.agent_id,
-                        tool_name=call.tool_name,
-                        session_id=call.session_id,
-                        action_type=call.action_type or "tool_call",
-                        data_tags=call.data_tags,
-                        metadata={
-                            "parameter_keys": sorted(call.parameters.keys()),
-                            "source_agent_id": call.source_agent_id or call.agent_id,
-                            "destination_agent_id": call.destination_agent_id,
-                            "approval_source": approval_source,
-                        },
-                        dedupe_key=_approval_dedupe_key(call=call, source=approval_source or "unknown"),
+                    approval_request_id, decision = self._create_approval(
+                        call, decision, source=approval_source, parameter_keys=parameter_keys
                     )
-                    approval_request_id = created.request_id
                     approval_status = "pending"
-                    decision = PolicyDecision(
-                        action="require_approval",
-                        policy_name=created.policy_name or "approval-gate",
-                        reason=f"approval required ({created.request_id})",
-                    )
 
         if decision.action in {"block", "redact", "require_approval"}:
             filtered_params = {}
-            stripped_fields = sorted(set(stripped_fields).union(call.parameters.keys()))
+            # Stripped fields are always parameter keys, so withholding all of them strips every key.
+            stripped_fields = list(parameter_keys)
 
         self._audit.emit(
             AuditEvent(
@@ -308,8 +207,10 @@ class ActionInterceptor:
                     "action_type": call.action_type or "tool_call",
                     "capability_token_id": call.capability_token_id,
                     "capability_action": call.capability_action,
-                    "parameter_keys": sorted(call.parameters.keys()),
-                    "filtered_parameter_keys": sorted(filtered_params.keys()),
+                    "parameter_keys": parameter_keys,
+                    "filtered_parameter_keys": (
+                        parameter_keys if filtered_params is call.parameters else sorted(filtered_params.keys())
+                    ),
                     "unauthorized_tags": [],
                     "stripped_fields": stripped_fields,
                     "approval_required": approval_required,
@@ -328,6 +229,79 @@ class ActionInterceptor:
             stripped_fields=stripped_fields,
         )
 
+    def _create_approval(
+        self,
+        call: ToolCall,
+        decision: PolicyDecision,
+        *,
+        source: str,
+        parameter_keys: list[str],
+    ) -> tuple[str, PolicyDecision]:
+        """File (or reuse) an approval request for *call*; return its id and the pending decision."""
+        created = self._approvals.create_request(
+            reason=decision.reason,
+            policy_name=decision.policy_name or "approval-gate",
+            agent_id=call.agent_id,
+            tool_name=call.tool_name,
+            session_id=call.session_id,
+            action_type=call.action_type or "tool_call",
+            data_tags=call.data_tags,
+            metadata={
+                "parameter_keys": parameter_keys,
+                "source_agent_id": call.source_agent_id or call.agent_id,
+                "destination_agent_id": call.destination_agent_id,
+                "approval_source": source,
+            },
+            dedupe_key=_approval_dedupe_key(call=call, source=source, parameter_keys=parameter_keys),
+        )
+        return created.request_id, PolicyDecision(
+            action="require_approval",
+            policy_name=created.policy_name or "approval-gate",
+            reason=f"approval required ({created.request_id})",
+        )
+
+    def _block_request(
+        self,
+        call: ToolCall,
+        decision: PolicyDecision,
+        *,
+        decision_source: str,
+        unauthorized_tags: list[str],
+        parameter_keys: list[str],
+    ) -> InterceptResult:
+        """Audit and return a request rejected before policy evaluation."""
+        self._audit.emit(
+            AuditEvent(
+                boundary="action",
+                action=decision.action,
+                policy_name=decision.policy_name,
+                reason=decision.reason,
+                data_tags=call.data_tags,
+                agent_id=call.agent_id,
+                tool_name=call.tool_name,
+                session_id=call.session_id,
+                source_agent_id=call.source_agent_id or call.agent_id,
+                destination_agent_id=call.destination_agent_id,
+                metadata={
+                    "phase": "request",
+                    "decision_source": decision_source,
+                    "action_type": call.action_type or "tool_call",
+                    "capability_token_id": call.capability_token_id,
+                    "capability_action": call.capability_action,
+                    "parameter_keys": parameter_keys,
+                    "filtered_parameter_keys": [],
+                    "unauthorized_tags": unauthorized_tags,
+                    "stripped_fields": parameter_keys,
+                },
+            )
+        )
+        return InterceptResult(
+            decision=decision,
+            filtered_params={},
+            unauthorized_tags=unauthorized_tags,
+            stripped_fields=list(parameter_keys),
+        )
+
     def intercept_response(self, call: ToolCall, response: dict[str, Any]) -> ResponseInterceptResult:
         contract = self._contracts.get(call.tool_name)
         if contract is None:
@@ -405,32 +379,59 @@ class ActionInterceptor:
         kept_tags: set[str] = set()
         stripped_field_names: set[str] = set()
         stripped_tag_names: set[str] = set()
-
+        # Repeated scalars (ids, flags, empty strings) are classified once; the
+        # type is part of the key so 1, 1.0 and True stay distinct.
+        value_tags: dict[tuple[type, Any], tuple[set[str], tuple[str, ...]]] = {}
+        classified: list[tuple[str, Any, set[str], tuple[str, ...]]] = []
+        declared_fields = contract.emits_fields
         for field_name, value in response.items():
-            field_tags = _classify_value_tags(self._classifier, value)
-            field_identity_validation = self._identities.validate(
-                agent_id=call.agent_id,
-                tool_name=call.tool_name,
-                data_tags=sorted(field_tags),
-            )
+            if declared_fields and field_name not in declared_fields:
+                # Undeclared fields are stripped whatever they hold, so they are never classified.
+                stripped_field_names.add(field_name)
+                continue
+            value_type = type(value)
+            cached_tags = value_tags.get((value_type, value)) if value_type in _MEMOIZED_VALUE_TYPES else None
+            if cached_tags is None:
+                field_tags = _classify_value_tags(self._classifier, value)
+                tags_key = tuple(sorted(field_tags))
+                if value_type in _MEMOIZED_VALUE_TYPES:
+                    value_tags[(value_type, value)] = (field_tags, tags_key)
+            else:
+                field_tags, tags_key = cached_tags
+            classified.append((field_name, value, field_tags, tags_key))
+
+        # Wide responses repeat a handful of tag sets (often just the empty
+        # one): clearance is checked once per distinct sorted tag tuple, and
+        # field decisions are memoized the same way for the duration of this call.
+        identity_checks = self._identities.validate_many(
+            agent_id=call.agent_id,
+            tool_name=call.tool_name,
+            tag_sets=[tags_key for *_, tags_key in classified],
+        )
+        field_decisions: dict[tuple[str, ...], PolicyDecision] = {}
+
+        for field_name, value, field_tags, tags_key in classified:
+            field_identity_validation = identity_checks[tags_key]
             if not field_identity_validation.allowed:
                 stripped_field_names.add(field_name)
                 stripped_tag_names.update(field_identity_validation.unauthorized_tags)
                 continue
 
-            if _field_blocked_by_contract(contract, field_name, field_tags):
+            if _field_blocked_by_contract(contract, field_tags):
                 stripped_field_names.add(field_name)
                 stripped_tag_names.update(field_tags)
                 continue
 
-            field_decision = self._policy_engine.evaluate(
-                PolicyContext(
-                    boundary="action",
-                    data_tags=sorted(field_tags),
-                    agent_id=call.agent_id,
-                    tool_name=call.tool_name,
+            field_decision = field_decisions.get(tags_key)
+            if field_decision is None:
+                field_decision = field_decisions[tags_key] = self._policy_engine.evaluate(
+                    PolicyContext(
+                        boundary="action",
+                        data_tags=list(tags_key),
+                        agent_id=call.agent_id,
+                        tool_name=call.tool_name,
+                    )
                 )
-            )
             if field_decision.action in {"block", "redact", "require_approval"}:
                 stripped_field_names.add(field_name)
                 stripped_tag_names.update(field_tags)
@@ -525,60 +526,58 @@ def _filter_allowed_fields(
     contract: ToolContract | None,
     *,
     io_direction: str,
+    sorted_keys: list[str],
 ) -> tuple[dict[str, Any], list[str]]:
+    """Split *params* into the contract-allowed mapping and the sorted stripped keys.
+
+    *sorted_keys* is ``sorted(params)``, which the caller already holds; walking it
+    yields the stripped keys in order without sorting them again.
+    """
     if contract is None:
-        return {}, sorted(params.keys())
+        return {}, list(sorted_keys)
 
-    allowed: set[str]
-    if io_direction == "accepts":
-        allowed = set(contract.accepts_fields)
-    else:
-        allowed = set(contract.emits_fields)
+    allowed = contract.accepts_fields if io_direction == "accepts" else contract.emits_fields
 
     if not allowed:
-        return dict(params), []
+        # Nothing is stripped, so the caller's mapping is passed through without a copy.
+        return params, []
 
-    filtered: dict[str, Any] = {}
-    stripped: list[str] = []
-    for key, value in params.items():
-        if key in allowed:
-            filtered[key] = value
-        else:
-            stripped.append(key)
-    return filtered, sorted(stripped)
+    stripped = [key for key in sorted_keys if key not in allowed]
+    if not stripped:
+        return params, stripped
+    filtered = {key: value for key, value in params.items() if key in allowed}
+    return filtered, stripped
 
 
-def _field_blocked_by_contract(contract: ToolContract, field_name: str, field_tags: set[str]) -> bool:
-    if contract.emits_fields and field_name not in contract.emits_fields:
-        return True
-
-    if not field_tags:
+def _field_blocked_by_contract(contract: ToolContract, field_tags: set[str]) -> bool:
+    """Whether a declared field carries a tag outside the contract's ``emits_tags``."""
+    if not field_tags or not contract.emits_tags:
         return False
 
-    accepted = {tag.lower() for tag in contract.emits_tags}
-    if not accepted:
-        return False
-
-    for tag in field_tags:
-        if accepted.intersection(expand_tag_hierarchy([tag])):
-            continue
-        return True
-    return False
+    return not all(contract.emits_tag(tag) for tag in field_tags)
 
 
 def _classify_value_tags(classifier: Classifier, value: Any) -> set[str]:
     if value is None:
         return set()
 
-    if isinstance(value, str):
+    value_type = type(value)
+    if value_type is str:
+        text = value
+    elif value_type is bool:
+        text = "true" if value else "false"
+    elif value_type is int or (value_type is float and math.isfinite(value)):
+        # Same text the JSON encoder produces for plain numbers.
+        text = repr(value)
+    elif isinstance(value, str):
         text = value
     else:
         try:
-            text = json.dumps(value, sort_keys=True, default=str)
+            text = _VALUE_ENCODER.encode(value)
         except TypeError:
             text = str(value)
 
-    return {detection.tag for detection in classifier.classify_text(text)}
+    return classifier.classify_tags(text)
 
 
 def _contract_side_effects_metadata(contract: ToolContract | None) -> dict[str, Any]:
@@ -591,16 +590,15 @@ def _contract_side_effects_metadata(contract: ToolContract | None) -> dict[str,
     }
 
 
-def _approval_dedupe_key(*, call: ToolCall, source: str) -> str:
-    keys = ",".join(sorted(call.parameters.keys()))
-    tags = ",".join(sorted(call.data_tags))
+def _approval_dedupe_key(*, call: ToolCall, source: str, parameter_keys: list[str]) -> str:
+    # *parameter_keys* is already sorted by intercept_request.
     return "|".join(
-        [
+        (
             call.agent_id,
             call.tool_name,
             call.session_id or "-",
             source,
-            tags,
-            keys,
-        ]
+            ",".join(sorted(call.data_tags)),
+            ",".join(parameter_keys),
+        )
     )
@@ -4,13 +4,14 @@
 
 from __future__ import annotations
 
+import heapq
 import json
 import logging
 import re
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 from uuid import uuid4
 
 from cryptography.fernet import Fernet
@@ -20,6 +21,25 @@ from safeai.core.models import MemoryFieldModel, MemorySchemaDocumentModel, Memo
 
 logger = logging.getLogger(__name__)
 
+Clock = Callable[[], datetime]
+
+_DURATION_RE = re.compile(r"^\s*(\d+)\s*([smhdw])\s*$")
+_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+# Expiry heaps are rebuilt from live state once they outgrow it by this factor (and the minimum).
+_HEAP_COMPACT_RATIO = 2
+_HEAP_COMPACT_MIN = 64
+# Reused for handle payloads: json.dumps() builds a new JSONEncoder on every call with non-default options.
+_PAYLOAD_ENCODER = json.JSONEncoder(sort_keys=True, default=str, ensure_ascii=True)
+# Value predicate per declared field type; bool is an int subclass, so numeric checks exclude it.
+_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "string": lambda value: isinstance(value, str),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "list": lambda value: isinstance(value, list),
+    "object": lambda value: isinstance(value, dict),
+}
+
 
 class MemoryValidationError(Exception):
     """Raised when a memory write fails validation in strict mode."""
@@ -69,10 +89,33 @@ class MemoryController:
     _data: dict[str, dict[str, MemoryEntry]] = field(default_factory=dict)
     _handles: dict[str, HandleEntry] = field(default_factory=dict)
     _fernet_key: bytes | None = None
+    clock: Clock | None = field(default=None, repr=False)
     _fernet: Fernet = field(init=False, repr=False)
+    _field_index: dict[str, MemoryFieldModel] = field(init=False, repr=False)
+    _allowed_fields: frozenset[str] = field(init=False, repr=False)
+    _retention_delta: dict[str, timedelta] = field(init=False, repr=False)
+    _field_check: dict[str, Callable[[Any], bool]] = field(init=False, repr=False)
+    # Min-heaps of (expires_at, agent_id, key) and (expires_at, handle_id). Overwritten or dropped
+    # items are left in place and skipped when popped, so purge_expired only visits expired items.
+    _expiry_heap: list[tuple[datetime, str, str]] = field(init=False, repr=False)
+    _handle_expiry_heap: list[tuple[datetime, str]] = field(init=False, repr=False)
+    _heap_limit: int = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         self._fernet = Fernet(self._fernet_key or Fernet.generate_key())
+        self._clock = self.clock or (lambda: datetime.now(timezone.utc))
+        # First declaration wins, matching the order the schema lists its fields in.
+        self._field_index = {}
+        for field_spec in self.schema.fields:
+            self._field_index.setdefault(field_spec.name, field_spec)
+        self._allowed_fields = frozenset(self._field_index)
+        # Retention strings are static per field, so parse them once rather than on every write.
+        self._retention_delta = {
+            name: _parse_duration(spec.retention or self.schema.default_retention)
+            for name, spec in self._field_index.items()
+        }
+        self._field_check = {name: _TYPE_CHECKS[spec.type] for name, spec in self._field_index.items()}
+        self._rebuild_expiry_heaps()
 
     @classmethod
     def from_schema_file(
@@ -80,14 +123,20 @@ class MemoryController:
         path: str | Path,
         *,
         version: str = "v1alpha1",
+        clock: Clock | None = None,
     ) -> "MemoryController":
         loaded = load_memory_documents(path, [Path(path).name], version=version)
         if not loaded:
             raise ValueError(f"No memory definitions found in {path}")
-        return cls.from_documents(loaded)
+        return cls.from_documents(loaded, clock=clock)
 
     @classmethod
-    def from_documents(cls, documents: list[dict[str, Any]]) -> "MemoryController":
+    def from_documents(
+        cls,
+        documents: list[dict[str, Any]],
+        *,
+        clock: Clock | None = None,
+    ) -> "MemoryController":
         if not documents:
             raise ValueError("No memory schema documents provided")
 
@@ -103,13 +152,27 @@ class MemoryController:
             raise ValueError("No memory definitions present after validation")
 
         # MVP uses first memory definition; multi-profile routing is post-MVP.
-        return cls(schema=parsed_definitions[0])
+        return cls(schema=parsed_definitions[0], clock=clock)
 
     @property
-    def allowed_fields(self) -> set[str]:
-        return {field.name for field in self.schema.fields}
+    def allowed_fields(self) -> frozenset[str]:
+        return self._allowed_fields
 
     def write(self, key: str, value: Any, agent_id: str, *, strict: bool = False) -> MemoryWriteResult:
+        return self._write(key, value, agent_id, strict=strict, now=self._clock())
+
+    def write_many(
+        self,
+        entries: Iterable[tuple[str, Any, str]],
+        *,
+        strict: bool = False,
+    ) -> list[MemoryWriteResult]:
+        # Same results as calling write() per (key, value, agent_id) in order, except the batch
+        # shares one retention timestamp. In strict mode earlier entries stay written on a raise.
+        now = self._clock()
+        return [self._write(key, value, agent_id, strict=strict, now=now) for key, value, agent_id in entries]
+
+    def _write(self, key: str, value: Any, agent_id: str, *, strict: bool, now: datetime) -> MemoryWriteResult:
         field_spec = self._field(key)
         if field_spec is None:
             reason = f"Field '{key}' is not defined in memory schema. Allowed fields: {sorted(self.allowed_fields)}"
@@ -117,7 +180,7 @@ class MemoryController:
             if strict:
                 raise MemoryValidationError(reason)
             return MemoryWriteResult(success=False, reason=reason)
-        if not _matches_declared_type(value, field_spec.type):
+        if not self._field_check[key](value):
             reason = f"Type mismatch for field '{key}': expected {field_spec.type}, got {type(value).__name__}"
             logger.warning("memory_write rejected: %s", reason)
             if strict:
@@ -132,7 +195,7 @@ class MemoryController:
                 raise MemoryValidationError(reason)
             return MemoryWriteResult(success=False, reason=reason)
 
-        expiry = _compute_expiry(field_spec.retention or self.schema.default_retention)
+        expiry = now + self._retention_delta[key]
         existing = bucket.get(key)
         if existing and existing.encrypted:
             self._handles.pop(str(existing.value), None)
@@ -153,6 +216,9 @@ class MemoryController:
             tag=field_spec.tag,
             encrypted=field_spec.encrypted,
         )
+        heapq.heappush(self._expiry_heap, (expiry, agent_id, key))
+        if len(self._expiry_heap) + len(self._handle_expiry_heap) > self._heap_limit:
+            self._rebuild_expiry_heaps()
         return MemoryWriteResult(success=True)
 
     def read(self, key: str, agent_id: str) -> MemoryReadResult:
@@ -162,7 +228,7 @@ class MemoryController:
         entry = bucket.get(key)
         if not entry:
             return MemoryReadResult(found=False, reason=f"Key '{key}' not found for agent '{agent_id}'")
-        if entry.expires_at <= datetime.now(timezone.utc):
+        if entry.expires_at <= self._clock():
             self._drop_entry(bucket=bucket, key=key, entry=entry)
             return MemoryReadResult(found=False, reason=f"Key '{key}' expired and was purged")
         return MemoryReadResult(value=entry.value, found=True)
@@ -176,6 +242,7 @@ class MemoryController:
                     count += 1
             self._data.clear()
             self._handles.clear()
+            self._rebuild_expiry_heaps()
             return count
         removed = 0
         bucket = self._data.get(agent_id, {})
@@ -186,20 +253,25 @@ class MemoryController:
         return removed
 
     def purge_expired(self) -> int:
-        now = datetime.now(timezone.utc)
+        now = self._clock()
         purged = 0
-        for agent_id in list(self._data.keys()):
-            bucket = self._data.get(agent_id, {})
-            for key in list(bucket.keys()):
-                entry = bucket[key]
-                if entry.expires_at <= now:
-                    self._drop_entry(bucket=bucket, key=key, entry=entry)
-                    purged += 1
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, agent_id, key = heapq.heappop(heap)
+            bucket = self._data.get(agent_id)
+            if not bucket:
+                continue  # Stale: the agent's bucket was purged.
+            entry = bucket.get(key)
+            if entry is None or entry.expires_at != expires_at:
+                continue  # Stale: the entry was dropped or rewritten with a new expiry.
+            self._drop_entry(bucket=bucket, key=key, entry=entry)
+            purged += 1
             if not bucket:
                 self._data.pop(agent_id, None)
-        for handle_id in list(self._handles.keys()):
-            if self._handles[handle_id].expires_at <= now:
-                self._handles.pop(handle_id, None)
+        handle_heap = self._handle_expiry_heap
+        while handle_heap and handle_heap[0][0] <= now:
+            _, handle_id = heapq.heappop(handle_heap)
+            self._handles.pop(handle_id, None)
         return purged
 
     def handle_metadata(self, handle_id: str) -> dict[str, Any] | None:
@@ -209,7 +281,7 @@ class MemoryController:
         entry = self._handles.get(token)
         if entry is None:
             return None
-        if entry.expires_at <= datetime.now(timezone.utc):
+        if entry.expires_at <= self._clock():
             self._handles.pop(token, None)
             return None
         return {
@@ -225,7 +297,7 @@ class MemoryController:
         entry = self._handles.get(token)
         if entry is None:
             raise KeyError(f"Memory handle '{token}' not found")
-        if entry.expires_at <= datetime.now(timezone.utc):
+        if entry.expires_at <= self._clock():
             self._handles.pop(token, None)
             raise KeyError(f"Memory handle '{token}' expired")
         if entry.agent_id != str(agent_id).strip():
@@ -238,10 +310,19 @@ class MemoryController:
         return payload["value"]
 
     def _field(self, key: str) -> MemoryFieldModel | None:
-        for field_spec in self.schema.fields:
-            if field_spec.name == key:
-                return field_spec
-        return None
+        return self._field_index.get(key)
+
+    def _rebuild_expiry_heaps(self) -> None:
+        self._expiry_heap = [
+            (entry.expires_at, agent_id, key)
+            for agent_id, bucket in self._data.items()
+            for key, entry in bucket.items()
+        ]
+        self._handle_expiry_heap = [(entry.expires_at, handle_id) for handle_id, entry in self._handles.items()]
+        heapq.heapify(self._expiry_heap)
+        heapq.heapify(self._handle_expiry_heap)
+        size = len(self._expiry_heap) + len(self._handle_expiry_heap)
+        self._heap_limit = max(_HEAP_COMPACT_MIN, size * _HEAP_COMPACT_RATIO)
 
     def _drop_entry(self, *, bucket: dict[str, MemoryEntry], key: str, entry: MemoryEntry) -> None:
         bucket.pop(key, None)
@@ -250,7 +331,7 @@ class MemoryController:
 
     def _store_handle(self, *, value: Any, expires_at: datetime, tag: str, agent_id: str) -> str:
         handle_id = f"hdl_{uuid4().hex[:24]}"
-        payload = json.dumps({"value": value}, sort_keys=True, default=str, ensure_ascii=True).encode("utf-8")
+        payload = _PAYLOAD_ENCODER.encode({"value": value}).encode("utf-8")
         ciphertext = self._fernet.encrypt(payload)
         self._handles[handle_id] = HandleEntry(
             ciphertext=ciphertext,
@@ -258,45 +339,20 @@ class MemoryController:
             tag=str(tag).strip().lower(),
             agent_id=str(agent_id).strip(),
         )
+        heapq.heappush(self._handle_expiry_heap, (expires_at, handle_id))
         return handle_id
 
 
-def _compute_expiry(retention: str) -> datetime:
-    return datetime.now(timezone.utc) + _parse_duration(retention)
-
-
 def _parse_duration(value: str) -> timedelta:
-    match = re.match(r"^\s*(\d+)\s*([smhdw])\s*$", str(value).lower())
+    match = _DURATION_RE.match(str(value).lower())
     if not match:
         raise ValueError(f"Invalid retention duration '{value}'. Use forms like 30m, 24h, 7d.")
-
-    amount = int(match.group(1))
-    unit = match.group(2)
-    if unit == "s":
-        return timedelta(seconds=amount)
-    if unit == "m":
-        return timedelta(minutes=amount)
-    if unit == "h":
-        return timedelta(hours=amount)
-    if unit == "d":
-        return timedelta(days=amount)
-    return timedelta(weeks=amount)
+    return timedelta(seconds=int(match.group(1)) * _UNIT_SECONDS[match.group(2)])
 
 
 def _matches_declared_type(value: Any, declared: str) -> bool:
-    if declared == "string":
-        return isinstance(value, str)
-    if declared == "integer":
-        return isinstance(value, int) and not isinstance(value, bool)
-    if declared == "number":
-        return (isinstance(value, int) and not isinstance(value, bool)) or isinstance(value, float)
-    if declared == "boolean":
-        return isinstance(value, bool)
-    if declared == "list":
-        return isinstance(value, list)
-    if declared == "object":
-        return isinstance(value, dict)
-    return False
+    check = _TYPE_CHECKS.get(declared)
+    return check is not None and check(value)
 
 
 def _normalize_handle_id(value: str) -> str | None:
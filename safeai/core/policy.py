@@ -4,18 +4,26 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from threading import RLock
-from typing import Any, Callable, Iterable, Literal
+from typing import AbstractSet, Any, Callable, Iterable, Literal
 
 from safeai.core.models import PolicyDecisionModel, PolicyRuleModel
 
 DecisionAction = Literal["allow", "redact", "block", "require_approval"]
 PolicyRuleLoader = Callable[[], list["PolicyRule"]]
+DecisionKey = tuple[str, tuple[str, ...], str, str | None, str | None, str]
 
+# Evaluations are pure over (rules, context); keep this many recent decisions per engine.
+_DECISION_CACHE_SIZE = 1024
+# Tag tokens remembered per contract or identity by tag_covered.
+_TAG_VERDICT_LIMIT = 4096
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class PolicyContext:
     boundary: str
     data_tags: list[str]
@@ -25,7 +33,7 @@ class PolicyContext:
     tenant_id: str = "default"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PolicyDecision:
     action: DecisionAction
     policy_name: str | None
@@ -34,7 +42,7 @@ class PolicyDecision:
     routing_constraint: list[str] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PolicyRule:
     name: str
     boundary: list[str]
@@ -47,43 +55,135 @@ class PolicyRule:
     allowed_providers: list[str] | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class _CompiledRule:
+    """A rule's conditions as normalized sets plus the decision it returns."""
+
+    tenant_id: str | None
+    data_tags: frozenset[str]
+    tools: frozenset[str]
+    agents: frozenset[str]
+    decision: PolicyDecision
+
+    @classmethod
+    def from_rule(cls, rule: PolicyRule) -> _CompiledRule:
+        cond = rule.condition or {}
+        tools = _coerce_values(cond.get("tools"))
+        if cond.get("tool"):
+            tools.update(_coerce_values(cond.get("tool")))
+        agents = _coerce_values(cond.get("agents"))
+        if cond.get("agent"):
+            agents.update(_coerce_values(cond.get("agent")))
+        validated = PolicyDecisionModel(
+            action=rule.action,
+            policy_name=rule.name,
+            reason=rule.reason,
+            fallback_template=rule.fallback_template,
+            routing_constraint=rule.allowed_providers,
+        )
+        return cls(
+            tenant_id=rule.tenant_id,
+            data_tags=frozenset(_coerce_values(cond.get("data_tags"), lower=True)),
+            tools=frozenset(tools),
+            agents=frozenset(agents),
+            decision=PolicyDecision(**validated.model_dump()),
+        )
+
+    def matches(self, context: PolicyContext, context_tags: AbstractSet[str]) -> bool:
+        if self.tenant_id is not None and self.tenant_id != context.tenant_id:
+            return False
+        if self.data_tags and self.data_tags.isdisjoint(context_tags):
+            return False
+        if self.tools and context.tool_name not in self.tools:
+            return False
+        return not self.agents or context.agent_id in self.agents
+
+
+_DEFAULT_DENY = PolicyDecision(**PolicyDecisionModel(action="block", reason="default deny").model_dump())
+
+
 class PolicyEngine:
     """Deterministic first-match policy evaluator with default deny."""
 
     def __init__(self, rules: list[PolicyRule] | None = None) -> None:
         self._lock = RLock()
-        self._rules: list[PolicyRule] = sorted(rules or [], key=lambda item: item.priority)
+        self._rules: list[PolicyRule] = []
+        # Rules compiled once per rule set and bucketed by boundary, in priority order.
+        self._by_boundary: dict[str, tuple[_CompiledRule, ...]] = {}
         self._reload_callback: PolicyRuleLoader | None = None
         self._watched_files: tuple[Path, ...] = ()
         self._file_mtimes: dict[Path, int] = {}
+        # Memoized decisions for the current rule set; ``_generation`` changes with the rules.
+        self._decisions: dict[DecisionKey, PolicyDecision] = {}
+        self._unconditional: dict[tuple[str, str], bool] = {}
+        self._generation = 0
+        self._set_rules(sorted(rules or [], key=lambda item: item.priority))
 
     def load(self, rules: list[PolicyRule]) -> None:
         with self._lock:
-            self._rules = sorted(rules, key=lambda item: item.priority)
+            self._set_rules(sorted(rules, key=lambda item: item.priority))
 
     def evaluate(self, context: PolicyContext) -> PolicyDecision:
+        key: DecisionKey = (
+            context.boundary,
+            tuple(context.data_tags),
+            context.agent_id,
+            context.tool_name,
+            context.action_type,
+            context.tenant_id,
+        )
         with self._lock:
-            rules = tuple(self._rules)
+            cached = self._decisions.get(key)
+            if cached is not None:
+                return cached
+            rules = self._by_boundary.get(context.boundary, ())
+            generation = self._generation
 
+        decision = self._evaluate_rules(rules, context)
+        with self._lock:
+            # A reload while evaluating bumps the generation; don't cache a stale answer.
+            if generation == self._generation:
+                if len(self._decisions) >= _DECISION_CACHE_SIZE:
+                    del self._decisions[next(iter(self._decisions))]
+                self._decisions[key] = decision
+        return decision
+
+    def is_unconditional_allow(self, boundary: str, agent_id: str = "unknown") -> bool:
+        """Whether *agent_id* is allowed at *boundary* whatever the data tags are.
+
+        True when the first rule that could match (no tool, default tenant) has no
+        ``data_tags`` condition and allows, so ``evaluate`` returns that rule's
+        decision for every tag set. The answer is cached until the rules change.
+        """
+        key = (boundary, agent_id)
+        with self._lock:
+            cached = self._unconditional.get(key)
+            if cached is not None:
+                return cached
+            rules = self._by_boundary.get(boundary, ())
+            generation = self._generation
+
+        context = PolicyContext(boundary=boundary, data_tags=[], agent_id=agent_id)
+        unconditional = False
         for rule in rules:
-            if rule.tenant_id is not None and rule.tenant_id != context.tenant_id:
-                continue
-            if self._matches(rule, context):
-                validated = PolicyDecisionModel(
-                    action=rule.action,
-                    policy_name=rule.name,
-                    reason=rule.reason,
-                    fallback_template=rule.fallback_template,
-                    routing_constraint=rule.allowed_providers,
-                )
-                return PolicyDecision(**validated.model_dump())
-        validated = PolicyDecisionModel(
-            action="block",
-            policy_name=None,
-            reason="default deny",
-            fallback_template=None,
-        )
-        return PolicyDecision(**validated.model_dump())
+            # The rule's own tags satisfy its tag condition: this asks whether any tags could match.
+            if rule.matches(context, rule.data_tags):
+                unconditional = not rule.data_tags and rule.decision.action == "allow"
+                break
+        with self._lock:
+            if generation == self._generation:
+                if len(self._unconditional) >= _DECISION_CACHE_SIZE:
+                    del self._unconditional[next(iter(self._unconditional))]
+                self._unconditional[key] = unconditional
+        return unconditional
+
+    @staticmethod
+    def _evaluate_rules(rules: tuple[_CompiledRule, ...], context: PolicyContext) -> PolicyDecision:
+        context_tags = expand_tag_hierarchy(context.data_tags)
+        for rule in rules:
+            if rule.matches(context, context_tags):
+                return rule.decision
+        return _DEFAULT_DENY
 
     def register_reload(self, files: list[Path], loader: PolicyRuleLoader) -> None:
         watched = tuple(sorted({Path(path).expanduser().resolve() for path in files}, key=str))
@@ -119,36 +219,22 @@ class PolicyEngine:
         fresh_rules = sorted(callback(), key=lambda item: item.priority)
         fresh_mtimes = self._snapshot_mtimes(watched)
         with self._lock:
-            self._rules = fresh_rules
+            self._set_rules(fresh_rules)
             self._file_mtimes = fresh_mtimes
         return True
 
-    def _matches(self, rule: PolicyRule, context: PolicyContext) -> bool:
-        if context.boundary not in rule.boundary:
-            return False
-
-        cond = rule.condition or {}
-
-        data_tags = _coerce_values(cond.get("data_tags"), lower=True)
-        context_tags = expand_tag_hierarchy(context.data_tags)
-        if data_tags and not data_tags.intersection(context_tags):
-            return False
-
-        tools = _coerce_values(cond.get("tools"))
-        tool = cond.get("tool")
-        if tool:
-            tools.update(_coerce_values(tool))
-        if tools and context.tool_name not in tools:
-            return False
-
-        agents = _coerce_values(cond.get("agents"))
-        agent = cond.get("agent")
-        if agent:
-            agents.update(_coerce_values(agent))
-        if agents and context.agent_id not in agents:
-            return False
-
-        return True
+    def _set_rules(self, rules: list[PolicyRule]) -> None:
+        # Caller holds ``_lock``.
+        by_boundary: dict[str, list[_CompiledRule]] = {}
+        for rule in rules:
+            compiled = _CompiledRule.from_rule(rule)
+            for boundary in dict.fromkeys(rule.boundary):
+                by_boundary.setdefault(boundary, []).append(compiled)
+        self._rules = rules
+        self._by_boundary = {boundary: tuple(items) for boundary, items in by_boundary.items()}
+        self._decisions = {}
+        self._unconditional = {}
+        self._generation += 1
 
     @staticmethod
     def _snapshot_mtimes(files: tuple[Path, ...]) -> dict[Path, int]:
@@ -188,15 +274,39 @@ def expand_tag_hierarchy(tags: Iterable[str]) -> set[str]:
     """
     expanded: set[str] = set()
     for raw_tag in tags:
-        tag = _normalize_value(raw_tag, lower=True)
-        if not tag:
-            continue
-        parts = [part for part in tag.split(".") if part]
-        for idx in range(1, len(parts) + 1):
-            expanded.add(".".join(parts[:idx]))
+        expanded.update(expand_tag(raw_tag))
     return expanded
 
 
+def tag_tokens(tags: Iterable[Any]) -> set[str]:
+    """Normalize tags to their distinct non-empty lowercase tokens."""
+    tokens = {_normalize_value(tag, lower=True) for tag in tags}
+    tokens.discard("")
+    return tokens
+
+
+@lru_cache(maxsize=4096)
+def expand_tag(tag: str) -> frozenset[str]:
+    """Cached single-tag form of :func:`expand_tag_hierarchy`."""
+    parts = [part for part in _normalize_value(tag, lower=True).split(".") if part]
+    # Interned like classifier and contract tags, so membership tests hit the identity check.
+    return frozenset(sys.intern(".".join(parts[:idx])) for idx in range(1, len(parts) + 1))
+
+
+def tag_covered(token: str, tags: frozenset[str], verdicts: dict[str, bool]) -> bool:
+    """Whether normalized *token* or one of its parents is in *tags*, memoized in *verdicts*.
+
+    The accepted set of a tag list is every descendant of its entries, which cannot be
+    listed up front; *verdicts* records it one token at a time, up to a fixed size.
+    """
+    verdict = verdicts.get(token)
+    if verdict is None:
+        verdict = not tags.isdisjoint(expand_tag(token))
+        if len(verdicts) < _TAG_VERDICT_LIMIT:
+            verdicts[token] = verdict
+    return verdict
+
+
 def _coerce_values(value: Any, *, lower: bool = False) -> set[str]:
     if value is None:
         return set()
@@ -73,6 +73,12 @@ class InputScanner:
 
 
 def _apply_text_action(text: str, detections: list[Detection], action: str) -> str:
+    """Apply *action* to *text*; ``redact`` masks each detected region once.
+
+    *detections* must be ordered by start, as ``Classifier.classify_text`` returns
+    them. Overlapping spans merge into one region, and the output is assembled in
+    a single left-to-right pass.
+    """
     if action == "allow":
         return text
     if action == "block":
@@ -80,8 +86,21 @@ def _apply_text_action(text: str, detections: list[Detection], action: str) -> s
     if not detections:
         return text
     if action == "redact":
-        out = text
-        for detection in sorted(detections, key=lambda item: item.start, reverse=True):
-            out = out[: detection.start] + "[REDACTED]" + out[detection.end :]
-        return out
+        remaining = iter(detections)
+        first = next(remaining)
+        region_start, region_end = first.start, first.end
+        parts: list[str] = []
+        emitted = 0
+        for detection in remaining:
+            if detection.start < region_end:
+                region_end = max(region_end, detection.end)
+                continue
+            parts.append(text[emitted:region_start])
+            parts.append("[REDACTED]")
+            emitted = region_end
+            region_start, region_end = detection.start, detection.end
+        parts.append(text[emitted:region_start])
+        parts.append("[REDACTED]")
+        parts.append(text[region_end:])
+        return "".join(parts)
     return text
@@ -363,5 +363,4 @@ def _infer_tags(
         return sorted({str(tag).strip().lower() for tag in extractor(payload, safeai=safeai) if str(tag).strip()})
 
     text = json.dumps(payload, sort_keys=True, default=str)
-    detections = safeai.classifier.classify_text(text)
-    return sorted({item.tag for item in detections})
+    return sorted(safeai.classifier.classify_tags(text))
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import importlib.util
 import logging
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from types import ModuleType
@@ -15,7 +16,7 @@ from safeai.config.loader import resolve_files
 
 logger = logging.getLogger(__name__)
 
-DetectorTuple = tuple[str, str, str]
+DetectorTuple = tuple[str, str, str | re.Pattern[str]]
 AdapterFactory = Callable[[Any], Any] | type
 
 
@@ -148,8 +149,9 @@ def _normalize_detectors(value: Any, *, plugin_name: str = "") -> tuple[Detector
             continue
         name = str(item[0]).strip()
         tag = str(item[1]).strip().lower()
-        pattern = str(item[2]).strip()
-        if not name or not tag or not pattern:
+        # Pre-compiled patterns are kept as-is so the classifier can share them.
+        pattern = item[2] if isinstance(item[2], re.Pattern) else str(item[2]).strip()
+        if not name or not tag or not (pattern.pattern if isinstance(pattern, re.Pattern) else pattern):
             logger.debug("Skipped invalid detector in '%s': empty field in (%r, %r, %r)", plugin_name, name, tag, pattern)
             continue
         rows.append((name, tag, pattern))
@@ -4,13 +4,15 @@
 
 from __future__ import annotations
 
+import json
 import tempfile
 import unittest
 from pathlib import Path
 
 from safeai.core.audit import AuditLogger
+from safeai.core.classifier import Classifier
 from safeai.core.contracts import ToolContractRegistry, normalize_contracts
-from safeai.core.interceptor import ActionInterceptor, ToolCall
+from safeai.core.interceptor import ActionInterceptor, ToolCall, _classify_value_tags
 from safeai.core.policy import PolicyEngine, normalize_rules
 
 
@@ -82,13 +84,32 @@ class ActionInterceptorTests(unittest.TestCase):
                 ToolCall(
                     tool_name="send_email",
                     agent_id="agent-1",
-                    parameters={"to": "a@example.com"},
+                    parameters={"to": "a@example.com", "body": "hi"},
                     data_tags=["internal"],
                 )
             )
             self.assertEqual(result.decision.action, "block")
             self.assertEqual(result.filtered_params, {})
             self.assertEqual(result.unauthorized_tags, ["internal"])
+            self.assertEqual(result.stripped_fields, ["body", "to"])
+            metadata = interceptor._audit.query(boundary="action")[0]["metadata"]
+            self.assertEqual(metadata["parameter_keys"], ["body", "to"])
+            self.assertEqual(metadata["stripped_fields"], ["body", "to"])
+            self.assertEqual(
+                list(metadata),
+                [
+                    "phase",
+                    "decision_source",
+                    "action_type",
+                    "capability_token_id",
+                    "capability_action",
+                    "parameter_keys",
+                    "filtered_parameter_keys",
+                    "unauthorized_tags",
+                    "stripped_fields",
+                ],
+            )
+            self.assertEqual(metadata["decision_source"], "tool-contract")
 
     def test_request_filters_fields_by_contract_accepts(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -126,6 +147,55 @@ class ActionInterceptorTests(unittest.TestCase):
             self.assertEqual(result.filtered_params, {"to": "a@example.com", "subject": "hello"})
             self.assertEqual(result.stripped_fields, ["body"])
 
+    def test_request_without_field_limits_passes_parameters_through(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            interceptor = self._build_interceptor(
+                policy_rules=[
+                    {
+                        "name": "allow-action-default",
+                        "boundary": ["action"],
+                        "action": "allow",
+                        "reason": "allow",
+                        "priority": 1000,
+                    }
+                ],
+                contract_registry=_contract_registry(accepts_tags=["internal"], emits_tags=["internal"]),
+                audit_log=Path(tmp_dir) / "audit.jsonl",
+            )
+            parameters = {"to": "a@example.com", "subject": "hello"}
+            result = interceptor.intercept_request(
+                ToolCall(tool_name="send_email", agent_id="agent-1", parameters=parameters, data_tags=["internal"])
+            )
+            self.assertEqual(result.decision.action, "allow")
+            self.assertIs(result.filtered_params, parameters)
+            self.assertEqual(result.stripped_fields, [])
+
+    def test_request_with_only_declared_fields_passes_parameters_through(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            interceptor = self._build_interceptor(
+                policy_rules=[
+                    {
+                        "name": "allow-action-default",
+                        "boundary": ["action"],
+                        "action": "allow",
+                        "reason": "allow",
+                        "priority": 1000,
+                    }
+                ],
+                contract_registry=_contract_registry(
+                    accepts_tags=["internal"], accepts_fields=["to", "subject"], emits_tags=["internal"]
+                ),
+                audit_log=Path(tmp_dir) / "audit.jsonl",
+            )
+            parameters = {"to": "a@example.com", "subject": "hello"}
+            result = interceptor.intercept_request(
+                ToolCall(tool_name="send_email", agent_id="agent-1", parameters=parameters, data_tags=["internal"])
+            )
+            self.assertIs(result.filtered_params, parameters)
+            self.assertEqual(result.stripped_fields, [])
+            metadata = interceptor._audit.query(boundary="action")[0]["metadata"]
+            self.assertEqual(metadata["filtered_parameter_keys"], ["subject", "to"])
+
     def test_response_strips_fields_not_declared_in_contract(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             audit_log = Path(tmp_dir) / "audit.jsonl"
@@ -165,6 +235,14 @@ class ActionInterceptorTests(unittest.TestCase):
             events = logger.query(boundary="action", tool_name="send_email")
             self.assertEqual(events[0]["metadata"]["stripped_fields"], ["message_id"])
 
+            # Undeclared fields are dropped by name before their values are classified.
+            result = interceptor.intercept_response(
+                ToolCall(tool_name="send_email", agent_id="agent-1", parameters={}, data_tags=["internal"]),
+                {"status": "sent", "recipient": "alice@example.com"},
+            )
+            self.assertEqual(result.filtered_response, {"status": "sent"})
+            self.assertEqual((result.stripped_fields, result.stripped_tags), (["recipient"], []))
+
     def test_response_strips_fields_with_unauthorized_emitted_tags(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             interceptor = self._build_interceptor(
@@ -235,6 +313,104 @@ class ActionInterceptorTests(unittest.TestCase):
             self.assertEqual(result.stripped_fields, ["recipient"])
             self.assertIn("personal.pii", result.stripped_tags)
 
+    def test_response_evaluates_each_distinct_field_tag_set_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            interceptor = self._build_interceptor(
+                policy_rules=[
+                    {
+                        "name": "allow-action-default",
+                        "boundary": ["action"],
+                        "action": "allow",
+                        "reason": "allow",
+                        "priority": 1000,
+                    }
+                ],
+                contract_registry=_contract_registry(accepts_tags=["internal"], emits_tags=["personal", "internal"]),
+                audit_log=Path(tmp_dir) / "audit.jsonl",
+            )
+            contexts = []
+            evaluate = interceptor._policy_engine.evaluate
+
+            def recording_evaluate(context):
+                contexts.append(context)
+                return evaluate(context)
+
+            interceptor._policy_engine.evaluate = recording_evaluate  # type: ignore[method-assign]
+            response = {f"status_{index}": "ok" for index in range(20)}
+            response.update({f"email_{index}": f"user{index}@example.com" for index in range(20)})
+            result = interceptor.intercept_response(
+                ToolCall(tool_name="send_email", agent_id="agent-1", parameters={}, data_tags=["internal"]),
+                response,
+            )
+            self.assertEqual(result.filtered_response, response)
+            self.assertEqual(
+                [context.data_tags for context in contexts],
+                [[], ["personal.pii"], ["personal.pii"]],
+            )
+
+    def test_response_classifies_each_distinct_scalar_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            interceptor = self._build_interceptor(
+                policy_rules=[
+                    {
+                        "name": "allow-action-default",
+                        "boundary": ["action"],
+                        "action": "allow",
+                        "reason": "allow",
+                        "priority": 1000,
+                    }
+                ],
+                contract_registry=_contract_registry(accepts_tags=["internal"], emits_tags=["personal", "internal"]),
+                audit_log=Path(tmp_dir) / "audit.jsonl",
+            )
+            texts: list[str] = []
+            classify_tags = interceptor._classifier.classify_tags
+
+            def recording_classify_tags(text):
+                texts.append(text)
+                return classify_tags(text)
+
+            interceptor._classifier.classify_tags = recording_classify_tags  # type: ignore[method-assign]
+            response = {
+                "a": "alice@example.com",
+                "b": "alice@example.com",
+                "c": 1,
+                "d": True,
+                "e": 1.0,
+                "f": 1,
+                "g": ["x"],
+                "h": ["x"],
+            }
+            result = interceptor.intercept_response(
+                ToolCall(tool_name="send_email", agent_id="agent-1", parameters={}, data_tags=["internal"]),
+                response,
+            )
+            self.assertEqual(result.filtered_response, response)
+            self.assertEqual(texts, ["alice@example.com", "1", "true", "1.0", '["x"]', '["x"]'])
+
+    def test_value_classification_scans_the_json_text_of_non_strings(self) -> None:
+        classifier = Classifier()
+        texts: list[str] = []
+        classify_tags = classifier.classify_tags
+
+        def recording_classify_tags(text):
+            texts.append(text)
+            return classify_tags(text)
+
+        classifier.classify_tags = recording_classify_tags  # type: ignore[method-assign]
+        values = [True, False, 4111111111111111, 10**30, 2.5, 1e20, {"b": [1, "x"], "a": None}, ("é",)]
+        for value in values:
+            _classify_value_tags(classifier, value)
+        self.assertEqual(texts[:6], [json.dumps(value) for value in values[:6]])
+        # Containers always go through the stdlib encoder, so the text never depends on what is installed.
+        self.assertEqual(texts[6], json.dumps(values[6], sort_keys=True))
+        self.assertEqual(texts[7], '["é"]')
+        phone = "٥٥٥-١٢٣-٤٥٦٧"
+        self.assertEqual(_classify_value_tags(classifier, {"p": phone}), classify_tags(phone))
+        self.assertEqual(_classify_value_tags(classifier, {"p": phone}), {"personal.pii"})
+        self.assertEqual(_classify_value_tags(classifier, None), set())
+        self.assertEqual(_classify_value_tags(classifier, {"to": "alice@example.com"}), {"personal.pii"})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -87,6 +87,17 @@ class AgentIdentityTests(unittest.TestCase):
         self.assertFalse(result.allowed)
         self.assertEqual(result.unauthorized_tags, ["personal.pii"])
 
+    def test_validate_many_matches_validate_per_tag_set(self) -> None:
+        registry = _identity_registry()
+        tag_sets = [(), ("internal",), ("personal.pii", "secret.token"), ("internal",), ("Secret",)]
+        for agent_id, tool_name in (("ops-bot", "send_email"), ("ops-bot", "shell"), ("unknown", None), (" ", None)):
+            with self.subTest(agent_id=agent_id, tool_name=tool_name):
+                results = registry.validate_many(agent_id=agent_id, tool_name=tool_name, tag_sets=tag_sets)
+                self.assertEqual(list(results), [(), ("internal",), ("personal.pii", "secret.token"), ("Secret",)])
+                for tags, result in results.items():
+                    expected = registry.validate(agent_id=agent_id, tool_name=tool_name, data_tags=list(tags))
+                    self.assertEqual(result, expected)
+
     def test_action_interceptor_blocks_unbound_identity(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             interceptor = ActionInterceptor(
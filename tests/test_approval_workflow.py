@@ -4,9 +4,12 @@
 
 from __future__ import annotations
 
+import os
 import tempfile
 import unittest
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 import yaml
 from click.testing import CliRunner
@@ -14,6 +17,7 @@ from click.testing import CliRunner
 from safeai import SafeAI
 from safeai.cli.init import init_command
 from safeai.cli.main import cli
+from safeai.core import approval as approval_module
 from safeai.core.approval import ApprovalManager
 from safeai.core.audit import AuditLogger
 from safeai.core.contracts import ToolContractRegistry, normalize_contracts
@@ -161,5 +165,131 @@ class ApprovalWorkflowTests(unittest.TestCase):
             self.assertEqual(second.decision.action, "allow")
 
 
+class ApprovalPersistenceTests(unittest.TestCase):
+    def test_load_skips_blank_and_corrupt_lines(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "approvals.log"
+            manager = ApprovalManager(file_path=path)
+            request = manager.create_request(reason="gate", policy_name=None, agent_id="a", tool_name="t")
+            with path.open("ab") as fh:
+                fh.write(b"\n   \n{not json}\n\xff\xfe\n")
+
+            reloaded = ApprovalManager(file_path=path)
+
+            self.assertEqual([row.request_id for row in reloaded.list_requests()], [request.request_id])
+
+    def test_mutations_append_and_reload_keeps_latest_state(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "approvals.log"
+            manager = ApprovalManager(file_path=path)
+            first = manager.create_request(reason="gate", policy_name=None, agent_id="a", tool_name="t")
+            second = manager.create_request(reason="gate", policy_name=None, agent_id="b", tool_name="t")
+            self.assertTrue(manager.approve(first.request_id, approver_id="ops"))
+
+            self.assertEqual(len(path.read_text(encoding="utf-8").splitlines()), 3)
+            reloaded = ApprovalManager(file_path=path)
+            self.assertEqual(reloaded.get(first.request_id).status, "approved")  # type: ignore[union-attr]
+            self.assertEqual(reloaded.get(second.request_id).status, "pending")  # type: ignore[union-attr]
+
+    def test_superseded_lines_are_compacted(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "approvals.log"
+            manager = ApprovalManager(file_path=path)
+            with patch.object(approval_module, "_COMPACT_MIN_LINES", 4), patch.object(
+                approval_module, "_COMPACT_RATIO", 1
+            ):
+                for index in range(3):
+                    request = manager.create_request(
+                        reason="gate", policy_name=None, agent_id=f"agent-{index}", tool_name="t"
+                    )
+                    manager.deny(request.request_id, approver_id="ops")
+
+            lines = path.read_text(encoding="utf-8").splitlines()
+            self.assertLessEqual(len(lines), 4)
+            statuses = {row.agent_id: row.status for row in ApprovalManager(file_path=path).list_requests()}
+            self.assertEqual(statuses, {"agent-0": "denied", "agent-1": "denied", "agent-2": "denied"})
+
+    def test_dedupe_and_filters_follow_status_changes(self) -> None:
+        now = [datetime(2026, 1, 1, tzinfo=timezone.utc)]
+        manager = ApprovalManager(clock=lambda: now[0])
+        first = manager.create_request(reason="gate", policy_name=None, agent_id="a", tool_name="t", dedupe_key="k")
+        self.assertEqual(
+            manager.create_request(reason="gate", policy_name=None, agent_id="a", tool_name="t", dedupe_key="k"),
+            first,
+        )
+        manager.create_request(reason="gate", policy_name=None, agent_id="b", tool_name="t", ttl="1m")
+
+        self.assertTrue(manager.approve(first.request_id, approver_id="ops"))
+        second = manager.create_request(reason="gate", policy_name=None, agent_id="a", tool_name="t", dedupe_key="k")
+        self.assertNotEqual(second.request_id, first.request_id)
+        self.assertEqual([row.request_id for row in manager.list_requests(status="approved")], [first.request_id])
+        self.assertEqual(
+            [row.request_id for row in manager.list_requests(status="pending", agent_id="a")], [second.request_id]
+        )
+
+        now[0] += timedelta(minutes=5)
+        self.assertEqual([row.agent_id for row in manager.list_requests(status="expired")], ["b"])
+        self.assertEqual(manager.list_requests(status="pending", agent_id="b"), [])
+        self.assertEqual(manager.purge_expired(), 1)
+        self.assertEqual(manager.list_requests(agent_id="b"), [])
+
+    def test_reload_detects_appends_that_keep_the_mtime(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "approvals.log"
+            manager = ApprovalManager(file_path=path)
+            manager.create_request(reason="gate", policy_name=None, agent_id="a", tool_name="t")
+            stat = os.stat(path)
+
+            writer = ApprovalManager(file_path=path)
+            added = writer.create_request(reason="gate", policy_name=None, agent_id="b", tool_name="t")
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            self.assertIsNotNone(manager.get(added.request_id))
+
+    def test_reloaded_rows_share_identifier_and_status_strings(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "approvals.log"
+            manager = ApprovalManager(file_path=path)
+            for _ in range(2):
+                manager.create_request(
+                    reason="gate", policy_name=None, agent_id="agent-x", tool_name="send_email", data_tags=[" PII "]
+                )
+
+            first, second = ApprovalManager(file_path=path).list_requests()
+
+            self.assertIs(first.agent_id, second.agent_id)
+            self.assertIs(first.tool_name, second.tool_name)
+            self.assertIs(first.status, second.status)
+            self.assertIs(first.data_tags[0], second.data_tags[0])
+            self.assertEqual(first.data_tags, ["pii"])
+
+    def test_rows_with_non_finite_metadata_survive_a_reload(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "approvals.log"
+            manager = ApprovalManager(file_path=path)
+            request = manager.create_request(
+                reason="gate", policy_name=None, agent_id="a", tool_name="t", metadata={"score": float("nan")}
+            )
+            reloaded = ApprovalManager(file_path=path).get(request.request_id)
+            self.assertIsNotNone(reloaded)
+            self.assertNotEqual(reloaded.metadata["score"], reloaded.metadata["score"])  # type: ignore[union-attr]
+
+    def test_reads_report_expiry_without_writing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "approvals.log"
+            now = [datetime(2026, 1, 1, tzinfo=timezone.utc)]
+            manager = ApprovalManager(file_path=path, clock=lambda: now[0])
+            request = manager.create_request(reason="gate", policy_name=None, agent_id="a", tool_name="t", ttl="1m")
+            before = path.read_bytes()
+
+            now[0] += timedelta(minutes=5)
+            self.assertEqual(manager.get(request.request_id).status, "expired")  # type: ignore[union-attr]
+            self.assertEqual([row.status for row in manager.list_requests(status="expired")], ["expired"])
+            self.assertEqual(path.read_bytes(), before)
+
+            self.assertEqual(manager.purge_expired(), 1)
+            self.assertEqual(path.read_bytes(), b"")
+
+
 if __name__ == "__main__":
     unittest.main()
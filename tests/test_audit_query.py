@@ -4,13 +4,22 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import re
 import tempfile
+import threading
 import unittest
+from dataclasses import replace
+from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 from click.testing import CliRunner
 
+from safeai.cli import logs as logs_cli
 from safeai.cli.logs import logs_command
+from safeai.core import audit as audit_module
 from safeai.core.audit import AuditEvent, AuditLogger
 
 
@@ -62,6 +71,91 @@ class AuditQueryTests(unittest.TestCase):
             rows = logger.query(last="1h")
             self.assertEqual(len(rows), 1)
 
+    def test_query_reads_records_across_chunk_boundaries(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path))
+            for index in range(4):
+                logger.emit(
+                    AuditEvent(
+                        boundary="input",
+                        action="allow",
+                        policy_name="allow-input",
+                        reason="allow",
+                        data_tags=[],
+                        agent_id=f"agent-{index}",
+                    )
+                )
+            with audit_path.open("a", encoding="utf-8") as fh:
+                fh.write("not-json\n\n")
+
+            with patch.object(audit_module, "_READ_CHUNK_BYTES", 7):
+                rows = logger.query(limit=0)
+            self.assertEqual(sorted(row["agent_id"] for row in rows), [f"agent-{i}" for i in range(4)])
+
+    def test_query_literal_prefilter_keeps_matches_and_rechecks_fields(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path))
+            logger.emit(
+                AuditEvent(
+                    boundary="input",
+                    action="allow",
+                    policy_name="allow-input",
+                    reason="agent-2",
+                    data_tags=[],
+                    agent_id="agent-1",
+                )
+            )
+            record = {
+                "event_id": "evt_spaced",
+                "boundary": "input",
+                "action": "block",
+                "reason": "blocked",
+                "agent_id": "agent-2",
+                "context_hash": "sha256:abc",
+            }
+            with audit_path.open("a", encoding="utf-8") as fh:
+                fh.write(json.dumps(record, indent=None, separators=(", ", ": ")) + "\n")
+
+            rows = logger.query(boundary="input", agent_id="agent-2", limit=10)
+            self.assertEqual([row["event_id"] for row in rows], ["evt_spaced"])
+
+    def test_query_filters_raw_records_and_defaults_partial_ones(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path))
+            for cost, tenant in ((0.5, "acme"), (2.0, "acme"), (3.0, "other")):
+                logger.emit(
+                    AuditEvent(
+                        boundary="output",
+                        action="allow",
+                        policy_name=None,
+                        reason="allow",
+                        data_tags=[],
+                        agent_id="agent-1",
+                        metadata={"tenant_id": tenant},
+                        estimated_cost=cost,
+                    )
+                )
+            partial = {
+                "event_id": "evt_partial",
+                "boundary": "output",
+                "action": "allow",
+                "reason": "allow",
+                "context_hash": "sha256:abc",
+                "estimated_cost": "2.5",
+            }
+            with audit_path.open("a", encoding="utf-8") as fh:
+                fh.write(json.dumps(partial) + "\n")
+
+            rows = logger.query(min_cost=1.0, limit=0)
+            self.assertEqual(sorted(row["estimated_cost"] for row in rows), [2.0, 2.5, 3.0])
+            self.assertEqual([row["estimated_cost"] for row in logger.query(tenant_id="acme", min_cost=1.0)], [2.0])
+            unknown = logger.query(agent_id="unknown", limit=0)
+            self.assertEqual([row["event_id"] for row in unknown], ["evt_partial"])
+            self.assertEqual(unknown[0]["data_tags"], [])
+
     def test_logs_cli_query_outputs_json(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             audit_path = Path(temp_dir) / "audit.log"
@@ -119,6 +213,10 @@ class AuditQueryTests(unittest.TestCase):
             self.assertEqual(rows[0]["action"], "redact")
             self.assertEqual(rows[0]["metadata"]["phase"], "response")
 
+            self.assertEqual(len(logger.query(data_tag="personal.pii", limit=10)), 1)
+            self.assertEqual(len(logger.query(data_tag="person", limit=10)), 0)
+            self.assertEqual(len(logger.query(data_tag=("internal", "personal"), limit=10)), 2)
+
     def test_logs_cli_detail_and_metadata_filters(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             audit_path = Path(temp_dir) / "audit.log"
@@ -173,6 +271,448 @@ class AuditQueryTests(unittest.TestCase):
             self.assertIn("id:", detail.output)
             self.assertIn("context_hash:", detail.output)
 
+            pretty = runner.invoke(
+                logs_command,
+                ["--file", str(audit_path), "--detail", row["event_id"], "--pretty"],
+            )
+            self.assertEqual(pretty.exit_code, 0, msg=pretty.output)
+            self.assertIn('\n  "action": "allow"', pretty.output)
+            self.assertEqual(json.loads(pretty.output)["event_id"], row["event_id"])
+
+    def test_logs_cli_json_output_writes_one_event_per_line(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path))
+            for index in range(3):
+                logger.emit(
+                    AuditEvent(
+                        boundary="input",
+                        action="allow",
+                        policy_name="allow-input",
+                        reason="allow",
+                        data_tags=[],
+                        agent_id=f"agent-{index}",
+                    )
+                )
+
+            runner = CliRunner()
+            result = runner.invoke(logs_command, ["--file", str(audit_path), "--tail", "5"])
+
+            self.assertEqual(result.exit_code, 0, msg=result.output)
+            lines = result.output.splitlines()
+            self.assertEqual(len(lines), 3)
+            self.assertEqual(
+                sorted(json.loads(line)["agent_id"] for line in lines),
+                ["agent-0", "agent-1", "agent-2"],
+            )
+
+    def test_logs_cli_batches_large_json_output(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path))
+            for index in range(5):
+                logger.emit(
+                    AuditEvent(
+                        boundary="input",
+                        action="allow",
+                        policy_name="allow-input",
+                        reason="allow",
+                        data_tags=[],
+                        agent_id=f"agent-{index}",
+                    )
+                )
+
+            runner = CliRunner()
+            with patch.object(logs_cli, "_WRITE_BATCH_CHARS", 1):
+                result = runner.invoke(logs_command, ["--file", str(audit_path), "--tail", "10"])
+
+            self.assertEqual(result.exit_code, 0, msg=result.output)
+            self.assertEqual(len(result.output.splitlines()), 5)
+
+
+    def test_time_window_handles_canonical_and_mixed_offset_timestamps(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path))
+            stamps = {
+                "before": "2026-01-01T09:59:59.999999+00:00",
+                "exact": "2026-01-01T10:00:00+00:00",
+                "micro": "2026-01-01T10:00:00.000001+00:00",
+                "zulu": "2026-01-01T10:30:00Z",
+                "offset": "2026-01-01T12:45:00+02:00",
+                "after": "2026-01-01T11:00:00.5+00:00",
+            }
+            for agent_id, timestamp in stamps.items():
+                logger.emit(
+                    AuditEvent(
+                        boundary="input",
+                        action="allow",
+                        policy_name=None,
+                        reason="allow",
+                        data_tags=[],
+                        agent_id=agent_id,
+                        timestamp=timestamp,
+                    )
+                )
+
+            rows = logger.query(since="2026-01-01T10:00:00Z", until="2026-01-01T11:00:00+00:00", limit=0)
+
+            self.assertEqual({row["agent_id"] for row in rows}, {"exact", "micro", "zulu", "offset"})
+
+
+class AuditEmitTests(unittest.TestCase):
+    def _event(self, **overrides: object) -> AuditEvent:
+        fields: dict[str, object] = {
+            "boundary": "input",
+            "action": "allow",
+            "policy_name": "allow-input",
+            "reason": "allow",
+            "data_tags": ["personal.pii"],
+            "agent_id": "agent-1",
+        }
+        fields.update(overrides)
+        return AuditEvent(**fields)  # type: ignore[arg-type]
+
+    def test_emit_skips_model_validation_and_keeps_record_shape(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path))
+            seen: list[dict[str, object]] = []
+            logger.register_on_emit(seen.append)
+            event = self._event()
+
+            with patch.object(audit_module.AuditEventModel, "model_validate") as model_validate:
+                logger.emit(event)
+            model_validate.assert_not_called()
+
+            record = json.loads(audit_path.read_text(encoding="utf-8"))
+            expected = audit_module.AuditEventModel.model_validate(record).model_dump(mode="json")
+            self.assertEqual(list(record), list(expected))
+            self.assertEqual(record, expected)
+            self.assertEqual(seen, [record])
+
+    def test_event_dict_covers_every_model_field_without_copying(self) -> None:
+        event = self._event(metadata={"phase": "input"})
+        payload = audit_module._event_to_dict(event)
+        self.assertEqual(list(payload), list(audit_module.AuditEventModel.model_fields))
+        self.assertIs(payload["metadata"], event.metadata)
+
+    def test_emit_falls_back_to_pydantic_for_non_json_metadata(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path))
+            logger.emit(self._event(metadata={"when": datetime(2026, 1, 2, tzinfo=timezone.utc)}))
+
+            record = json.loads(audit_path.read_text(encoding="utf-8"))
+            self.assertEqual(record["metadata"], {"when": "2026-01-02T00:00:00Z"})
+
+    def test_emit_validates_on_request(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            logger = AuditLogger(str(Path(temp_dir) / "audit.log"))
+            with self.assertRaises(ValueError):
+                logger.emit(self._event(boundary="sideways"), validate=True)
+
+
+class AuditOffsetIndexTests(unittest.TestCase):
+    def _emit(self, logger: AuditLogger, minute: int, agent_id: str) -> None:
+        logger.emit(
+            AuditEvent(
+                boundary="input",
+                action="allow",
+                policy_name="allow-input",
+                reason="allow",
+                data_tags=[],
+                agent_id=agent_id,
+                metadata={"timestamp": "2030-01-01T00:00:00+00:00"},
+                timestamp=f"2026-01-01T00:{minute:02d}:00+00:00",
+            )
+        )
+
+    def test_since_queries_seek_past_older_records(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path))
+            for minute in range(40):
+                self._emit(logger, minute, f"agent-{minute}")
+            # A late-arriving record must still be found even though it sits after newer ones.
+            self._emit(logger, 35, "late")
+            for minute in range(40, 50):
+                self._emit(logger, minute, f"agent-{minute}")
+
+            with patch.object(audit_module, "_INDEX_STRIDE_BYTES", 256):
+                rows = logger.query(since="2026-01-01T00:35:00+00:00", limit=0, newest_first=False)
+                offset = logger._offset_index._entries[-1][1]
+
+            self.assertGreater(offset, 0)
+            self.assertEqual(len(rows), 16)
+            self.assertIn("late", {row["agent_id"] for row in rows})
+            self.assertEqual(rows[0]["timestamp"], "2026-01-01T00:35:00+00:00")
+
+    def test_since_queries_keep_records_the_index_cannot_date(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path))
+            for minute in range(30):
+                self._emit(logger, minute, "old")
+            logger.flush()
+            base = {
+                "event_id": "evt_x",
+                "boundary": "input",
+                "action": "allow",
+                "reason": "allow",
+                "context_hash": "sha256:" + "0" * 64,
+            }
+            # Default json.dumps separators, and no timestamp at all (the model stamps it as now).
+            spaced = {**base, "agent_id": "spaced", "timestamp": "2026-01-01T00:45:00+00:00"}
+            undated = {**base, "agent_id": "undated"}
+            with audit_path.open("a", encoding="utf-8") as fh:
+                fh.write(json.dumps(spaced) + "\n" + json.dumps(undated) + "\n")
+            for minute in range(30):
+                self._emit(logger, minute, "old")
+
+            with patch.object(audit_module, "_INDEX_STRIDE_BYTES", 256):
+                rows = logger.query(since="2026-01-01T00:40:00+00:00", limit=0)
+
+            self.assertEqual({row["agent_id"] for row in rows}, {"spaced", "undated"})
+
+    def test_index_resets_when_the_log_is_replaced(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path))
+            with patch.object(audit_module, "_INDEX_STRIDE_BYTES", 256):
+                for minute in range(30):
+                    self._emit(logger, minute, "old")
+                self.assertEqual(len(logger.query(since="2026-01-01T00:20:00+00:00", limit=0)), 10)
+
+                audit_path.unlink()
+                self._emit(logger, 1, "new")
+                rows = logger.query(since="2026-01-01T00:00:00+00:00", limit=0)
+
+            self.assertEqual([row["agent_id"] for row in rows], ["new"])
+
+
+class AuditWriterTests(unittest.TestCase):
+    def _event(self, agent_id: str) -> AuditEvent:
+        return AuditEvent(
+            boundary="input",
+            action="allow",
+            policy_name=None,
+            reason="allow",
+            data_tags=[],
+            agent_id=agent_id,
+        )
+
+    def test_file_handle_is_reused_and_follows_replaced_logs(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path))
+            logger.emit(self._event("first"))
+            handle = logger._fh
+            logger.emit(self._event("second"))
+            self.assertIs(logger._fh, handle)
+
+            audit_path.unlink()
+            logger.emit(self._event("third"))
+            logger.close()
+
+            self.assertEqual([json.loads(line)["agent_id"] for line in audit_path.read_text().splitlines()], ["third"])
+
+    def test_open_handles_are_closed_at_exit(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path))
+            logger.emit(self._event("first"))
+            handle = logger._fh
+            self.assertIn(logger, audit_module._OPEN_LOGGERS)
+
+            audit_module._close_open_loggers()
+
+            self.assertTrue(handle.closed)
+            self.assertIsNone(logger._fh)
+            logger.emit(self._event("second"))
+            logger.close()
+            self.assertEqual(len(audit_path.read_text().splitlines()), 2)
+
+    def test_rotation_reopens_the_live_log(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path), max_size_mb=0, compress_rotated=False)
+            logger.emit(self._event("first"))
+            logger.emit(self._event("second"))
+            logger.close()
+
+            self.assertEqual(json.loads(audit_path.read_text())["agent_id"], "second")
+            self.assertEqual(json.loads((Path(temp_dir) / "audit.log.1").read_text())["agent_id"], "first")
+
+    def test_event_ids_are_short_random_hex(self) -> None:
+        ids = {self._event("agent-1").event_id for _ in range(100)}
+        self.assertEqual(len(ids), 100)
+        self.assertTrue(all(re.fullmatch(r"evt_[0-9a-f]{12}", event_id) for event_id in ids))
+
+    def test_background_writes_are_flushed_before_queries(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path), background_writes=True)
+            threads = [
+                threading.Thread(target=lambda idx=idx: [logger.emit(self._event(f"agent-{idx}")) for _ in range(50)])
+                for idx in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(len(logger.query(limit=0)), 200)
+            logger.close()
+            lines = audit_path.read_text(encoding="utf-8").splitlines()
+            self.assertEqual(len(lines), 200)
+            self.assertTrue(all(json.loads(line)["boundary"] == "input" for line in lines))
+
+    def test_background_writes_encode_and_notify_on_the_writer_thread(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path), background_writes=True)
+            threads: list[str] = []
+            logger.register_on_emit(lambda record: threads.append(threading.current_thread().name))
+
+            logger.emit(self._event("agent-1"))
+            unencodable = self._event("agent-2")
+            unencodable.metadata["value"] = object()
+            logger.emit(unencodable)
+            logger.flush()
+
+            self.assertEqual(threads, ["safeai-audit-writer"])
+            records = [json.loads(line) for line in audit_path.read_text(encoding="utf-8").splitlines()]
+            self.assertEqual([record["agent_id"] for record in records], ["agent-1"])
+            self.assertTrue(records[0]["context_hash"].startswith("sha256:"))
+            logger.close()
+
+    def test_emit_callbacks_on_the_writer_thread_may_query_flush_and_emit(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path), background_writes=True)
+            seen: list[int] = []
+
+            def on_emit(record: dict) -> None:
+                logger.flush()
+                seen.append(len(logger.query(limit=0)))
+                if record["agent_id"] == "agent-1":
+                    logger.emit(self._event("follow-up"))
+
+            logger.register_on_emit(on_emit)
+            emitter = threading.Thread(target=lambda: (logger.emit(self._event("agent-1")), logger.flush()))
+            emitter.start()
+            emitter.join(timeout=5)
+            self.assertFalse(emitter.is_alive())
+
+            self.assertEqual(seen, [1, 2])
+            self.assertEqual({row["agent_id"] for row in logger.query(limit=0)}, {"agent-1", "follow-up"})
+            logger.close()
+
+    def test_a_failing_background_write_does_not_wedge_later_emits(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path), background_writes=True)
+            with patch.object(logger, "_write_lines", side_effect=RuntimeError("boom")):
+                with self.assertLogs("safeai.core.audit", level="WARNING") as logs:
+                    logger.emit(self._event("lost"))
+                    logger.flush()
+            self.assertIn("unexpected writer error: boom", logs.output[0])
+
+            emitter = threading.Thread(target=lambda: (logger.emit(self._event("kept")), logger.flush()))
+            emitter.start()
+            emitter.join(timeout=5)
+            self.assertFalse(emitter.is_alive())
+            self.assertEqual([row["agent_id"] for row in logger.query(limit=0)], ["kept"])
+            logger.close()
+
+    def test_background_writes_block_emitters_once_the_queue_is_full(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            with patch.object(audit_module, "_MAX_QUEUED_EVENTS", 4):
+                logger = AuditLogger(str(audit_path), background_writes=True)
+            # Stall the writer so at most one batch plus four queued events are accepted.
+            with logger._write_lock:
+                emitter = threading.Thread(target=lambda: [logger.emit(self._event("agent-1")) for _ in range(200)])
+                emitter.start()
+                emitter.join(timeout=0.5)
+                self.assertTrue(emitter.is_alive())
+            emitter.join()
+
+            self.assertEqual(len(logger.query(limit=0)), 200)
+            logger.close()
+
+
+class AuditRecordCacheTests(unittest.TestCase):
+    def _event(self, agent_id: str) -> AuditEvent:
+        return AuditEvent(
+            boundary="input",
+            action="allow",
+            policy_name=None,
+            reason="allow",
+            data_tags=[],
+            agent_id=agent_id,
+        )
+
+    def test_cached_queries_decode_only_appended_records(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path), query_cache_mb=1)
+            logger.emit(self._event("first"))
+            logger.emit(self._event("second"))
+            self.assertEqual(len(logger.query(limit=0)), 2)
+
+            logger.emit(self._event("third"))
+            with patch.object(audit_module, "_json_loads", wraps=json.loads) as decode:
+                rows = logger.query(agent_id="third", limit=0)
+            self.assertEqual([row["agent_id"] for row in rows], ["third"])
+            self.assertEqual(decode.call_count, 1)
+
+    def test_records_with_non_finite_numbers_are_returned(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path), query_cache_mb=1)
+            logger.emit(replace(self._event("nan"), metadata={"score": float("nan"), "cap": float("inf")}))
+            logger.emit(self._event("plain"))
+
+            # msgspec rejects NaN/Infinity; such records must still decode when it is installed.
+            for reader in (logger, AuditLogger(str(audit_path))):
+                rows = reader.query(limit=0)
+                self.assertEqual(sorted(row["agent_id"] for row in rows), ["nan", "plain"])
+
+    def test_cache_resets_when_the_log_is_replaced(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path), query_cache_mb=1)
+            logger.emit(self._event("old"))
+            self.assertEqual(len(logger.query(limit=0)), 1)
+
+            logger.close()
+            audit_path.write_text("", encoding="utf-8")
+            logger.emit(self._event("new"))
+
+            self.assertEqual([row["agent_id"] for row in logger.query(limit=0)], ["new"])
+
+    def test_logs_over_the_cache_limit_are_streamed(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audit_path = Path(temp_dir) / "audit.log"
+            logger = AuditLogger(str(audit_path), query_cache_mb=1)
+            logger.emit(self._event("first"))
+            with patch.object(logger._record_cache, "_max_bytes", 10):
+                rows = logger.query(limit=0)
+            self.assertEqual([row["agent_id"] for row in rows], ["first"])
+            self.assertEqual(logger._record_cache._records, [])
+
+
+class ContextHashTests(unittest.TestCase):
+    def test_context_hash_is_stable_canonical_json(self) -> None:
+        value = {"b": [1, 2], "a": {"when": Path("/tmp/x"), "name": "caf\u00e9"}}
+        canonical = '{"a":{"name":"caf\\u00e9","when":"/tmp/x"},"b":[1,2]}'
+        self.assertEqual(
+            audit_module.context_hash(value),
+            "sha256:" + hashlib.sha256(canonical.encode("utf-8")).hexdigest(),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
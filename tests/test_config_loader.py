@@ -0,0 +1,311 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2026 SafeAI Contributors
+"""Config loader and schema validation tests."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+from safeai.config import loader
+from safeai.config.loader import (
+    PolicySchemaValidationError,
+    load_config,
+    load_policy_bundle,
+    load_yaml_file,
+    load_yaml_header,
+    resolve_files,
+    validate_policy_document,
+)
+from safeai.config.models import SafeAIConfig
+
+_VALID_POLICY = {
+    "version": "v1alpha1",
+    "policies": [
+        {
+            "name": "allow-all",
+            "boundary": ["input"],
+            "priority": 10,
+            "condition": {},
+            "action": "allow",
+            "reason": "allow",
+        }
+    ],
+}
+
+
+class SchemaValidationCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        loader._VALIDATION_CACHE.clear()
+
+    def test_identical_documents_are_validated_once(self) -> None:
+        with patch.object(loader, "_collect_schema_errors", wraps=loader._collect_schema_errors) as collect:
+            validate_policy_document(dict(_VALID_POLICY), Path("a.yaml"))
+            validate_policy_document(dict(_VALID_POLICY), Path("b.yaml"))
+        self.assertEqual(collect.call_count, 1)
+
+    def test_cached_errors_are_reported_per_source(self) -> None:
+        invalid = {"version": "v1alpha1", "policies": [{"name": "broken"}]}
+        for source in ("first.yaml", "second.yaml"):
+            with self.assertRaises(PolicySchemaValidationError) as ctx:
+                validate_policy_document(invalid, Path(source))
+            self.assertIn(source, str(ctx.exception))
+            self.assertIn("additional error(s)", str(ctx.exception))
+
+    def test_first_error_and_count_match_a_full_sort(self) -> None:
+        invalid = {"version": "v1alpha1", "policies": [{"name": "a"}, {"name": "b", "action": 3}], "extra": 1}
+        validator = loader._schema_validator("policy", "v1alpha1")
+        expected = sorted(
+            (loader._format_json_path(err.absolute_path), err.message) for err in validator.iter_errors(invalid)
+        )
+        self.assertGreater(len(expected), 2)
+        self.assertEqual(loader._collect_schema_errors(validator, invalid), (len(expected), expected[0]))
+
+    def test_non_json_documents_skip_the_cache(self) -> None:
+        document = {"version": "v1alpha1", "policies": [], "created": date(2026, 1, 1)}
+        with self.assertRaises(PolicySchemaValidationError):
+            validate_policy_document(document, Path("dated.yaml"))
+        self.assertEqual(loader._VALIDATION_CACHE, {})
+
+
+    def test_documents_with_non_string_keys_skip_the_cache(self) -> None:
+        messages = []
+        for key in ("1", 1):
+            document = {"version": "v1alpha1", "policies": [{**_VALID_POLICY["policies"][0], "condition": {key: "x"}}]}
+            with self.assertRaises(PolicySchemaValidationError) as ctx:
+                validate_policy_document(document, Path("keys.yaml"))
+            messages.append(str(ctx.exception))
+        # JSON would render both keys as "1"; the int key must not reuse the string key's result.
+        self.assertIn("('1' was unexpected)", messages[0])
+        self.assertIn("(1 was unexpected)", messages[1])
+        self.assertEqual(len(loader._VALIDATION_CACHE), 1)
+
+class SchemaLoadingTests(unittest.TestCase):
+    def test_bundled_schemas_cover_every_document_kind(self) -> None:
+        bundled = loader._bundled_schemas()
+        for name in ("policy", "memory", "tool-contract", "agent-identity"):
+            self.assertIn((name, "v1alpha1"), bundled)
+
+    def test_validator_uses_bundled_schema_without_project_copy(self) -> None:
+        loader._schema_validator.cache_clear()
+        try:
+            with patch.object(loader, "_PROJECT_SCHEMA_DIR", Path("/nonexistent-safeai-schemas")):
+                validator = loader._schema_validator("policy", "v1alpha1")
+            self.assertIs(validator.schema, loader._bundled_schemas()[("policy", "v1alpha1")])
+        finally:
+            loader._schema_validator.cache_clear()
+
+    def test_rust_validator_backend_is_opt_in(self) -> None:
+        class _Error:
+            instance_path = ["policies", 0]
+            message = "'name' is a required property"
+
+        class _FakeValidator:
+            def __init__(self, schema: dict[str, object]) -> None:
+                self.schema = schema
+
+            def iter_errors(self, instance: object) -> list[_Error]:
+                return [_Error()]
+
+        fake_module = type("jsonschema_rs", (), {"Draft202012Validator": _FakeValidator})
+        loader._schema_validator.cache_clear()
+        try:
+            with patch.dict("sys.modules", {"jsonschema_rs": fake_module}), patch.dict(
+                "os.environ", {"SAFEAI_SCHEMA_VALIDATOR": "rs"}
+            ):
+                validator = loader._schema_validator("policy", "v1alpha1")
+                errors = loader._collect_schema_errors(validator, {})
+            self.assertIsInstance(validator, _FakeValidator)
+            self.assertEqual(errors, (1, ("$.policies[0]", "'name' is a required property")))
+        finally:
+            loader._schema_validator.cache_clear()
+
+
+class YamlLoadTests(unittest.TestCase):
+    def test_mapping_keys_are_interned_across_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = [Path(tmp_dir) / name for name in ("a.yaml", "b.yaml")]
+            for path in paths:
+                path.write_text("policies:\n  - name: x\n    priority: 1\n    1: numeric\n", encoding="utf-8")
+
+            first, second = (load_yaml_file(path)["policies"][0] for path in paths)
+
+            for key_a, key_b in zip(first, second, strict=True):
+                if isinstance(key_a, str):
+                    self.assertIs(key_a, key_b)
+            self.assertEqual(first[1], "numeric")
+
+
+class YamlHeaderTests(unittest.TestCase):
+    def test_reads_requested_top_level_scalars_and_stops_early(self) -> None:
+        # The trailing malformed line proves parsing stops once every key is found.
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "safeai.yaml"
+            path.write_text(
+                "\n".join(
+                    [
+                        "paths:",
+                        "  policy_files: [policies/default.yaml]",
+                        "version: v1alpha1",
+                        "count: 12",
+                        'quoted: "12"',
+                        "broken: [unterminated",
+                    ]
+                ),
+                encoding="utf-8",
+            )
+
+            self.assertEqual(load_yaml_header(path, ["version"]), {"version": "v1alpha1"})
+            self.assertEqual(
+                load_yaml_header(path, ["count", "quoted"]),
+                {"count": 12, "quoted": "12"},
+            )
+
+
+class ConfigDefaultsTests(unittest.TestCase):
+    def test_load_config_reparses_only_when_the_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "safeai.yaml"
+            path.write_text("version: v1alpha1\npaths:\n  policy_files: [p.yaml]\n", encoding="utf-8")
+            with patch.object(loader, "load_yaml_file", wraps=loader.load_yaml_file) as parse:
+                first = load_config(path)
+                second = load_config(path)
+                self.assertEqual(parse.call_count, 1)
+                self.assertIsNot(first, second)
+                first.paths.policy_files.append("extra.yaml")
+                self.assertEqual(load_config(path).paths.policy_files, ["p.yaml"])
+
+                path.write_text("version: v1alpha1\naudit:\n  max_size_mb: 50\n", encoding="utf-8")
+                self.assertEqual(load_config(path).audit.max_size_mb, 50)
+                self.assertEqual(parse.call_count, 2)
+
+    def test_default_dashboard_users_are_not_shared(self) -> None:
+        first, second = SafeAIConfig(), SafeAIConfig()
+        self.assertEqual([user.role for user in first.dashboard.users], ["admin", "approver", "auditor", "viewer"])
+        first.dashboard.users[1].tenants.append("tenant-b")
+        self.assertEqual(second.dashboard.users[1].tenants, ["default"])
+
+
+class ResolveFilesTests(unittest.TestCase):
+    def test_resolves_patterns_like_recursive_glob(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            for rel in ("policies/a.yaml", "policies/nested/b.yaml", "policies/.hidden.yaml", "other.txt"):
+                (root / rel).parent.mkdir(parents=True, exist_ok=True)
+                (root / rel).write_text("version: v1alpha1\n", encoding="utf-8")
+            config = root / "safeai.yaml"
+
+            files = resolve_files(config, ["policies/*.yaml", "policies/**/*.yaml", "missing/*.yaml"])
+
+            resolved = root.resolve()
+            self.assertEqual(
+                files,
+                [resolved / "policies" / "a.yaml", resolved / "policies" / "nested" / "b.yaml"],
+            )
+
+
+    def test_symlinked_directories_and_files_resolve_to_their_targets(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            shared = root / "shared"
+            shared.mkdir()
+            (shared / "a.yaml").write_text("version: v1alpha1\n", encoding="utf-8")
+            (root / "policies").symlink_to(shared, target_is_directory=True)
+            (root / "extra").mkdir()
+            (root / "extra" / "link.yaml").symlink_to(shared / "a.yaml")
+            (root / "extra" / "dangling.yaml").symlink_to(root / "missing.yaml")
+
+            files = resolve_files(root / "safeai.yaml", ["policies/*.yaml", "extra/*.yaml", "../*/shared/*.yaml"])
+
+            self.assertEqual(files, [(shared / "a.yaml").resolve()])
+
+
+    def test_results_are_reused_until_a_consulted_directory_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            policies = root / "policies"
+            policies.mkdir()
+            (policies / "a.yaml").write_text("version: v1alpha1\n", encoding="utf-8")
+            for directory in (root, policies):
+                os.utime(directory, ns=(1_000_000_000, 1_000_000_000))
+            config = root / "safeai.yaml"
+
+            first = resolve_files(config, ["policies/*.yaml"])
+            with patch.object(loader.os, "scandir", wraps=os.scandir) as scandir:
+                self.assertEqual(resolve_files(config, ["policies/*.yaml"]), first)
+                self.assertEqual(scandir.call_count, 0)
+
+                (policies / "b.yaml").write_text("version: v1alpha1\n", encoding="utf-8")
+                self.assertEqual([path.name for path in resolve_files(config, ["policies/*.yaml"])], ["a.yaml", "b.yaml"])
+                self.assertEqual(scandir.call_count, 1)
+
+
+class LoadBundleTests(unittest.TestCase):
+    def _write_policy(self, path: Path, name: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            "\n".join(
+                [
+                    "version: v1alpha1",
+                    "policies:",
+                    f"  - name: {name}",
+                    "    boundary: [input]",
+                    "    priority: 10",
+                    "    condition: {}",
+                    "    action: allow",
+                    "    reason: allow",
+                ]
+            ),
+            encoding="utf-8",
+        )
+
+    def test_empty_pattern_list_does_no_work(self) -> None:
+        with patch.object(loader, "_DirectoryWalker") as walker:
+            self.assertEqual(resolve_files("missing/safeai.yaml", []), [])
+            self.assertEqual(load_policy_bundle("missing/safeai.yaml", []), ([], []))
+        walker.assert_not_called()
+
+    def test_multi_file_bundle_keeps_file_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            names = [f"rule-{idx:02d}" for idx in range(12)]
+            for name in names:
+                self._write_policy(root / "policies" / f"{name}.yaml", name)
+
+            files, docs = load_policy_bundle(root / "safeai.yaml", ["policies/*.yaml"])
+
+            self.assertEqual([path.stem for path in files], names)
+            self.assertEqual([doc["name"] for doc in docs], names)
+
+    def test_multi_file_bundle_raises_first_error_in_file_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            self._write_policy(root / "policies" / "a.yaml", "rule-a")
+            (root / "policies" / "b.yaml").write_text("version: v1alpha1\npolicies: []\n", encoding="utf-8")
+            (root / "policies" / "c.yaml").write_text("- not\n- a mapping\n", encoding="utf-8")
+
+            with self.assertRaises(PolicySchemaValidationError) as ctx:
+                load_policy_bundle(root / "safeai.yaml", ["policies/*.yaml"])
+            self.assertIn("b.yaml", str(ctx.exception))
+
+
+class ExtractDocumentsTests(unittest.TestCase):
+    def test_versioned_wrappers_are_built_only_for_present_payloads(self) -> None:
+        document = {"version": "v1alpha1", "memory": {"name": "m"}, "memories": []}
+        self.assertEqual(
+            loader._extract_memory_documents(document),
+            [{"version": "v1alpha1", "memory": {"name": "m"}}],
+        )
+        self.assertEqual(
+            loader._extract_identity_documents({"agents": [{"agent_id": "a"}]}),
+            [{"version": "v1alpha1", "agents": [{"agent_id": "a"}]}],
+        )
+        self.assertEqual(loader._extract_contract_documents({"version": "v1alpha1"}), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
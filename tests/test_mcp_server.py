@@ -126,6 +126,18 @@ class McpCliTests(unittest.TestCase):
         self.assertEqual(result.exit_code, 0)
         self.assertIn("MCP server", result.output)
 
+    def test_run_falls_back_to_asyncio_without_uvloop(self) -> None:
+        from safeai.cli.mcp import _run
+
+        calls: list[str] = []
+
+        async def _serve() -> None:
+            calls.append("served")
+
+        with patch.dict("sys.modules", {"uvloop": None}):
+            _run(_serve())
+        self.assertEqual(calls, ["served"])
+
 
 if __name__ == "__main__":
     unittest.main()
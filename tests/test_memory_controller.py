@@ -6,10 +6,11 @@ from __future__ import annotations
 
 import tempfile
 import unittest
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from safeai import SafeAI
-from safeai.core.memory import MemoryController
+from safeai.core.memory import MemoryController, _matches_declared_type
 
 
 def _memory_docs(default_retention: str = "1h") -> list[dict]:
@@ -41,6 +42,9 @@ class MemoryControllerTests(unittest.TestCase):
     def test_write_rejects_unknown_fields(self) -> None:
         memory = MemoryController.from_documents(_memory_docs())
         self.assertFalse(memory.write("unknown_key", "value", agent_id="agent-1"))
+        self.assertEqual(memory.allowed_fields, {"nickname", "age"})
+        self.assertIs(memory.allowed_fields, memory.allowed_fields)
+        self.assertIn("['age', 'nickname']", memory.write("other", 1, agent_id="agent-1").reason)
 
     def test_write_rejects_type_mismatch(self) -> None:
         memory = MemoryController.from_documents(_memory_docs())
@@ -48,6 +52,27 @@ class MemoryControllerTests(unittest.TestCase):
         result = memory.read("age", agent_id="agent-1")
         self.assertFalse(result.found)
 
+    def test_declared_type_checks_reject_bool_for_numeric_fields(self) -> None:
+        samples = ["x", 1, 1.5, True, [1], {"a": 1}, None]
+        expected = {
+            "string": ["x"],
+            "integer": [1],
+            "number": [1, 1.5],
+            "boolean": [True],
+            "list": [[1]],
+            "object": [{"a": 1}],
+        }
+        docs = _memory_docs()
+        docs[0]["memory"]["max_entries"] = 10
+        docs[0]["memory"]["fields"] = [{"name": declared, "type": declared, "tag": "internal"} for declared in expected]
+        memory = MemoryController.from_documents(docs)
+        for declared, accepted in expected.items():
+            with self.subTest(declared=declared):
+                written = [value for value in samples if memory.write(declared, value, agent_id="agent-1")]
+                self.assertEqual(written, accepted)
+                self.assertEqual([value for value in samples if _matches_declared_type(value, declared)], accepted)
+        self.assertFalse(_matches_declared_type("x", "bytes"))
+
     def test_max_entries_is_enforced(self) -> None:
         memory = MemoryController.from_documents(
             [
@@ -69,7 +94,22 @@ class MemoryControllerTests(unittest.TestCase):
         self.assertTrue(memory.write("nickname", "frank", agent_id="agent-1"))
         self.assertFalse(memory.write("age", 30, agent_id="agent-1"))
 
+    def test_field_retention_is_parsed_when_the_schema_loads(self) -> None:
+        docs = _memory_docs(default_retention="2d")
+        docs[0]["memory"]["fields"][1]["retention"] = None
+        memory = MemoryController.from_documents(docs)
+        self.assertEqual(memory._retention_delta, {"nickname": timedelta(hours=1), "age": timedelta(days=2)})
+        before = datetime.now(timezone.utc)
+        self.assertTrue(memory.write("age", 30, agent_id="agent-1"))
+        expires_at = memory._data["agent-1"]["age"].expires_at
+        self.assertLessEqual(before + timedelta(days=2), expires_at)
+
+        docs[0]["memory"]["fields"][0]["retention"] = "soon"
+        with self.assertRaises(ValueError):
+            MemoryController.from_documents(docs)
+
     def test_purge_expired_removes_entries(self) -> None:
+        now = [datetime.now(timezone.utc)]
         memory = MemoryController.from_documents(
             [
                 {
@@ -82,23 +122,36 @@ class MemoryControllerTests(unittest.TestCase):
                         "fields": [{"name": "nickname", "type": "string", "tag": "internal", "retention": "1s"}],
                     },
                 }
-            ]
+            ],
+            clock=lambda: now[0],
         )
         self.assertTrue(memory.write("nickname", "frank", agent_id="agent-1"))
         self.assertEqual(memory.purge_expired(), 0)
 
-        # Force expiration by manipulating stored entry.
-        entry = memory._data["agent-1"]["nickname"]  # noqa: SLF001 - test-only assertion.
-        memory._data["agent-1"]["nickname"] = entry.__class__(
-            value=entry.value,
-            expires_at=entry.expires_at.replace(year=2000),
-            tag=entry.tag,
-            encrypted=entry.encrypted,
-        )
+        now[0] += timedelta(seconds=5)
         self.assertEqual(memory.purge_expired(), 1)
         result = memory.read("nickname", agent_id="agent-1")
         self.assertFalse(result.found)
 
+    def test_purge_expired_skips_rewritten_entries_and_compacts_its_heap(self) -> None:
+        now = [datetime.now(timezone.utc)]
+        memory = MemoryController.from_documents(_memory_docs(), clock=lambda: now[0])
+        self.assertTrue(memory.write("nickname", "frank", agent_id="agent-1"))
+        now[0] += timedelta(minutes=50)
+        self.assertTrue(memory.write("nickname", "frankie", agent_id="agent-1"))
+
+        # The first write's heap item expires, but the entry now carries the later expiry.
+        now[0] += timedelta(minutes=20)
+        self.assertEqual(memory.purge_expired(), 0)
+        self.assertEqual(memory.read("nickname", agent_id="agent-1").value, "frankie")
+        now[0] += timedelta(hours=1)
+        self.assertEqual(memory.purge_expired(), 1)
+        self.assertEqual(memory._data, {})
+
+        for index in range(200):
+            self.assertTrue(memory.write("age", index, agent_id="agent-1"))
+        self.assertLessEqual(len(memory._expiry_heap), 64)
+
     def test_safeai_from_config_loads_memory_schema(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             work = Path(tmp_dir)
@@ -6,13 +6,13 @@ from __future__ import annotations
 
 import tempfile
 import unittest
-from datetime import timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from safeai import SafeAI
 from safeai.core.audit import AuditLogger
 from safeai.core.classifier import Classifier
-from safeai.core.memory import MemoryController
+from safeai.core.memory import MemoryController, MemoryValidationError
 from safeai.core.policy import PolicyEngine, normalize_rules
 
 
@@ -77,23 +77,39 @@ class MemorySecurityTests(unittest.TestCase):
         with self.assertRaises(PermissionError):
             memory.resolve_handle(str(handle), agent_id="agent-2")
 
+    def test_write_many_matches_individual_writes_and_encrypts_each_value(self) -> None:
+        now = [datetime.now(timezone.utc)]
+        memory = MemoryController.from_documents(_memory_docs(tag="internal", encrypted=True), clock=lambda: now[0])
+        results = memory.write_many(
+            [("secret_value", "a", "agent-1"), ("unknown", "b", "agent-1"), ("secret_value", "z", "agent-2")]
+        )
+        self.assertEqual([bool(result) for result in results], [True, False, True])
+        self.assertIn("not defined in memory schema", results[1].reason)
+        self.assertEqual(len(memory._handles), 2)
+        for agent_id, expected in (("agent-1", "a"), ("agent-2", "z")):
+            handle = memory.read("secret_value", agent_id=agent_id).value
+            self.assertEqual(memory.resolve_handle(handle, agent_id=agent_id), expected)
+            self.assertEqual(memory.handle_metadata(handle)["expires_at"], now[0] + timedelta(hours=1))
+
+        with self.assertRaises(MemoryValidationError):
+            memory.write_many([("secret_value", "c", "agent-3"), ("secret_value", 1, "agent-3")], strict=True)
+        self.assertTrue(memory.read("secret_value", agent_id="agent-3").found)
+
     def test_expired_encrypted_entries_are_removed_from_handle_store(self) -> None:
-        memory = MemoryController.from_documents(_memory_docs(tag="internal", encrypted=True, retention="1s"))
+        now = [datetime.now(timezone.utc)]
+        memory = MemoryController.from_documents(
+            _memory_docs(tag="internal", encrypted=True, retention="1s"), clock=lambda: now[0]
+        )
         self.assertTrue(memory.write("secret_value", "abc123", agent_id="agent-1"))
         result = memory.read("secret_value", agent_id="agent-1")
         handle = str(result.value)
 
-        entry = memory._data["agent-1"]["secret_value"]  # noqa: SLF001 - intentional test visibility.
-        memory._data["agent-1"]["secret_value"] = entry.__class__(
-            value=entry.value,
-            expires_at=entry.expires_at.replace(year=2000),
-            tag=entry.tag,
-            encrypted=entry.encrypted,
-        )
+        now[0] += timedelta(seconds=5)
         self.assertEqual(memory.purge_expired(), 1)
         self.assertIsNone(memory.handle_metadata(handle))
         with self.assertRaises(KeyError):
             memory.resolve_handle(handle, agent_id="agent-1")
+        self.assertEqual(memory._handles, {})
 
     def test_safeai_handle_resolution_is_policy_gated(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -110,22 +126,19 @@ class MemorySecurityTests(unittest.TestCase):
             self.assertIsNone(sdk.resolve_memory_handle(str(handle), agent_id="agent-1"))
 
     def test_memory_auto_purge_emits_audit_event(self) -> None:
+        now = [datetime.now(timezone.utc)]
         with tempfile.TemporaryDirectory() as tmp_dir:
             sdk = SafeAI(
                 policy_engine=_policy_engine(),
                 classifier=Classifier(),
                 audit_logger=AuditLogger(str(Path(tmp_dir) / "audit.log")),
-                memory_controller=MemoryController.from_documents(_memory_docs(tag="internal", encrypted=False)),
+                memory_controller=MemoryController.from_documents(
+                    _memory_docs(tag="internal", encrypted=False), clock=lambda: now[0]
+                ),
             )
             self.assertTrue(sdk.memory_write("secret_value", "kept", agent_id="agent-1"))
 
-            entry = sdk.memory._data["agent-1"]["secret_value"]  # noqa: SLF001 - test-only access.
-            sdk.memory._data["agent-1"]["secret_value"] = entry.__class__(
-                value=entry.value,
-                expires_at=entry.expires_at.replace(year=2000, tzinfo=timezone.utc),
-                tag=entry.tag,
-                encrypted=entry.encrypted,
-            )
+            now[0] += timedelta(hours=2)
             read_result = sdk.memory_read("secret_value", agent_id="agent-1")
             self.assertFalse(read_result.found)
             events = sdk.query_audit(boundary="memory", phase="retention_purge", limit=10)
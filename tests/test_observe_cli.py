@@ -4,11 +4,14 @@
 
 from __future__ import annotations
 
+import os
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 from click.testing import CliRunner
 
+from safeai.cli.context import SafeAICache
 from safeai.cli.observe import observe_group
 
 
@@ -31,6 +34,25 @@ class TestObserveAgentsCommand:
             assert result.exit_code == 0
             assert "agent-1" in result.output
             assert "agent-2" in result.output
+            assert result.output.index("agent-1") < result.output.index("agent-2")
+
+    def test_agents_top_limits_rows(self, runner: CliRunner) -> None:
+        events = [
+            {"agent_id": "agent-1", "timestamp": "2024-01-01T00:01:00+00:00"},
+            {"agent_id": "agent-2", "timestamp": "2024-01-01T00:02:00+00:00"},
+            {"agent_id": "agent-2", "timestamp": "2024-01-01T00:03:00+00:00"},
+        ]
+        with patch("safeai.cli.observe.SafeAI") as mock_cls:
+            mock_sdk = mock_cls.from_config.return_value
+            mock_sdk.query_audit.return_value = events
+            result = runner.invoke(observe_group, ["agents", "--config", "safeai.yaml", "--top", "1"])
+            assert result.exit_code == 0
+            assert "agent-2" in result.output
+            assert "agent-1" not in result.output
+
+            rejected = runner.invoke(observe_group, ["agents", "--config", "safeai.yaml", "--top", "-1"])
+            assert rejected.exit_code == 2
+            assert "Invalid value for '--top'" in rejected.output
 
     def test_agents_no_activity(self, runner: CliRunner) -> None:
         with patch("safeai.cli.observe.SafeAI") as mock_cls:
@@ -73,3 +95,21 @@ class TestObserveSessionsCommand:
             )
             assert result.exit_code == 0
             assert "No events found" in result.output
+
+
+class TestSafeAICache:
+    def test_reuses_sdk_until_config_changes(self, runner: CliRunner, tmp_path: Path) -> None:
+        config = tmp_path / "safeai.yaml"
+        config.write_text("version: v1alpha1\n", encoding="utf-8")
+        cache = SafeAICache()
+        with patch("safeai.cli.observe.SafeAI") as mock_cls:
+            mock_cls.from_config.return_value.query_audit.return_value = []
+            args = ["sessions", "--config", str(config), "--session", "sess-1"]
+            assert runner.invoke(observe_group, args, obj=cache).exit_code == 0
+            assert runner.invoke(observe_group, args, obj=cache).exit_code == 0
+            assert mock_cls.from_config.call_count == 1
+
+            stat = config.stat()
+            os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            assert runner.invoke(observe_group, args, obj=cache).exit_code == 0
+            assert mock_cls.from_config.call_count == 2
@@ -21,6 +21,35 @@ def _build_guard(rules: list[dict], audit_file: Path) -> OutputGuard:
 
 
 class OutputFallbackTests(unittest.TestCase):
+    def test_scan_is_skipped_only_for_unconditionally_allowed_agents(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            rules = [
+                {
+                    "name": "trusted-output",
+                    "boundary": "output",
+                    "priority": 1,
+                    "condition": {"agents": ["trusted"]},
+                    "action": "allow",
+                    "reason": "trusted agent",
+                },
+                {"name": "block-output", "boundary": "output", "priority": 2, "action": "block", "reason": "blocked"},
+            ]
+            engine = PolicyEngine(normalize_rules(rules))
+            audit = AuditLogger(str(Path(temp_dir) / "audit.log"))
+            guard = OutputGuard(
+                classifier=Classifier(), policy_engine=engine, audit_logger=audit, skip_scan_when_allowed=True
+            )
+            text = "Email alice@example.com"
+
+            trusted = guard.guard(text, agent_id="trusted")
+            self.assertEqual((trusted.safe_output, trusted.detections), (text, []))
+            self.assertEqual(trusted.decision.policy_name, "trusted-output")
+            self.assertEqual(guard.guard_many([text], agent_id="trusted")[0].detections, [])
+
+            other = guard.guard(text, agent_id="agent-1")
+            self.assertEqual(other.decision.action, "block")
+            self.assertEqual([item.tag for item in other.detections], ["personal.pii"])
+
     def test_block_without_fallback_returns_empty_output(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             guard = _build_guard(
@@ -107,6 +136,21 @@ class OutputFallbackTests(unittest.TestCase):
             self.assertIn("[REDACTED]", result.safe_output)
             self.assertFalse(result.fallback_used)
 
+    def test_overlapping_detections_are_redacted_as_one_region(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            engine = PolicyEngine(
+                normalize_rules([{"name": "redact-all", "boundary": "output", "action": "redact", "reason": "redact"}])
+            )
+            classifier = Classifier(
+                patterns=[("left", "custom.left", r"abc"), ("right", "custom.right", r"bcd"), ("tail", "custom.tail", r"z")]
+            )
+            guard = OutputGuard(
+                classifier=classifier, policy_engine=engine, audit_logger=AuditLogger(str(Path(temp_dir) / "audit.log"))
+            )
+
+            result = guard.guard("x abcd y z", agent_id="agent-1")
+            self.assertEqual(result.safe_output, "x [REDACTED] y [REDACTED]")
+
     def test_unknown_template_fields_are_preserved(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             guard = _build_guard(
@@ -147,6 +191,54 @@ class OutputFallbackTests(unittest.TestCase):
             self.assertEqual(result.safe_output, "bad {reason")
             self.assertTrue(result.fallback_used)
 
+    def test_escaped_braces_and_format_specs_render_like_str_format(self) -> None:
+        for template, expected in (
+            ("{{agent}} {agent_id} }}", "{agent} agent-1 }"),
+            ("[{action:>6}] {reason!r}", "[ block] 'blocked by policy'"),
+        ):
+            with self.subTest(template=template), tempfile.TemporaryDirectory() as temp_dir:
+                guard = _build_guard(
+                    [
+                        {
+                            "name": "block-all-output",
+                            "boundary": "output",
+                            "priority": 1,
+                            "action": "block",
+                            "reason": "blocked by policy",
+                            "fallback_template": template,
+                        }
+                    ],
+                    Path(temp_dir) / "audit.log",
+                )
+
+                self.assertEqual(guard.guard("plain text", agent_id="agent-1").safe_output, expected)
+
+    def test_guard_many_matches_individual_guards(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            guard = _build_guard(
+                [
+                    {
+                        "name": "redact-pii",
+                        "boundary": "output",
+                        "priority": 1,
+                        "condition": {"data_tags": ["personal"]},
+                        "action": "redact",
+                        "reason": "pii",
+                    },
+                    {"name": "allow-rest", "boundary": "output", "priority": 2, "action": "allow", "reason": "ok"},
+                ],
+                Path(temp_dir) / "audit.log",
+            )
+            outputs = ["mail alice@example.com", "nothing here", "bob@example.org"]
+
+            batched = guard.guard_many(outputs, agent_id="agent-1")
+
+            self.assertEqual(
+                [result.safe_output for result in batched],
+                [guard.guard(output, agent_id="agent-1").safe_output for output in outputs],
+            )
+            self.assertEqual([result.decision.action for result in batched], ["redact", "allow", "redact"])
+
 
 if __name__ == "__main__":
     unittest.main()
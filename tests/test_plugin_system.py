@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import re
 import tempfile
 import unittest
 from pathlib import Path
@@ -12,6 +13,8 @@ from click.testing import CliRunner
 
 from safeai import SafeAI
 from safeai.cli.init import init_command
+from safeai.core.classifier import Classifier
+from safeai.plugins.manager import load_plugin
 
 PLUGIN_SOURCE = """
 from safeai.middleware.base import BaseMiddleware
@@ -85,6 +88,21 @@ class PluginSystemTests(unittest.TestCase):
             self.assertIn("policies", payload)
             self.assertEqual(payload["policies"][0]["action"], "redact")
 
+    def test_precompiled_detector_patterns_are_shared(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            work = Path(tmp_dir)
+            sdk = self._build_sdk(work)
+            plugin = load_plugin(work / "plugins" / "example.py")
+            (pattern,) = [row[2] for row in plugin.detectors if row[0] == "ticket_id"]
+            self.assertIsInstance(pattern, re.Pattern)
+
+            first = Classifier(patterns=list(plugin.detectors))
+            second = Classifier(patterns=list(plugin.detectors))
+            self.assertIs(first._compiled[0][2], second._compiled[0][2])
+
+            scan = sdk.scan_input("please review tkt-12345", agent_id="default-agent")
+            self.assertIn("internal.ticket", {item.tag for item in scan.detections})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -7,6 +7,7 @@ from __future__ import annotations
 import os
 import tempfile
 import unittest
+from dataclasses import replace
 from pathlib import Path
 
 from safeai.core.policy import PolicyContext, PolicyEngine, PolicyRule, normalize_rules
@@ -100,6 +101,76 @@ class PolicyEngineEvaluationTests(unittest.TestCase):
         self.assertEqual(blocked.action, "block")
         self.assertIsNone(blocked.policy_name)
 
+    def test_repeat_evaluations_are_memoized_until_rules_change(self) -> None:
+        rule = {"name": "allow-output", "boundary": "output", "action": "allow", "reason": "ok"}
+        engine = PolicyEngine(normalize_rules([rule]))
+        context = PolicyContext(boundary="output", data_tags=["personal.pii"], agent_id="agent-1")
+
+        first = engine.evaluate(context)
+        self.assertIs(engine.evaluate(PolicyContext(boundary="output", data_tags=["personal.pii"], agent_id="agent-1")), first)
+        self.assertEqual(engine.evaluate(PolicyContext(boundary="input", data_tags=[], agent_id="agent-1")).action, "block")
+
+        engine.load(normalize_rules([{**rule, "action": "block", "reason": "closed"}]))
+        self.assertEqual(engine.evaluate(context).reason, "closed")
+
+    def test_rules_are_compiled_per_boundary_with_tenant_and_singular_conditions(self) -> None:
+        engine = PolicyEngine(
+            [
+                PolicyRule(
+                    name="tenant-a-mail",
+                    boundary=["action", "output"],
+                    action="require_approval",
+                    reason="tenant a mail",
+                    condition={"tool": "mail.send", "agent": "agent-1", "data_tags": ["PERSONAL"]},
+                    priority=1,
+                    tenant_id="tenant-a",
+                    allowed_providers=["local"],
+                ),
+                PolicyRule(name="allow-action", boundary=["action"], action="allow", reason="ok", condition={}),
+            ]
+        )
+        context = PolicyContext(
+            boundary="action", data_tags=["personal.pii"], agent_id="agent-1", tool_name="mail.send", tenant_id="tenant-a"
+        )
+        decision = engine.evaluate(context)
+        self.assertEqual((decision.policy_name, decision.routing_constraint), ("tenant-a-mail", ["local"]))
+        self.assertFalse(hasattr(decision, "__dict__") or hasattr(context, "__dict__"))
+        self.assertEqual(engine.evaluate(replace(context, tenant_id="default")).action, "allow")
+        self.assertEqual(engine.evaluate(replace(context, boundary="output")).action, "require_approval")
+        other_tool = replace(context, boundary="output", tool_name="mail.read")
+        self.assertEqual((engine.evaluate(other_tool).action, engine.evaluate(other_tool).reason), ("block", "default deny"))
+
+    def test_unconditional_allow_requires_a_tag_free_first_match(self) -> None:
+        engine = PolicyEngine(
+            normalize_rules(
+                [
+                    {
+                        "name": "trusted-agent",
+                        "boundary": "output",
+                        "priority": 1,
+                        "condition": {"agents": ["trusted"]},
+                        "action": "allow",
+                        "reason": "trusted",
+                    },
+                    {
+                        "name": "redact-pii",
+                        "boundary": "output",
+                        "priority": 10,
+                        "condition": {"data_tags": ["personal"]},
+                        "action": "redact",
+                        "reason": "pii",
+                    },
+                    {"name": "allow-output", "boundary": "output", "priority": 100, "action": "allow", "reason": "ok"},
+                ]
+            )
+        )
+        self.assertTrue(engine.is_unconditional_allow("output", "trusted"))
+        self.assertFalse(engine.is_unconditional_allow("output", "agent-1"))
+        self.assertFalse(engine.is_unconditional_allow("input", "trusted"))
+
+        engine.load(normalize_rules([{"name": "block-output", "boundary": "output", "action": "block", "reason": "no"}]))
+        self.assertFalse(engine.is_unconditional_allow("output", "trusted"))
+
 
 class PolicyEngineReloadTests(unittest.TestCase):
     def test_reload_and_reload_if_changed_return_false_without_registration(self) -> None:
@@ -4,10 +4,21 @@
 
 from __future__ import annotations
 
+import re
+import sys
 import unittest
+from dataclasses import FrozenInstanceError
+from unittest.mock import patch
 
-from safeai.core.classifier import Classifier
-from safeai.core.policy import PolicyContext, PolicyEngine, expand_tag_hierarchy, normalize_rules
+from safeai.core import classifier as classifier_module
+from safeai.core.classifier import Classifier, Detection
+from safeai.core.policy import (
+    PolicyContext,
+    PolicyEngine,
+    expand_tag,
+    expand_tag_hierarchy,
+    normalize_rules,
+)
 
 
 class TagHierarchyTests(unittest.TestCase):
@@ -15,6 +26,17 @@ class TagHierarchyTests(unittest.TestCase):
         tags = expand_tag_hierarchy(["personal.pii", "secret.token"])
         self.assertEqual(tags, {"personal", "personal.pii", "secret", "secret.token"})
 
+    def test_expand_tag_is_cached_and_normalized(self) -> None:
+        self.assertIs(expand_tag(" Personal..PII "), expand_tag(" Personal..PII "))
+        self.assertEqual(expand_tag(" Personal..PII "), frozenset({"personal", "personal.pii"}))
+        self.assertEqual(expand_tag("  "), frozenset())
+
+    def test_detector_and_expanded_tags_are_interned(self) -> None:
+        tag = "".join(["custom.", "digits"])
+        detection = Classifier(patterns=[("digits", tag, r"\d+")]).classify_text("42")[0]
+        self.assertIs(detection.tag, sys.intern("custom.digits"))
+        self.assertTrue(all(part is sys.intern(part) for part in expand_tag("Custom.Digits.Extra")))
+
     def test_parent_policy_tag_matches_child_detection_tag(self) -> None:
         classifier = Classifier()
         detections = classifier.classify_text("Contact me at alice@example.com")
@@ -40,6 +62,131 @@ class TagHierarchyTests(unittest.TestCase):
         self.assertEqual(decision.action, "redact")
         self.assertEqual(decision.policy_name, "redact-personal-output")
 
+    def test_default_classifier_is_shared(self) -> None:
+        classifier = Classifier.default()
+        self.assertIs(Classifier.default(), classifier)
+        self.assertEqual([item.tag for item in classifier.classify_text("mail alice@example.com")], ["personal.pii"])
+
+    def test_tag_only_classification_matches_detection_tags(self) -> None:
+        classifier = Classifier.default()
+        for text in ("", "plain words", "mail alice@example.com, ssn 123-45-6789 and 555-123-4567"):
+            with self.subTest(text=text):
+                self.assertEqual(classifier.classify_tags(text), {item.tag for item in classifier.classify_text(text)})
+
+    def test_tag_only_classification_merges_only_detectors_safe_to_combine(self) -> None:
+        classifier = Classifier(
+            patterns=[
+                ("doubled", "custom.repeat", r"(\w)\1"),
+                ("word", "custom.repeat", r"(\w)-x"),
+                ("named", "custom.named", r"(?P<n>ab)c"),
+                ("named-again", "custom.named", r"(?P<n>xy)z"),
+                ("exact", "custom.case", re.compile(r"Key")),
+                ("loose", "custom.case", r"zz"),
+                ("digits", "custom.case", r"\d{4}"),
+            ]
+        )
+        merged = [pattern for tag, pattern, _ in classifier._tag_searches if tag == "custom.case"]
+        self.assertEqual(len(merged), 2)
+        for text in ("ab-x", "aa", "abc", "xyz", "key", "Key", "ZZ 1234", "b-y"):
+            with self.subTest(text=text):
+                self.assertEqual(classifier.classify_tags(text), {item.tag for item in classifier.classify_text(text)})
+
+    def test_re2_prefilter_is_used_when_the_set_compiles(self) -> None:
+        added: list[str] = []
+
+        class _FakeSet:
+            fail_compile = False
+
+            def __init__(self) -> None:
+                self.patterns: list[re.Pattern[str]] = []
+
+            @classmethod
+            def SearchSet(cls, options: object) -> _FakeSet:  # noqa: N802 - mirrors google-re2.
+                return cls()
+
+            def Add(self, pattern: str) -> int:  # noqa: N802
+                added.append(pattern)
+                self.patterns.append(re.compile(pattern, re.IGNORECASE))
+                return len(self.patterns) - 1
+
+            def Compile(self) -> None:  # noqa: N802 - returns None on success, like google-re2.
+                if self.fail_compile:
+                    raise fake_re2.error("out of memory")
+
+            def Match(self, text: str) -> list[int] | None:  # noqa: N802 - None when nothing matches.
+                return [index for index, pattern in enumerate(self.patterns) if pattern.search(text)] or None
+
+        fake_re2 = type(
+            "re2", (), {"Options": type("Options", (), {}), "Set": _FakeSet, "error": type("error", (Exception,), {})}
+        )
+        patterns = [
+            ("digits", "custom.digits", r"\d{3}"),
+            ("quote", "custom.quote", r"i\u2019ll"),
+            ("unpinned", "custom.pip", r"pip\s+install\s+(?!pypi)"),
+        ]
+        with patch.object(classifier_module, "re2", None):
+            plain = Classifier(patterns=patterns)
+        with patch.object(classifier_module, "re2", fake_re2):
+            classifier = Classifier(patterns=patterns)
+            # Patterns RE2 cannot parse never reach Add, so google-re2 has nothing to log.
+            self.assertEqual(added, [r"\d{3}"])
+            self.assertIsNotNone(classifier._prefilter)
+            for text in ("no numbers", "i\u2019ll 123", "pip install x", "pip install pypi"):
+                with self.subTest(text=text):
+                    self.assertEqual(classifier.classify_text(text), plain.classify_text(text))
+                    self.assertEqual(classifier.classify_tags(text), plain.classify_tags(text))
+
+            _FakeSet.fail_compile = True
+            self.assertIsNone(Classifier(patterns=patterns)._prefilter)
+
+    def test_detector_tags_are_validated_when_the_classifier_is_built(self) -> None:
+        with self.assertRaises(ValueError):
+            Classifier(patterns=[("bad", "Not A Tag", r"x")])
+
+        detections = Classifier(patterns=[("digits", "custom.digits", r"\d+")]).classify_text("a 12 b 345")
+        self.assertEqual([(item.start, item.end, item.value) for item in detections], [(2, 4, "12"), (7, 10, "345")])
+        self.assertEqual(detections[0], Detection(detector="digits", tag="custom.digits", start=2, end=4, value="12"))
+        with self.assertRaises(FrozenInstanceError):
+            detections[0].start = 0  # type: ignore[misc]
+
+    def test_detections_from_several_detectors_are_ordered_by_span(self) -> None:
+        classifier = Classifier(
+            patterns=[("words", "custom.words", r"[a-z]+"), ("digits", "custom.digits", r"\d+"), ("all", "custom.all", r"\w+")]
+        )
+        detections = classifier.classify_text("ab 12")
+        self.assertEqual(
+            [(item.start, item.end, item.detector) for item in detections],
+            [(0, 2, "words"), (0, 2, "all"), (3, 5, "digits"), (3, 5, "all")],
+        )
+
+    def test_batched_classification_matches_per_text_results(self) -> None:
+        classifier = Classifier(
+            patterns=[
+                *Classifier()._compiled,
+                ("phone", "personal.phone", r"\d{3}\s*\d{4}"),
+                ("leading", "custom.leading", r"^\w+"),
+            ]
+        )
+        texts = ["call 555", "1234 or alice@example.com", "", "word 555 1234", "ssn 123-45-6789"]
+
+        self.assertEqual(classifier.classify_texts(texts), [classifier.classify_text(text) for text in texts])
+
+    def test_first_character_prefilter_only_skips_texts_that_cannot_match(self) -> None:
+        classifier = Classifier(
+            patterns=[
+                ("ssn", "personal.pii", r"\b\d{3}-\d{2}-\d{4}\b"),
+                ("ticket", "custom.ticket", r"(?:#|no\.\s*)?\d{5}"),
+            ]
+        )
+        self.assertEqual(classifier.classify_text("nothing to see here"), [])
+        self.assertEqual(
+            [item.detector for item in classifier.classify_text("ssn ٣٣٣-٣٣-٣٣٣٣ and No. 12345")],
+            ["ssn", "ticket"],
+        )
+        # A detector that can match the empty string disables the whole-text shortcut.
+        optional = Classifier(patterns=[("maybe", "custom.maybe", r"\d*")])
+        self.assertEqual(len(optional.classify_text("ab")), 3)
+
     def test_child_policy_tag_does_not_match_parent_only_context(self) -> None:
         engine = PolicyEngine(
             normalize_rules(
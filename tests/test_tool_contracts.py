@@ -10,7 +10,12 @@ from pathlib import Path
 
 from safeai import SafeAI
 from safeai.config.loader import ContractSchemaValidationError, load_contract_documents
-from safeai.core.contracts import ToolContractRegistry, normalize_contracts
+from safeai.core.contracts import (
+    ToolContract,
+    ToolContractRegistry,
+    ToolSideEffects,
+    normalize_contracts,
+)
 
 
 class ToolContractTests(unittest.TestCase):
@@ -40,6 +45,12 @@ class ToolContractTests(unittest.TestCase):
         self.assertFalse(result.allowed)
         self.assertEqual(result.unauthorized_tags, ["secret.token"])
 
+        repeated = registry.validate_request(
+            tool_name="send_email", data_tags=["secret.token", " Secret.Token ", "internal", "", "personal.pii"]
+        )
+        self.assertEqual(repeated.unauthorized_tags, ["personal.pii", "secret.token"])
+        self.assertIn("does not accept data tags: personal.pii,secret.token", repeated.reason)
+
     def test_registry_accepts_hierarchical_parent_tags(self) -> None:
         registry = ToolContractRegistry(
             normalize_contracts(
@@ -60,6 +71,46 @@ class ToolContractTests(unittest.TestCase):
         self.assertTrue(result.allowed)
         self.assertEqual(result.unauthorized_tags, [])
 
+    def test_directly_built_contracts_hold_lowercase_accepted_tags(self) -> None:
+        contract = ToolContract(
+            tool_name="lookup",
+            description=None,
+            accepts_tags={"Personal"},
+            accepts_fields=set(),
+            emits_tags=set(),
+            emits_fields=set(),
+            stores_fields=set(),
+            stores_retention=None,
+            side_effects=ToolSideEffects(reversible=True, requires_approval=False),
+        )
+        self.assertEqual(contract.accepts_tags, {"personal"})
+        result = ToolContractRegistry([contract]).validate_request(tool_name="lookup", data_tags=["PERSONAL.PII"])
+        self.assertTrue(result.allowed)
+
+    def test_contracts_are_hashable_with_frozen_field_sets(self) -> None:
+        document = {
+            "version": "v1alpha1",
+            "contract": {
+                "tool_name": "send_email",
+                "accepts": {"tags": ["internal"], "fields": ["to", "body"]},
+                "emits": {"tags": ["internal"], "fields": ["status"]},
+                "side_effects": {"reversible": False, "requires_approval": True},
+            },
+        }
+        contract = normalize_contracts([document])[0]
+        self.assertIsInstance(contract.accepts_fields, frozenset)
+        self.assertIsInstance(contract.emits_tags, frozenset)
+        self.assertFalse(hasattr(contract, "__dict__"))
+        self.assertEqual(hash(contract), hash(normalize_contracts([document])[0]))
+
+        self.assertTrue(contract.accepts_tag("internal.finance"))
+        self.assertFalse(contract.accepts_tag("personal"))
+        self.assertEqual(contract._accepted_tags, {"internal.finance": True, "personal": False})
+        self.assertTrue(contract.emits_tag("internal"))
+        self.assertFalse(contract.emits_tag("personal.pii"))
+        self.assertEqual(contract._emitted_tags, {"internal": True, "personal.pii": False})
+        self.assertEqual(contract, normalize_contracts([document])[0])
+
     def test_contract_schema_validation_rejects_invalid_contract(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             root = Path(tmp_dir)